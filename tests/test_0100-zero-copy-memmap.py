@@ -0,0 +1,69 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+import numpy
+import pytest
+import skhep_testdata
+
+import uproot4
+import uproot4.source.file
+
+
+def test_views(tmpdir):
+    filename = os.path.join(str(tmpdir), "tmp.raw")
+    with open(filename, "wb") as tmp:
+        tmp.write(b"******    ...+++++++!!!!!@@@@@")
+
+    source = uproot4.source.file.MemmapSource(
+        filename, num_fallback_workers=1, zero_copy=True
+    )
+    with source:
+        notifications = queue.Queue()
+        chunks = source.chunks([(0, 6), (6, 10), (25, 30)], notifications)
+        for chunk in chunks:
+            assert numpy.shares_memory(chunk.raw_data, source.file)
+            assert not chunk.raw_data.flags.writeable
+
+        single = source.chunk(10, 13)
+        assert numpy.shares_memory(single.raw_data, source.file)
+
+    assert source.closed
+    assert source.num_bytes == 30
+
+    # the map outlives the source as long as a chunk refers to it
+    assert [x.raw_data.tobytes() for x in chunks] == [b"******", b"    ", b"@@@@@"]
+    assert single.raw_data.tobytes() == b"..."
+
+
+def test_copies(tmpdir):
+    filename = os.path.join(str(tmpdir), "tmp.raw")
+    with open(filename, "wb") as tmp:
+        tmp.write(b"******    ...+++++++!!!!!@@@@@")
+
+    source = uproot4.source.file.MemmapSource(filename, num_fallback_workers=1)
+    with source:
+        chunk = source.chunk(0, 6)
+        assert not numpy.shares_memory(chunk.raw_data, source.file)
+    assert source.closed
+
+
+@pytest.mark.parametrize(
+    "filename", ["uproot-Zmumu-uncompressed.root", "uproot-Zmumu-zlib.root"]
+)
+def test_arrays(filename):
+    path = skhep_testdata.data_path(filename)
+    with uproot4.open(path)["events"] as events:
+        expected = events.arrays(["px1", "Type"], library="np")
+    with uproot4.open(path, zero_copy=True)["events"] as events:
+        assert events.file.source.zero_copy
+        got = events.arrays(["px1", "Type"], library="np")
+    assert got["px1"].tolist() == expected["px1"].tolist()
+    assert got["Type"].tolist() == expected["Type"].tolist()
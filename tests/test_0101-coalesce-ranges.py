@@ -0,0 +1,139 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+import pytest
+import skhep_testdata
+
+import uproot4
+import uproot4.source.coalesce
+import uproot4.source.file
+
+
+def test_coalesce_ranges():
+    ranges = [(20, 25), (0, 5), (7, 10), (10, 12), (40, 50), (8, 9)]
+    assert uproot4.source.coalesce.coalesce_ranges(ranges, 2) == [
+        (0, 12, [(1, 0, 5), (2, 7, 10), (5, 8, 9), (3, 10, 12)]),
+        (20, 25, [(0, 20, 25)]),
+        (40, 50, [(4, 40, 50)]),
+    ]
+    assert uproot4.source.coalesce.coalesce_ranges(ranges, 0) == [
+        (0, 5, [(1, 0, 5)]),
+        (7, 12, [(2, 7, 10), (5, 8, 9), (3, 10, 12)]),
+        (20, 25, [(0, 20, 25)]),
+        (40, 50, [(4, 40, 50)]),
+    ]
+    assert uproot4.source.coalesce.coalesce_ranges(ranges, 100, max_size=25) == [
+        (0, 25, [(1, 0, 5), (2, 7, 10), (5, 8, 9), (3, 10, 12), (0, 20, 25)]),
+        (40, 50, [(4, 40, 50)]),
+    ]
+
+
+@pytest.mark.parametrize(
+    "source_class",
+    [uproot4.source.file.MemmapSource, uproot4.source.file.MultithreadedFileSource],
+)
+def test_chunks(tmpdir, source_class):
+    filename = os.path.join(str(tmpdir), "tmp.raw")
+    with open(filename, "wb") as tmp:
+        tmp.write(b"******    ...+++++++!!!!!@@@@@")
+
+    ranges = [(25, 30), (0, 6), (10, 13), (6, 10), (13, 20)]
+    expected = [b"@@@@@", b"******", b"...", b"    ", b"+++++++"]
+
+    source = source_class(
+        filename, num_workers=2, num_fallback_workers=1, coalesce_gap=5
+    )
+    with source:
+        notifications = queue.Queue()
+        chunks = source.chunks(ranges, notifications)
+        assert [(x.start, x.stop) for x in chunks] == ranges
+        assert [x.raw_data.tobytes() for x in chunks] == expected
+
+        notified = [notifications.get() for x in ranges]
+        assert notifications.empty()
+        assert sorted((x.start, x.stop) for x in notified) == sorted(ranges)
+
+        assert source.num_requested_chunks == 1
+        assert source.num_requested_bytes == 30
+        assert source.num_overread_bytes == 5
+
+
+def test_no_coalescing(tmpdir):
+    filename = os.path.join(str(tmpdir), "tmp.raw")
+    with open(filename, "wb") as tmp:
+        tmp.write(b"******    ...+++++++!!!!!@@@@@")
+
+    with uproot4.source.file.MemmapSource(filename, num_fallback_workers=1) as source:
+        assert source.coalesce_gap is None
+        source.chunks([(0, 6), (10, 13)], queue.Queue())
+        assert source.num_requested_chunks == 2
+        assert source.num_overread_bytes == 0
+
+
+@pytest.mark.parametrize("file_handler", ["memmap", "multithreaded"])
+def test_arrays(file_handler):
+    path = skhep_testdata.data_path("uproot-Zmumu-zlib.root")
+    if file_handler == "memmap":
+        handler = uproot4.source.file.MemmapSource
+    else:
+        handler = uproot4.source.file.MultithreadedFileSource
+
+    with uproot4.open(path, file_handler=handler)["events"] as events:
+        expected = events.arrays(["Type", "Event", "Q1"], library="np")
+    with uproot4.open(path, file_handler=handler, coalesce_gap="1 kB")[
+        "events"
+    ] as events:
+        assert events.file.source.coalesce_gap == 1000
+        got = events.arrays(["Type", "Event", "Q1"], library="np")
+        assert events.file.source.num_overread_bytes == 121
+    for key in ["Type", "Event", "Q1"]:
+        assert got[key].tolist() == expected[key].tolist()
+
+
+def test_duplicates_larger_than_max_size():
+    ranges = [(0, 30), (40, 50), (0, 30)]
+    assert uproot4.source.coalesce.coalesce_ranges(ranges, 100, max_size=20) == [
+        (0, 30, [(0, 0, 30), (2, 0, 30)]),
+        (40, 50, [(1, 40, 50)]),
+    ]
+
+    data = b"".join(bytes(bytearray([i])) for i in range(50))
+
+    class Filled(object):
+        def __init__(self, start, stop):
+            self.start = start
+            self.stop = stop
+            self.raw_data = data[start:stop]
+
+    notifications = queue.Queue()
+    request = uproot4.source.coalesce.CoalescedRequest(
+        None, ranges, notifications, 100, max_size=20
+    )
+    merged = [Filled(start, stop) for start, stop in request.ranges]
+    for chunk in merged:
+        request.put(chunk)
+    chunks = request.split(merged)
+    assert [(x.start, x.stop) for x in chunks] == ranges
+    assert [x.future.result() for x in chunks] == [data[0:30], data[40:50], data[0:30]]
+    assert notifications.qsize() == 3
+
+
+class MinimalSource(uproot4.source.chunk.Source):
+    # a third-party Source that doesn't know about coalescing
+    def __init__(self, file_path):
+        self._file_path = file_path
+
+
+def test_source_defaults():
+    source = MinimalSource("whatever")
+    assert source.coalesce_gap is None
+    assert source.num_overread_bytes == 0
+    assert source._coalesce([(0, 10)], None) == ([(0, 10)], None, None)
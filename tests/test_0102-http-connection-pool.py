@@ -0,0 +1,219 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import re
+import threading
+import time
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+
+import pytest
+import skhep_testdata
+
+import uproot4
+import uproot4.source.http
+
+
+class RangeServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, data):
+        HTTPServer.__init__(self, ("127.0.0.1", 0), RangeHandler)
+        self.data = data
+        self.num_connections = 0
+        self.keep_alive = True
+        self.silently_close = False
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        self.server.num_connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, status, body, extra):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in extra:
+            self.send_header(k, v)
+        if not self.server.keep_alive:
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        elif self.server.silently_close:
+            # claims keep-alive, but closes the connection anyway
+            self.close_connection = True
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.send_body(200, self.server.data, [])
+
+    def do_GET(self):
+        data = self.server.data
+        m = re.match(r"bytes=([0-9]+)-([0-9]+)", self.headers.get("Range", ""))
+        if m is None:
+            self.send_body(200, data, [])
+        else:
+            # only the first range: no multipart support
+            start, last = int(m.group(1)), int(m.group(2))
+            self.send_body(
+                206,
+                data[start : last + 1],
+                [
+                    (
+                        "Content-Range",
+                        "bytes {0}-{1}/{2}".format(start, last, len(data)),
+                    )
+                ],
+            )
+
+
+@pytest.fixture
+def server():
+    with open(skhep_testdata.data_path("uproot-Zmumu.root"), "rb") as file:
+        data = file.read()
+    server = RangeServer(data)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,))
+    thread.daemon = True
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def url(server):
+    return "http://127.0.0.1:{0}/uproot-Zmumu.root".format(server.server_address[1])
+
+
+def test_reuse(server):
+    source = uproot4.source.http.MultithreadedHTTPSource(
+        url(server), num_workers=1, timeout=10, http_idle_timeout=None
+    )
+    with source:
+        assert source.num_bytes == len(server.data)
+        for start in range(0, 1000, 100):
+            chunk = source.chunk(start, start + 100)
+            assert chunk.raw_data.tobytes() == server.data[start : start + 100]
+        chunks = source.chunks([(0, 10), (20, 30), (50, 60)], queue.Queue())
+        assert [x.raw_data.tobytes() for x in chunks] == [
+            server.data[0:10],
+            server.data[20:30],
+            server.data[50:60],
+        ]
+
+    pool = source.connection_pool
+    assert pool.num_reused > 0
+    assert pool.num_connections <= 3
+    assert server.num_connections == pool.num_connections
+    pool.close()
+    assert pool.num_idle == 0
+
+
+def test_shared(server):
+    one = uproot4.source.http.MultithreadedHTTPSource(
+        url(server), num_workers=1, timeout=10
+    )
+    two = uproot4.source.http.HTTPSource(
+        url(server), num_fallback_workers=1, timeout=10
+    )
+    assert one.connection_pool is two.connection_pool
+    one.close()
+    two.close()
+
+
+def test_idle_timeout(server):
+    pool = uproot4.source.http.ConnectionPool(
+        uproot4.source.http.urlparse(url(server)), 10, 10, 0.01
+    )
+    for i in range(3):
+        uproot4.source.http.get_num_bytes(
+            url(server), uproot4.source.http.urlparse(url(server)), 10, pool
+        )
+        time.sleep(0.05)
+    assert pool.num_connections == 3
+    assert pool.num_reused == 0
+    pool.close()
+
+
+def test_closed_by_server(server):
+    server.keep_alive = False
+    parsed_url = uproot4.source.http.urlparse(url(server))
+    pool = uproot4.source.http.ConnectionPool(parsed_url, 10, 10, None)
+    for i in range(3):
+        assert uproot4.source.http.get_num_bytes(
+            url(server), parsed_url, 10, pool
+        ) == len(server.data)
+    assert pool.num_reused == 0
+    assert pool.num_idle == 0
+
+
+class TrustingPool(uproot4.source.http.ConnectionPool):
+    # as if the server closed the connection just after the health check
+    def _is_healthy(self, connection, released):
+        return True
+
+
+def test_retry_closed_by_server(server):
+    server.silently_close = True
+    parsed_url = uproot4.source.http.urlparse(url(server))
+    pool = TrustingPool(parsed_url, 10, 10, None)
+    for i in range(3):
+        assert uproot4.source.http.get_num_bytes(
+            url(server), parsed_url, 10, pool
+        ) == len(server.data)
+
+    request = pool.request("GET", parsed_url.path, headers={"Range": "bytes=100-199"})
+    assert (
+        uproot4.source.http.HTTPResource(url(server), 10).get(request, 100, 200)
+        == server.data[100:200]
+    )
+
+    assert pool.num_reused == 3
+    assert pool.num_connections == 4
+    pool.close()
+
+
+def test_max_size(server):
+    parsed_url = uproot4.source.http.urlparse(url(server))
+    pool = uproot4.source.http.ConnectionPool(parsed_url, 10, 1, None)
+    connections = [pool.acquire() for i in range(3)]
+    for connection in connections:
+        connection.request("HEAD", parsed_url.path)
+        response = connection.getresponse()
+        response.read()
+        pool.release(connection, response)
+    assert pool.num_idle == 1
+    pool.close()
+
+
+def test_arrays(server):
+    with uproot4.open(skhep_testdata.data_path("uproot-Zmumu.root"))[
+        "events"
+    ] as events:
+        expected = events.arrays(["px1", "Type"], library="np")
+    with uproot4.open(url(server))["events"] as events:
+        got = events.arrays(["px1", "Type"], library="np")
+        steps = list(events.iterate(["px1"], step_size=500, library="np"))
+    assert got["px1"].tolist() == expected["px1"].tolist()
+    assert got["Type"].tolist() == expected["Type"].tolist()
+    assert len(steps) == 5
+    assert server.num_connections < 5
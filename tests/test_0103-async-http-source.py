@@ -0,0 +1,228 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import re
+import threading
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+
+import pytest
+import skhep_testdata
+
+import uproot4
+
+pytestmark = pytest.mark.skipif(
+    uproot4._util.py2 or uproot4._util.py35, reason="requires Python 3.6 or later"
+)
+
+
+class RangeServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, data):
+        HTTPServer.__init__(self, ("127.0.0.1", 0), RangeHandler)
+        self.data = data
+        self.lock = threading.Lock()
+        self.num_connections = 0
+        self.num_active = 0
+        self.max_active = 0
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        with self.server.lock:
+            self.server.num_connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(self.server.data)))
+        self.end_headers()
+
+    def do_GET(self):
+        if not self.path.endswith("uproot-Zmumu.root"):
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        with self.server.lock:
+            self.server.num_active += 1
+            self.server.max_active = max(self.server.max_active, self.server.num_active)
+        try:
+            m = re.match(r"bytes=([0-9]+)-([0-9]+)", self.headers.get("Range", ""))
+            start, last = int(m.group(1)), int(m.group(2))
+            body = self.server.data[start : last + 1]
+            self.send_response(206)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header(
+                "Content-Range",
+                "bytes {0}-{1}/{2}".format(start, last, len(self.server.data)),
+            )
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with self.server.lock:
+                self.server.num_active -= 1
+
+
+@pytest.fixture
+def server():
+    with open(skhep_testdata.data_path("uproot-Zmumu.root"), "rb") as file:
+        data = file.read()
+    server = RangeServer(data)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,))
+    thread.daemon = True
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def loop():
+    import asyncio
+
+    loop = asyncio.new_event_loop()
+    try:
+        yield loop
+    finally:
+        loop.close()
+
+
+def url(server, name="uproot-Zmumu.root"):
+    return "http://127.0.0.1:{0}/{1}".format(server.server_address[1], name)
+
+
+def collect(loop, generator):
+    out = []
+    while True:
+        try:
+            out.append(loop.run_until_complete(generator.__anext__()))
+        except StopAsyncIteration:
+            return out
+
+
+def test_achunks(server, loop):
+    source = uproot4.AsyncHTTPSource(url(server), timeout=10, max_num_connections=8)
+    ranges = [(i * 100, i * 100 + 50) for i in range(200)]
+    chunks = loop.run_until_complete(source.achunks(ranges))
+    assert [(x.start, x.stop) for x in chunks] == ranges
+    assert [x.raw_data.tobytes() for x in chunks] == [
+        server.data[start:stop] for start, stop in ranges
+    ]
+
+    pool = source.connection_pool(loop)
+    assert 1 < pool.num_connections <= 8
+    assert pool.num_reused > 0
+    assert server.num_connections == pool.num_connections
+
+    loop.run_until_complete(source.aclose())
+    assert source.closed
+    assert pool.num_idle == 0
+
+
+def test_achunk_missing(server, loop):
+    source = uproot4.AsyncHTTPSource(url(server, "missing.root"), timeout=10)
+    with pytest.raises(Exception) as err:
+        loop.run_until_complete(source.achunk(0, 100))
+    assert "missing.root" in str(err.value)
+    loop.run_until_complete(source.aclose())
+
+
+def test_sync(server):
+    with uproot4.open(skhep_testdata.data_path("uproot-Zmumu.root"))[
+        "events"
+    ] as events:
+        expected = events.arrays(["px1", "Type"], library="np")
+
+    with uproot4.open(url(server), http_handler=uproot4.AsyncHTTPSource)[
+        "events"
+    ] as events:
+        assert isinstance(events.file.source, uproot4.AsyncHTTPSource)
+        got = events.arrays(["px1", "Type"], library="np")
+    assert events.file.source.closed
+
+    assert got["px1"].tolist() == expected["px1"].tolist()
+    assert got["Type"].tolist() == expected["Type"].tolist()
+
+
+def test_hasbranches_aiterate(server, loop):
+    with uproot4.open(skhep_testdata.data_path("uproot-Zmumu.root"))[
+        "events"
+    ] as events:
+        expected = list(events.iterate(["px1", "py1"], step_size=700, library="np"))
+
+    with uproot4.open(url(server), http_handler=uproot4.AsyncHTTPSource)[
+        "events"
+    ] as events:
+        got = collect(
+            loop, events.aiterate(["px1", "py1"], step_size=700, library="np")
+        )
+        loop.run_until_complete(events.file.source.aclose())
+
+    assert len(got) == len(expected) == 4
+    for g, e in zip(got, expected):
+        assert g["px1"].tolist() == e["px1"].tolist()
+        assert g["py1"].tolist() == e["py1"].tolist()
+
+
+def test_hasbranches_aiterate_cut(server, loop):
+    with uproot4.open(skhep_testdata.data_path("uproot-Zmumu.root"))[
+        "events"
+    ] as events:
+        expected = list(
+            events.iterate(["px1"], cut="px1 > 0", step_size=500, library="np")
+        )
+
+    with uproot4.open(url(server), http_handler=uproot4.AsyncHTTPSource)[
+        "events"
+    ] as events:
+        got = collect(
+            loop,
+            events.aiterate(["px1"], cut="px1 > 0", step_size=500, library="np"),
+        )
+        loop.run_until_complete(events.file.source.aclose())
+
+    assert len(got) == len(expected) == 5
+    for g, e in zip(got, expected):
+        assert g["px1"].tolist() == e["px1"].tolist()
+        assert (g["px1"] > 0).all()
+
+
+def test_aiterate(server, loop):
+    files = [url(server) + ":events", skhep_testdata.data_path("uproot-Zmumu.root")]
+    got = collect(
+        loop,
+        uproot4.aiterate(
+            files,
+            ["px1"],
+            step_size=1000,
+            library="np",
+            report=True,
+            http_handler=uproot4.AsyncHTTPSource,
+        ),
+    )
+    assert [(r.global_entry_start, r.global_entry_stop) for a, r in got] == [
+        (0, 1000),
+        (1000, 2000),
+        (2000, 2304),
+        (2304, 3304),
+        (3304, 4304),
+        (4304, 4608),
+    ]
+    assert got[0][0]["px1"].tolist() == got[3][0]["px1"].tolist()
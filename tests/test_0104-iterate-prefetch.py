@@ -0,0 +1,79 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import pytest
+import skhep_testdata
+
+import uproot4
+
+
+def tolist(array):
+    return [x.tolist() if hasattr(x, "tolist") else x for x in array]
+
+
+@pytest.mark.parametrize("prefetch_decompress", [False, True])
+@pytest.mark.parametrize("prefetch", [1, 3])
+@pytest.mark.parametrize("step_size", [3, 7])
+def test_same_arrays(prefetch_decompress, prefetch, step_size):
+    branches = ["n", "i4", "Ai8", "str"]
+    with uproot4.open(skhep_testdata.data_path("uproot-sample-6.20.04-zlib.root"))[
+        "sample"
+    ] as sample:
+        expected = list(sample.iterate(branches, step_size=step_size, library="np"))
+        got = list(
+            sample.iterate(
+                branches,
+                step_size=step_size,
+                library="np",
+                prefetch=prefetch,
+                prefetch_decompress=prefetch_decompress,
+            )
+        )
+    assert len(got) == len(expected)
+    for g, e in zip(got, expected):
+        for key in branches:
+            assert tolist(g[key]) == tolist(e[key])
+
+
+@pytest.mark.parametrize(
+    "prefetch,prefetch_memory,expected", [(0, None, 1), (2, None, 3), (2, 1, 1)]
+)
+def test_requests_ahead(prefetch, prefetch_memory, expected):
+    with uproot4.open(skhep_testdata.data_path("uproot-sample-6.20.04-zlib.root"))[
+        "sample"
+    ] as sample:
+        iterator = sample.iterate(
+            ["i4"],
+            step_size=6,
+            library="np",
+            prefetch=prefetch,
+            prefetch_memory=prefetch_memory,
+        )
+        before = sample.file.source.num_requests
+        first = next(iterator)
+        assert first["i4"].tolist() == list(range(-15, -9))
+        assert sample.file.source.num_requests - before == expected
+        assert len(list(iterator)) == 4
+
+
+def test_iterate_files():
+    files = [
+        skhep_testdata.data_path("uproot-sample-6.20.04-zlib.root") + ":sample",
+        skhep_testdata.data_path("uproot-sample-6.20.04-uncompressed.root") + ":sample",
+    ]
+    got = list(
+        uproot4.iterate(
+            files,
+            ["i4"],
+            step_size=10,
+            library="np",
+            prefetch=2,
+            prefetch_decompress=True,
+        )
+    )
+    assert [x["i4"].tolist() for x in got] == [
+        list(range(-15, -5)),
+        list(range(-5, 5)),
+        list(range(5, 15)),
+    ] * 2
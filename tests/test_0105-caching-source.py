@@ -0,0 +1,138 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+import pytest
+import skhep_testdata
+
+import uproot4
+import uproot4.source.caching
+
+
+def test_block_cache(tmpdir):
+    cache = uproot4.source.caching.BlockCache(str(tmpdir), 250)
+    cache.put("abc", 0, 100, b"x" * 100)
+    cache.put("abc", 200, 300, b"y" * 100)
+    assert cache.blocks("abc") == [(0, 100), (200, 300)]
+    assert cache.get("abc", 0, 100) == b"x" * 100
+    assert cache.get("abc", 100, 200) is None
+    assert cache.get("def", 0, 100) is None
+
+    # (0, 100) was used more recently than (200, 300)
+    os.utime(os.path.join(str(tmpdir), "abc", "200-300"), (0, 0))
+    cache.put("def", 0, 100, b"z" * 100)
+    assert cache.blocks("abc") == [(0, 100)]
+    assert cache.blocks("def") == [(0, 100)]
+
+    cache.clear()
+    assert cache.blocks("abc") == cache.blocks("def") == []
+
+
+def test_caching_source(tmpdir):
+    path = skhep_testdata.data_path("uproot-Zmumu.root")
+    with open(path, "rb") as file:
+        data = file.read()
+    cache = uproot4.source.caching.BlockCache(str(tmpdir), 10000)
+    ranges = [(1000, 1100), (5000, 5050), (300, 400)]
+
+    with uproot4.source.caching.CachingSource(
+        uproot4.MultithreadedFileSource(path, num_workers=1), "uuid", cache
+    ) as source:
+        notifications = queue.Queue()
+        chunks = source.chunks(ranges, notifications)
+        assert [x.raw_data.tobytes() for x in chunks] == [
+            data[start:stop] for start, stop in ranges
+        ]
+        for i in range(3):
+            notifications.get(timeout=10)
+        assert source.num_hits == 0
+        assert source.num_misses == 3
+        assert source.source.num_requested_chunks == 3
+
+        chunks = source.chunks(ranges + [(1010, 1020)], queue.Queue())
+        assert [x.raw_data.tobytes() for x in chunks] == [
+            data[start:stop] for start, stop in ranges + [(1010, 1020)]
+        ]
+        assert source.num_hits == 4
+        assert source.source.num_requested_chunks == 3
+
+        assert source.chunk(1050, 1200).raw_data.tobytes() == data[1050:1200]
+        assert source.num_misses == 4
+        assert source.chunk(1050, 1200).raw_data.tobytes() == data[1050:1200]
+        assert source.num_hits == 5
+        assert source.source.num_requested_chunks == 4
+
+    assert source.closed
+
+
+def test_open(tmpdir):
+    path = skhep_testdata.data_path("uproot-Zmumu.root")
+    with uproot4.open(path)["events"] as events:
+        expected = events.arrays(["px1", "Type"], library="np")
+
+    for i in range(2):
+        with open(path, "rb") as file:
+            with uproot4.open(file, block_cache_dir=str(tmpdir))["events"] as events:
+                source = events.file.source
+                assert isinstance(source, uproot4.CachingSource)
+                assert source.uuid == events.file.hex_uuid
+                got = events.arrays(["px1", "Type"], library="np")
+                assert got["px1"].tolist() == expected["px1"].tolist()
+                assert got["Type"].tolist() == expected["Type"].tolist()
+                if i == 0:
+                    assert source.num_hits == 0
+                else:
+                    # only the file header, which contains the UUID
+                    assert source.num_misses == 0
+                    assert source.source.num_requested_chunks == 1
+
+    with uproot4.open(path, block_cache_dir=str(tmpdir))["events"] as events:
+        assert isinstance(events.file.source, uproot4.MemmapSource)
+
+
+class FailingBlockCache(uproot4.source.caching.BlockCache):
+    def put(self, uuid, start, stop, data):
+        raise OSError("No space left on device")
+
+
+def test_failing_cache(tmpdir):
+    path = skhep_testdata.data_path("uproot-Zmumu.root")
+    with open(path, "rb") as file:
+        data = file.read()
+    cache = FailingBlockCache(str(tmpdir), 10000)
+    ranges = [(1000, 1100), (5000, 5050)]
+
+    with uproot4.source.caching.CachingSource(
+        uproot4.MultithreadedFileSource(path, num_workers=1), "uuid", cache
+    ) as source:
+        notifications = queue.Queue()
+        chunks = source.chunks(ranges, notifications)
+        for i in range(2):
+            notifications.get(timeout=10)
+        assert [x.raw_data.tobytes() for x in chunks] == [
+            data[start:stop] for start, stop in ranges
+        ]
+        assert source.chunk(300, 400).raw_data.tobytes() == data[300:400]
+        assert cache.blocks("uuid") == []
+
+
+def test_chunk_does_not_wait(tmpdir):
+    path = skhep_testdata.data_path("uproot-Zmumu.root")
+    with open(path, "rb") as file:
+        data = file.read()
+    cache = uproot4.source.caching.BlockCache(str(tmpdir), 10000)
+
+    with uproot4.source.caching.CachingSource(
+        uproot4.MultithreadedFileSource(path, num_workers=1), "uuid", cache
+    ) as source:
+        chunk = source.chunk(300, 400)
+        assert cache.blocks("uuid") == []
+        assert chunk.raw_data.tobytes() == data[300:400]
+        assert cache.blocks("uuid") == [(300, 400)]
@@ -0,0 +1,124 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import struct
+import zlib
+
+import numpy
+import pytest
+import skhep_testdata
+
+import uproot4
+import uproot4.compression
+import uproot4.source.chunk
+import uproot4.source.cursor
+import uproot4.source.futures
+
+
+def zlib_blocks(data, block_size):
+    out = []
+    for start in range(0, len(data), block_size):
+        block = data[start : start + block_size]
+        compressed = zlib.compress(block)
+        c, u = len(compressed), len(block)
+        out.append(
+            b"ZL"
+            + struct.pack(
+                "BBBBBBB",
+                8,
+                c & 0xFF,
+                (c >> 8) & 0xFF,
+                c >> 16,
+                u & 0xFF,
+                (u >> 8) & 0xFF,
+                u >> 16,
+            )
+        )
+        out.append(compressed)
+    return b"".join(out)
+
+
+def decompress(compressed, uncompressed_bytes, executor):
+    with uproot4.open(skhep_testdata.data_path("uproot-Zmumu.root")) as f:
+        chunk = uproot4.source.chunk.Chunk.wrap(
+            f.file.source, numpy.frombuffer(compressed, numpy.uint8)
+        )
+        return uproot4.compression.decompress(
+            chunk,
+            uproot4.source.cursor.Cursor(0),
+            {},
+            len(compressed),
+            uncompressed_bytes,
+            executor=executor,
+        )
+
+
+@pytest.mark.parametrize(
+    "executor",
+    [
+        None,
+        uproot4.source.futures.TrivialExecutor(),
+        uproot4.source.futures.ThreadPoolExecutor(3),
+    ],
+)
+def test_multiple_blocks(executor):
+    data = numpy.arange(100000, dtype=">i4").tobytes()
+    compressed = zlib_blocks(data, 30000)
+    result = decompress(compressed, len(data), executor)
+    assert result.raw_data.tobytes() == data
+
+
+def test_waiting_on_worker():
+    # the only worker waits for blocks that were submitted to itself
+    executor = uproot4.source.futures.ThreadPoolExecutor(1)
+    data = numpy.arange(100000, dtype=">i4").tobytes()
+    compressed = zlib_blocks(data, 30000)
+    future = executor.submit(decompress, compressed, len(data), executor)
+    assert future.result(timeout=10).raw_data.tobytes() == data
+    executor.shutdown()
+
+
+def test_bad_block():
+    data = numpy.arange(100000, dtype=">i4").tobytes()
+    compressed = zlib_blocks(data, 30000)
+    executor = uproot4.source.futures.ThreadPoolExecutor(3)
+    with pytest.raises(ValueError):
+        decompress(compressed, len(data) - 1, executor)
+    executor.shutdown()
+
+
+class CountingProcessPoolExecutor(uproot4.source.futures.ProcessPoolExecutor):
+    num_submitted = 0
+
+    def submit(self, task, *args):
+        self.num_submitted += 1
+        return uproot4.source.futures.ProcessPoolExecutor.submit(self, task, *args)
+
+
+@pytest.mark.skipif(uproot4._util.py2, reason="requires concurrent.futures")
+def test_process_executor():
+    # block tasks write into a shared output, so they stay in this process
+    data = numpy.arange(100000, dtype=">i4").tobytes()
+    compressed = zlib_blocks(data, 30000)
+    executor = CountingProcessPoolExecutor(1)
+    try:
+        result = decompress(compressed, len(data), executor)
+        assert result.raw_data.tobytes() == data
+        assert executor.num_submitted == 0
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.skipif(uproot4._util.py2, reason="requires concurrent.futures")
+def test_concurrent_futures_executor():
+    import concurrent.futures
+
+    data = numpy.arange(100000, dtype=">i4").tobytes()
+    compressed = zlib_blocks(data, 30000)
+    executor = concurrent.futures.ThreadPoolExecutor(2)
+    try:
+        result = decompress(compressed, len(data), executor)
+        assert result.raw_data.tobytes() == data
+    finally:
+        executor.shutdown()
@@ -0,0 +1,66 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import pytest
+import skhep_testdata
+
+import uproot4
+
+
+def test_shared_across_entry_ranges_and_libraries():
+    with uproot4.open(
+        skhep_testdata.data_path("uproot-Zmumu.root"),
+        array_cache=None,
+        basket_cache="10 MB",
+    ) as f:
+        assert isinstance(f.file.basket_cache, uproot4.LRUArrayCache)
+        branch = f["events/px1"]
+        source = f.file.source
+
+        expected = branch.array(library="np")
+        assert len(f.file.basket_cache) == branch.num_baskets
+        assert f.file.basket_cache.current == sum(
+            branch.basket(i).nbytes for i in range(branch.num_baskets)
+        )
+        num_requests = source.num_requests
+
+        assert branch.array(
+            library="np", entry_start=100, entry_stop=2000
+        ).tolist() == expected[100:2000].tolist()
+
+        interpretation = uproot4.interpretation.numerical.AsDtype(">f8", "<f4")
+        assert branch.array(
+            interpretation, library="np"
+        ).tolist() == pytest.approx(expected.tolist())
+        assert source.num_requests == num_requests
+
+
+def test_iterate():
+    path = skhep_testdata.data_path("uproot-HZZ.root")
+    with uproot4.open(path, basket_cache={}) as f:
+        tree = f["events"]
+        expected = tree.arrays(["Muon_Px", "MET_px"], library="np")
+        num_requests = tree.file.source.num_requests
+
+        for prefetch in [0, 1]:
+            start = 0
+            for arrays in tree.iterate(
+                ["Muon_Px", "MET_px"], step_size=500, library="np", prefetch=prefetch
+            ):
+                stop = start + len(arrays["MET_px"])
+                assert (
+                    arrays["MET_px"].tolist() == expected["MET_px"][start:stop].tolist()
+                )
+                assert [x.tolist() for x in arrays["Muon_Px"]] == [
+                    x.tolist() for x in expected["Muon_Px"][start:stop]
+                ]
+                start = stop
+            assert start == tree.num_entries
+
+        assert tree.file.source.num_requests == num_requests
+
+
+def test_bad_basket_cache():
+    with pytest.raises(TypeError):
+        uproot4.open(skhep_testdata.data_path("uproot-Zmumu.root"), basket_cache=1.5)
@@ -0,0 +1,88 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import sys
+
+import numpy
+import pytest
+import skhep_testdata
+
+import uproot4
+import uproot4.source.futures
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (3, 7), reason="requires concurrent.futures with mp_context"
+)
+
+
+@pytest.fixture(scope="module")
+def executor():
+    executor = uproot4.ProcessPoolExecutor(2)
+    try:
+        yield executor
+    finally:
+        executor.shutdown()
+
+
+def test_numerical_and_objects(executor):
+    path = skhep_testdata.data_path("uproot-HZZ-objects.root")
+    branches = ["jetbtag", "MET", "num_primaryvertex"]
+    with uproot4.open(path)["events"] as events:
+        expected = events.arrays(branches, library="np", array_cache=None)
+        got = events.arrays(
+            branches, library="np", array_cache=None, decompression_executor=executor
+        )
+
+    assert got["num_primaryvertex"].tolist() == expected["num_primaryvertex"].tolist()
+    assert [x.tolist() for x in got["jetbtag"]] == [
+        x.tolist() for x in expected["jetbtag"]
+    ]
+    assert [(x.member("fX"), x.member("fY")) for x in got["MET"]] == [
+        (x.member("fX"), x.member("fY")) for x in expected["MET"]
+    ]
+
+
+def test_other_interpretation(executor):
+    path = skhep_testdata.data_path("uproot-Zmumu.root")
+    interpretation = uproot4.interpretation.numerical.AsDtype(">f8", "<f4")
+    with uproot4.open(path)["events/px1"] as branch:
+        expected = branch.array(interpretation, library="np", array_cache=None)
+        got = branch.array(
+            interpretation,
+            library="np",
+            array_cache=None,
+            decompression_executor=executor,
+        )
+    assert got.dtype == numpy.dtype("<f4")
+    assert got.tolist() == expected.tolist()
+
+
+def test_prefetch_decompress(executor):
+    path = skhep_testdata.data_path("uproot-Zmumu.root")
+    with uproot4.open(path)["events"] as events:
+        with pytest.raises(ValueError):
+            for arrays in events.iterate(
+                ["px1"],
+                step_size=500,
+                library="np",
+                prefetch=1,
+                prefetch_decompress=True,
+                decompression_executor=executor,
+            ):
+                pass
+
+
+def test_file_object(executor):
+    path = skhep_testdata.data_path("uproot-Zmumu.root")
+    with open(path, "rb") as file:
+        with uproot4.open(file)["events"] as events:
+            expected = events.arrays(["px1"], library="np", array_cache=None)
+            got = events.arrays(
+                ["px1"],
+                library="np",
+                array_cache=None,
+                decompression_executor=executor,
+                interpretation_executor=executor,
+            )
+    assert got["px1"].tolist() == expected["px1"].tolist()
@@ -0,0 +1,81 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import struct
+
+import numpy
+import pytest
+
+import uproot4
+import uproot4.interpretation.library
+import uproot4.interpretation.strings
+
+
+def encode(strings, length_bytes):
+    out = []
+    for x in strings:
+        if length_bytes == "4" or len(x) >= 255:
+            header = struct.pack(">I", len(x))
+            if length_bytes == "1-5":
+                header = b"\xff" + header
+        else:
+            header = struct.pack("B", len(x))
+        out.append(header + x)
+    return out
+
+
+@pytest.mark.parametrize("length_bytes", ["1-5", "4"])
+def test_without_offsets(length_bytes):
+    strings = [b"", b"one", b"x" * 254, b"y" * 255, b"", b"z" * 1000, b"two", b""]
+    parts = encode(strings, length_bytes)
+    data = numpy.frombuffer(b"".join(parts), numpy.uint8)
+    byte_offsets = numpy.cumsum([0] + [len(x) for x in parts]).astype(numpy.int32)
+
+    interpretation = uproot4.interpretation.strings.AsStrings(0, length_bytes)
+    library = uproot4.interpretation.library._regularize_library("np")
+
+    without = interpretation.basket_array(data, None, None, None, {}, 0, library)
+    with_offsets = interpretation.basket_array(
+        data, byte_offsets, None, None, {}, 0, library
+    )
+
+    expected = numpy.cumsum([0] + [len(x) for x in strings]).tolist()
+    assert without.offsets.tolist() == with_offsets.offsets.tolist() == expected
+    assert without.content == with_offsets.content == b"".join(strings)
+
+
+def test_empty():
+    interpretation = uproot4.interpretation.strings.AsStrings(0, "1-5")
+    library = uproot4.interpretation.library._regularize_library("np")
+    out = interpretation.basket_array(
+        numpy.zeros(0, numpy.uint8), None, None, None, {}, 0, library
+    )
+    assert out.offsets.tolist() == [0]
+    assert out.content == b""
+
+
+@pytest.mark.parametrize("block", [1, 7, 64, 1024, 100000])
+@pytest.mark.parametrize("content", [(97, 123), (0, 256)])
+def test_speculative_length_headers(block, content):
+    random = numpy.random.RandomState(12345)
+    lengths = random.randint(0, 8, 3000)
+    lengths[::297] = 255
+    lengths[::997] = 700
+    strings = [
+        random.randint(content[0], content[1], n).astype(numpy.uint8).tobytes()
+        for n in lengths
+    ]
+    data = numpy.frombuffer(b"".join(encode(strings, "1-5")), numpy.uint8)
+
+    expected = uproot4.interpretation.strings._walk_length_headers(data, "1-5")
+    headers = uproot4.interpretation.strings._speculative_length_headers(data, block)
+    assert headers.tolist() == [
+        x - (5 if n >= 255 else 1) for x, n in zip(expected[0].tolist(), lengths)
+    ]
+
+    starts, stops = uproot4.interpretation.strings._walk_length_headers(
+        data, "1-5", len(strings)
+    )
+    assert starts.tolist() == expected[0].tolist()
+    assert stops.tolist() == expected[1].tolist()
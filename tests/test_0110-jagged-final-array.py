@@ -0,0 +1,80 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import pickle
+
+import numpy
+import pytest
+import skhep_testdata
+
+import uproot4
+import uproot4.interpretation.jagged
+
+
+def test_copy_ranges():
+    data = numpy.arange(100, dtype=numpy.uint8)
+    starts = numpy.array([0, 5, 5, 20, 21, 60])
+    stops = numpy.array([3, 5, 20, 21, 40, 100])
+    out = numpy.empty(numpy.sum(stops - starts), numpy.uint8)
+    uproot4.interpretation.jagged._copy_ranges(data, starts, stops, out)
+    assert out.tolist() == numpy.concatenate(
+        [data[start:stop] for start, stop in zip(starts, stops)]
+    ).tolist()
+
+
+@pytest.mark.parametrize("to_dtype", [None, ">f4", "<f8"])
+def test_entry_ranges(to_dtype):
+    path = skhep_testdata.data_path("uproot-HZZ-objects.root")
+    interpretation = uproot4.interpretation.jagged.AsJagged(
+        uproot4.interpretation.numerical.AsDtype(">f4", to_dtype), header_bytes=10
+    )
+    with uproot4.open(path, array_cache=None)["events/jetbtag"] as branch:
+        expected = []
+        for basket_num in range(branch.num_baskets):
+            basket = branch.basket(basket_num)
+            starts, stops = basket.byte_offsets[:-1] + 10, basket.byte_offsets[1:]
+            for start, stop in zip(starts, stops):
+                expected.append(basket.data[start:stop].view(">f4").tolist())
+
+        offsets = branch.entry_offsets
+        for entry_start, entry_stop in [
+            (0, branch.num_entries),
+            (1, offsets[1] - 1),
+            (offsets[1] - 3, offsets[1] + 5),
+            (offsets[1], offsets[2]),
+        ]:
+            got = branch.array(
+                interpretation,
+                entry_start=entry_start,
+                entry_stop=entry_stop,
+                library="np",
+            )
+            assert [x.tolist() for x in got] == expected[entry_start:entry_stop]
+
+
+def test_basket_array():
+    path = skhep_testdata.data_path("uproot-HZZ-objects.root")
+    with uproot4.open(path)["events/jetbtag"] as branch:
+        basket = branch.basket(0)
+        array = branch.interpretation.basket_array(
+            basket.data,
+            basket.byte_offsets,
+            basket,
+            branch,
+            branch.context,
+            basket.member("fKeylen"),
+            uproot4.interpretation.library._regularize_library("np"),
+        )
+        assert isinstance(array, uproot4.interpretation.jagged.HeaderedJaggedArray)
+        starts, stops = basket.byte_offsets[:-1] + 10, basket.byte_offsets[1:]
+        expected = [
+            basket.data[start:stop].view(">f4").tolist()
+            for start, stop in zip(starts, stops)
+        ]
+        assert [x.tolist() for x in array] == expected
+        assert array.content.tolist() == sum(expected, [])
+
+        unpickled = pickle.loads(pickle.dumps(array))
+        assert type(unpickled) is uproot4.interpretation.jagged.JaggedArray
+        assert unpickled.content.tolist() == array.content.tolist()
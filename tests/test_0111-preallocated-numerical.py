@@ -0,0 +1,84 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import numpy
+import pytest
+import skhep_testdata
+
+import uproot4
+
+
+def test_preallocate_and_fill():
+    interpretation = uproot4.interpretation.numerical.AsDtype(">i4")
+    library = uproot4.interpretation.library._regularize_library("np")
+    entry_offsets = [0, 3, 7, 10]
+    basket_arrays = {
+        0: numpy.array([0, 1, 2], ">i4"),
+        1: numpy.array([3, 4, 5, 6], ">i4"),
+        2: numpy.array([7, 8, 9], ">i4"),
+    }
+
+    output = interpretation.preallocate(2, 8, entry_offsets, library)
+    assert len(output) == 6
+    assert output.dtype == numpy.dtype("=i4")
+    for basket_num in [2, 0, 1]:
+        filled = interpretation.fill(
+            output, basket_num, basket_arrays[basket_num], 2, 8, entry_offsets
+        )
+        assert filled.tolist() == [
+            x for x in basket_arrays[basket_num].tolist() if 2 <= x < 8
+        ]
+
+    final = interpretation.final_array(
+        basket_arrays, 2, 8, entry_offsets, library, None, preallocated=output
+    )
+    assert final.tolist() == [2, 3, 4, 5, 6, 7]
+    assert interpretation.final_array(
+        basket_arrays, 2, 8, entry_offsets, library, None
+    ).tolist() == [2, 3, 4, 5, 6, 7]
+
+
+@pytest.mark.parametrize(
+    "interpretation_executor",
+    [None, uproot4.source.futures.ThreadPoolExecutor(2)],
+)
+def test_entry_ranges(interpretation_executor):
+    path = skhep_testdata.data_path("uproot-sample-6.20.04-uncompressed.root")
+    with uproot4.open(path, array_cache=None)["sample"] as sample:
+        expected = dict(
+            (name, sample[name].array(library="np")) for name in ["n", "ab", "af8"]
+        )
+        for entry_start, entry_stop in [(0, 30), (1, 6), (5, 23), (28, 30)]:
+            got = sample.arrays(
+                ["n", "ab", "af8"],
+                entry_start=entry_start,
+                entry_stop=entry_stop,
+                library="np",
+                interpretation_executor=interpretation_executor,
+            )
+            for name in ["n", "ab", "af8"]:
+                assert got[name].dtype.isnative
+                assert got[name].shape[1:] == expected[name].shape[1:]
+                assert (
+                    got[name].tolist()
+                    == expected[name][entry_start:entry_stop].tolist()
+                )
+
+
+def test_iterate():
+    path = skhep_testdata.data_path("uproot-sample-6.20.04-uncompressed.root")
+    with uproot4.open(path, array_cache=None)["sample"] as sample:
+        expected = sample.arrays(["n", "ab"], library="np")
+        num_requests = sample.file.source.num_requests
+        start = 0
+        for arrays in sample.iterate(["n", "ab"], step_size=4, library="np"):
+            stop = start + len(arrays["n"])
+            assert arrays["n"].tolist() == expected["n"][start:stop].tolist()
+            assert arrays["ab"].tolist() == expected["ab"][start:stop].tolist()
+            start = stop
+        assert start == sample.num_entries
+
+        # TBaskets that straddle a step boundary are still only read once
+        num_baskets = sample["n"].num_baskets + sample["ab"].num_baskets
+        assert sample.file.source.num_requests - num_requests <= num_baskets
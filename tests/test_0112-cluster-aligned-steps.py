@@ -0,0 +1,60 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import pytest
+import skhep_testdata
+
+import uproot4
+
+
+def test_cluster():
+    path = skhep_testdata.data_path("uproot-sample-6.20.04-uncompressed.root")
+    with uproot4.open(path, array_cache=None)["sample"] as sample:
+        assert sample.common_entry_offsets(filter_name=["n", "Ab"]) == [0, 21, 30]
+        expected = sample.arrays(["n", "Ab"], library="np")
+        num_chunks = sample.file.source.num_requested_chunks
+
+        steps = []
+        for arrays, report in sample.iterate(
+            ["n", "Ab"], step_size="cluster", library="np", report=True
+        ):
+            steps.append((report.tree_entry_start, report.tree_entry_stop))
+            start, stop = steps[-1]
+            assert arrays["n"].tolist() == expected["n"][start:stop].tolist()
+            assert [x.tolist() for x in arrays["Ab"]] == [
+                x.tolist() for x in expected["Ab"][start:stop]
+            ]
+
+        assert steps == [(0, 21), (21, 30)]
+        num_baskets = sample["n"].num_baskets + sample["Ab"].num_baskets
+        assert sample.file.source.num_requested_chunks - num_chunks == num_baskets
+
+
+@pytest.mark.parametrize(
+    "step_size", ["1 B aligned", "10 kB aligned", "1 GB aligned"]
+)
+def test_aligned_memory_size(step_size):
+    path = skhep_testdata.data_path("uproot-sample-6.20.04-uncompressed.root")
+    with uproot4.open(path, array_cache=None)["sample"] as sample:
+        boundaries = sample.common_entry_offsets(filter_name=["n", "ab"])
+        expected = sample.arrays(["n", "ab"], library="np")
+
+        stop = 0
+        for arrays, report in sample.iterate(
+            ["n", "ab"], step_size=step_size, library="np", report=True
+        ):
+            assert report.tree_entry_start == stop
+            start, stop = report.tree_entry_start, report.tree_entry_stop
+            assert start in boundaries and stop in boundaries
+            assert arrays["ab"].tolist() == expected["ab"][start:stop].tolist()
+        assert stop == sample.num_entries
+
+
+def test_bad_step_size():
+    path = skhep_testdata.data_path("uproot-sample-6.20.04-uncompressed.root")
+    with uproot4.open(path)["sample"] as sample:
+        with pytest.raises(TypeError):
+            for arrays in sample.iterate("n", step_size="clusters"):
+                pass
+
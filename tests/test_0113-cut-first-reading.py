@@ -0,0 +1,64 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import pytest
+import skhep_testdata
+
+import uproot4
+
+
+@pytest.mark.parametrize(
+    "cut", ["i4 < -10", "(i4 < -10) | (i4 > 10)", "n == 3", "i4 > 100", "n >= 0"]
+)
+def test_arrays(cut):
+    path = skhep_testdata.data_path("uproot-sample-6.20.04-uncompressed.root")
+    with uproot4.open(path, array_cache=None)["sample"] as sample:
+        expressions = ["i4", "af8", "Ai8", "str"]
+        full = sample.arrays(expressions + ["n"], library="np")
+        mask = eval(cut, {"n": full["n"], "i4": full["i4"]})
+
+        got = sample.arrays(expressions, cut=cut, library="np")
+        for name in expressions:
+            assert [
+                getattr(x, "tolist", lambda: x)() for x in got[name]
+            ] == [getattr(x, "tolist", lambda: x)() for x in full[name][mask]]
+
+
+def num_chunks_read(**kwargs):
+    path = skhep_testdata.data_path("uproot-sample-6.20.04-uncompressed.root")
+    with uproot4.open(path, array_cache=None)["sample"] as sample:
+        num_chunks = sample.file.source.num_requested_chunks
+        sample.arrays(["Ai8", "af8"], library="np", **kwargs)
+        return sample.file.source.num_requested_chunks - num_chunks
+
+
+def test_skipped_baskets():
+    # only the first 5 entries pass the cut, so the other TBranches are read
+    # as though entry_stop=5, after reading all of the cut's TBranch
+    path = skhep_testdata.data_path("uproot-sample-6.20.04-uncompressed.root")
+    with uproot4.open(path)["sample"] as sample:
+        num_cut_baskets = sample["i4"].num_baskets
+
+    assert (
+        num_chunks_read(cut="i4 < -10")
+        == num_chunks_read(entry_stop=5) + num_cut_baskets
+    )
+    assert num_chunks_read(cut="i4 < -10") < num_chunks_read()
+
+
+def test_iterate():
+    path = skhep_testdata.data_path("uproot-sample-6.20.04-uncompressed.root")
+    with uproot4.open(path, array_cache=None)["sample"] as sample:
+        full = sample.arrays(["i4", "Ai8"], library="np")
+        cut = "(i4 < -12) | (i4 % 5 == 0)"
+        for arrays, report in sample.iterate(
+            ["i4", "Ai8"], cut=cut, step_size=8, library="np", report=True
+        ):
+            start, stop = report.tree_entry_start, report.tree_entry_stop
+            i4 = full["i4"][start:stop]
+            mask = (i4 < -12) | (i4 % 5 == 0)
+            assert arrays["i4"].tolist() == i4[mask].tolist()
+            assert [x.tolist() for x in arrays["Ai8"]] == [
+                x.tolist() for x in full["Ai8"][start:stop][mask]
+            ]
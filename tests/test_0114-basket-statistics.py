@@ -0,0 +1,100 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest
+import skhep_testdata
+
+import uproot4
+import uproot4.statistics
+
+
+@pytest.fixture
+def tree(tmpdir):
+    path = skhep_testdata.data_path("uproot-sample-6.20.04-uncompressed.root")
+    with uproot4.open(path, statistics_dir=str(tmpdir), array_cache=None) as f:
+        yield f["sample"]
+
+
+def test_compute(tree, tmpdir):
+    statistics = tree.compute_statistics()
+    assert os.path.exists(os.path.join(str(tmpdir), tree.file.hex_uuid + ".json"))
+    assert statistics.branches[tree["i4"].cache_key] == {
+        "entry_offsets": [0, 7, 14, 21, 28, 30],
+        "min": [-15, -8, -1, 6, 13],
+        "max": [-9, -2, 5, 12, 14],
+        "count": [7, 7, 7, 7, 2],
+    }
+    assert tree["str"].cache_key not in statistics.branches
+
+    loaded = uproot4.statistics.BasketStatistics.load(
+        str(tmpdir), tree.file.hex_uuid
+    )
+    assert loaded.branches == statistics.branches
+
+
+@pytest.mark.parametrize(
+    "cut,expected",
+    [
+        ("i4 < -10", [(0, 7)]),
+        ("-10 > i4", [(0, 7)]),
+        ("(i4 < -10) | (i4 >= 13)", [(0, 7), (28, 30)]),
+        ("(i4 < -10) & (n > 100)", []),
+        ("-14 < i4 < -12", [(0, 7)]),
+        ("x < 0", [(0, 21)]),
+        ("i4 + 1 < 0", None),
+        ("(i4 < -10) | (i4 + 1 > 0)", None),
+        ("(i4 < -10) & (i4 + 1 > 0)", [(0, 7)]),
+    ],
+)
+def test_entry_ranges(tree, cut, expected):
+    statistics = tree.compute_statistics()
+    assert statistics.entry_ranges(tree, cut, {"x": "i4"}, 0, 30) == expected
+
+
+def test_arrays_and_iterate(tree):
+    expressions = ["i4", "af8", "n"]
+    source = tree.file.source
+    num_requested_chunks = source.num_requested_chunks
+    expected = tree.arrays(expressions, cut="i4 < -10", library="np")
+    read_without_statistics = source.num_requested_chunks - num_requested_chunks
+
+    tree.compute_statistics()
+
+    num_requested_chunks = source.num_requested_chunks
+    got = tree.arrays(expressions, cut="i4 < -10", library="np")
+    read_with_statistics = source.num_requested_chunks - num_requested_chunks
+    assert read_with_statistics < read_without_statistics
+
+    num_requested_chunks = source.num_requested_chunks
+    tree.arrays(expressions, library="np", entry_stop=7)
+    assert read_with_statistics <= source.num_requested_chunks - num_requested_chunks
+
+    assert got["i4"].tolist() == expected["i4"].tolist() == [-15, -14, -13, -12, -11]
+    assert [x.tolist() for x in got["af8"]] == [x.tolist() for x in expected["af8"]]
+
+    none = tree.arrays(expressions, cut="i4 > 100", library="np")
+    assert none["i4"].tolist() == []
+
+    steps = [
+        arrays["i4"].tolist()
+        for arrays in tree.iterate(
+            ["i4", "n"], cut="(i4 < -10) | (i4 >= 13)", step_size=7, library="np"
+        )
+    ]
+    assert steps == [[-15, -14, -13, -12, -11], [13, 14]]
+
+
+def test_stale(tree):
+    statistics = tree.compute_statistics()
+    statistics.branches[tree["i4"].cache_key]["entry_offsets"] = [0, 30]
+    assert statistics.entry_ranges(tree, "i4 < -10", {}, 0, 30) is None
+
+
+def test_no_directory():
+    path = skhep_testdata.data_path("uproot-sample-6.20.04-uncompressed.root")
+    with uproot4.open(path) as f:
+        with pytest.raises(ValueError):
+            f["sample"].compute_statistics()
@@ -0,0 +1,80 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import numpy
+import pytest
+import skhep_testdata
+
+import uproot4
+import uproot4.language.python
+
+
+def test_cached_plans():
+    language = uproot4.language.python.PythonLanguage()
+    with uproot4.open(skhep_testdata.data_path("uproot-HZZ.root")) as f:
+        tree = f["events"]
+        expected = numpy.sqrt(
+            tree["MET_px"].array(library="np") ** 2
+            + tree["MET_py"].array(library="np") ** 2
+        )
+        steps = list(
+            tree.iterate(
+                ["pt", "pt * 2"],
+                cut="pt > 10",
+                aliases={"pt": "sqrt(MET_px**2 + MET_py**2)"},
+                step_size=500,
+                language=language,
+                library="np",
+            )
+        )
+
+    assert len(steps) == 5
+    assert len(language.plan_cache) == 1
+    got = numpy.concatenate([x["pt"] for x in steps])
+    assert got.tolist() == pytest.approx(expected[expected > 10].tolist())
+    assert numpy.concatenate([x["pt * 2"] for x in steps]).tolist() == pytest.approx(
+        (2 * got).tolist()
+    )
+
+
+def test_common_subexpressions():
+    calls = []
+
+    def counted_sqrt(x):
+        calls.append(len(x))
+        return numpy.sqrt(x)
+
+    functions = dict(uproot4.language.python.PythonLanguage.default_functions)
+    functions["sqrt"] = counted_sqrt
+    language = uproot4.language.python.PythonLanguage(functions=functions)
+
+    with uproot4.open(skhep_testdata.data_path("uproot-HZZ.root")) as f:
+        out = f["events"].arrays(
+            ["pt", "pt > 20", "sqrt(MET_px**2 + MET_py**2) + 1", "where(NJet, pt, 0)"],
+            aliases={"pt": "sqrt(MET_px**2 + MET_py**2)"},
+            language=language,
+            library="np",
+        )
+
+    assert len(calls) == 1
+    assert out["pt > 20"].tolist() == (out["pt"] > 20).tolist()
+    assert out["sqrt(MET_px**2 + MET_py**2) + 1"].tolist() == pytest.approx(
+        (out["pt"] + 1).tolist()
+    )
+
+
+def test_short_circuit_not_hoisted():
+    plan = uproot4.language.python._expressions_to_plan(
+        ("x and log(y)", "log(y) if x else y"),
+        set(["x", "y"]),
+        {},
+        uproot4.language.python.PythonLanguage.default_functions,
+        "get",
+        set(["x", "y"]),
+        "file",
+        "object",
+    )
+    scope = {"get": {"x": 0, "y": 0}.get, "function": {"log": None}}
+    exec(plan, scope)
+    assert scope["_plan"]() == (0, 0)
@@ -0,0 +1,89 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import numpy
+import pytest
+import skhep_testdata
+
+import uproot4
+
+pytest.importorskip("numexpr")
+
+import uproot4.language.numexpr  # noqa: E402
+
+
+def test_same_as_python():
+    language = uproot4.language.numexpr.NumExprLanguage()
+    expressions = [
+        "pt",
+        "pt > 20",
+        "sqrt(MET_px**2 + MET_py**2) + 1",
+        "where(NJet > 0, pt, 0)",
+        "(-3 < MET_px) & (MET_px < 3)",
+        "NJet // 2",
+        "NJet",
+        "Muon_Px",
+    ]
+    aliases = {"pt": "sqrt(MET_px**2 + MET_py**2)"}
+    with uproot4.open(skhep_testdata.data_path("uproot-HZZ.root")) as f:
+        tree = f["events"]
+        got = tree.arrays(
+            expressions + ["-3 < MET_px < 3"],
+            cut="pt > 10",
+            aliases=aliases,
+            language=language,
+            library="np",
+        )
+        expected = tree.arrays(
+            expressions, cut="pt > 10", aliases=aliases, library="np"
+        )
+
+    for expression in expressions:
+        if expression == "Muon_Px":
+            assert [x.tolist() for x in got[expression]] == [
+                x.tolist() for x in expected[expression]
+            ]
+        else:
+            assert got[expression].dtype == expected[expression].dtype
+            assert got[expression].tolist() == pytest.approx(
+                expected[expression].tolist()
+            )
+    assert (
+        got["-3 < MET_px < 3"].tolist()
+        == expected["(-3 < MET_px) & (MET_px < 3)"].tolist()
+    )
+
+
+def test_translation():
+    language = uproot4.language.numexpr.NumExprLanguage()
+    with uproot4.open(skhep_testdata.data_path("uproot-HZZ.root")) as f:
+        f["events"].arrays(
+            ["pt > 20", "NJet // 2", "NJet"],
+            aliases={"pt": "sqrt(MET_px**2 + MET_py**2)"},
+            language=language,
+            library="np",
+        )
+
+    (translations,) = [
+        v for k, v in language.plan_cache.items() if k[0] == "numexpr"
+    ]
+    assert translations == [
+        (
+            "((sqrt(((v0 ** 2) + (v1 ** 2))) > 20))",
+            [("MET_px", "v0"), ("MET_py", "v1")],
+        ),
+        None,
+        None,
+    ]
+
+
+def test_inputs():
+    assert uproot4.language.numexpr._numexpr_input(
+        numpy.arange(3, dtype=numpy.uint8)
+    ).dtype == numpy.dtype(numpy.int32)
+    assert uproot4.language.numexpr._numexpr_input(
+        numpy.arange(3, dtype=numpy.uint32)
+    ).dtype == numpy.dtype(numpy.int64)
+    assert uproot4.language.numexpr._numexpr_input(numpy.arange(3, dtype=">f8")) is None
+    assert uproot4.language.numexpr._numexpr_input(numpy.zeros((2, 2))) is None
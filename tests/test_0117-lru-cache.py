@@ -0,0 +1,75 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import threading
+
+import numpy
+import pytest
+
+import uproot4
+
+
+def test_order_and_statistics():
+    cache = uproot4.LRUCache(3)
+    for i in range(5):
+        cache[i] = i
+    assert cache.keys() == [2, 3, 4]
+    assert cache[2] == 2
+    assert cache.keys() == [3, 4, 2]
+    assert cache.get(0) is None
+    assert 3 in cache
+    assert cache.keys() == [3, 4, 2]
+
+    cache[3] = "three"
+    assert cache.items() == [(4, 4), (2, 2), (3, "three")]
+    assert cache.current == 3
+    del cache[4]
+    assert list(cache) == [2, 3]
+    assert len(cache) == 2
+
+    assert cache.num_hits == 1
+    assert cache.num_misses == 1
+    assert cache.num_evictions == 2
+
+
+def test_array_cache_bytes():
+    cache = uproot4.LRUArrayCache("1 kB")
+    cache["a"] = numpy.zeros(100)
+    cache["b"] = numpy.zeros(100)
+    assert cache.keys() == ["b"]
+    assert cache.current == 800
+    assert cache.num_evictions == 1
+    assert cache.num_evicted_bytes == 800
+
+
+def test_shards():
+    cache = uproot4.LRUCache(100, shards=4)
+    assert cache.shards == 4
+    for i in range(1000):
+        cache[i] = i
+    assert len(cache) == cache.current == 100
+    assert cache.num_evictions == 900
+    keys = cache.keys()
+    assert keys == sorted(keys)
+
+    with pytest.raises(ValueError):
+        uproot4.LRUCache(100, shards=0)
+
+
+def test_threads():
+    cache = uproot4.LRUCache(50, shards=8)
+
+    def work(thread):
+        for i in range(10000):
+            cache[thread, i % 200] = i
+            cache.get((thread, (i * 7) % 200))
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(cache) == cache.current <= 50
+    assert cache.num_hits + cache.num_misses == 80000
@@ -0,0 +1,69 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import numpy
+import pytest
+import skhep_testdata
+
+import uproot4
+
+
+def test_promotion():
+    cache = uproot4.TwoQueueArrayCache(1000)
+    cache["a"] = numpy.zeros(10)
+    cache["b"] = numpy.zeros(10)
+    assert cache.keys() == ["a", "b"]
+    assert cache["a"].tolist() == [0.0] * 10
+    assert cache.keys() == ["b", "a"]
+    assert "b" in cache
+    assert cache.num_hits == 1
+
+    del cache["a"]
+    del cache["b"]
+    assert len(cache) == 0
+    assert cache.current == 0
+    with pytest.raises(KeyError):
+        del cache["a"]
+
+
+def test_ghosts():
+    cache = uproot4.TwoQueueArrayCache(400)
+    cache["a"] = numpy.zeros(10)
+    for i in range(10):
+        cache[i] = numpy.zeros(10)
+    assert "a" not in cache
+    cache["a"] = numpy.zeros(10)
+    for i in range(10, 20):
+        cache[i] = numpy.zeros(10)
+    assert "a" in cache
+    assert cache.current <= 400
+
+
+def test_scan_resistance_against_lru():
+    def run(cache):
+        for step in range(20):
+            hot = ["hot{0}".format(i) for i in range(4)]
+            cold = ["cold{0}-{1}".format(step, i) for i in range(30)]
+            for key in hot + cold:
+                if cache.get(key) is None:
+                    cache[key] = numpy.zeros(10)
+        assert cache.current <= cache.limit
+        return cache.num_hits
+
+    assert run(uproot4.LRUArrayCache(1600)) == 0
+    assert run(uproot4.TwoQueueArrayCache(1600)) == 4 * 18
+
+
+def test_lazy():
+    awkward1 = pytest.importorskip("awkward1")
+    cache = uproot4.TwoQueueArrayCache("1 MB")
+    events = uproot4.lazy(
+        {skhep_testdata.data_path("uproot-Zmumu.root"): "events"}, array_cache=cache
+    )
+    expected = uproot4.open(skhep_testdata.data_path("uproot-Zmumu.root"))[
+        "events/px1"
+    ].array(library="np")
+    assert awkward1.to_list(events.px1) == expected.tolist()
+    assert awkward1.to_list(events.px1) == expected.tolist()
+    assert cache.num_hits > 0
@@ -0,0 +1,76 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import numpy
+import pytest
+import skhep_testdata
+
+import uproot4
+
+
+def test_numpy(tmpdir):
+    directory = os.path.join(str(tmpdir), "arrays")
+    path = skhep_testdata.data_path("uproot-Zmumu.root")
+
+    with uproot4.open(path) as f:
+        expected = f["events/px1"].array(
+            library="np", array_cache=uproot4.DiskArrayCache(directory, "10 MB")
+        )
+
+    cache = uproot4.DiskArrayCache(directory, "10 MB")
+    assert len(cache) == 1
+    with uproot4.open(path) as f:
+        branch = f["events/px1"]
+        num_requests = f.file.source.num_requests
+        got = branch.array(library="np", array_cache=cache)
+        assert f.file.source.num_requests == num_requests
+        assert cache.num_hits == 1
+        assert got.tolist() == expected.tolist()
+
+        # a copy-on-write memory map: changing it doesn't change the cache
+        got[0] = 999
+        assert branch.array(library="np", array_cache=cache)[0] == expected[0]
+
+        cache.remove_uuid(f.file.hex_uuid)
+        assert len(cache) == 0
+
+
+def test_not_stored(tmpdir):
+    cache = uproot4.DiskArrayCache(str(tmpdir), None)
+    cache["one"] = numpy.array([None, 1], dtype=object)
+    cache["two"] = "not an array"
+    assert "one" not in cache
+    assert "two" not in cache
+    assert cache.get("one") is None
+    assert cache.num_misses == 1
+    with pytest.raises(KeyError):
+        del cache["two"]
+
+
+def test_eviction(tmpdir):
+    cache = uproot4.DiskArrayCache(str(tmpdir), "10 kB")
+    for i in range(5):
+        cache["file:{0}".format(i)] = numpy.zeros(500)
+    assert cache.current <= 10000
+    assert cache.keys() == ["file:3", "file:4"]
+    assert cache["file:4"].tolist() == [0.0] * 500
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_awkward(tmpdir):
+    awkward1 = pytest.importorskip("awkward1")
+    path = skhep_testdata.data_path("uproot-HZZ.root")
+    with uproot4.open(path) as f:
+        expected = f["events/Muon_Px"].array(
+            library="ak", array_cache=uproot4.DiskArrayCache(str(tmpdir), None)
+        )
+
+    cache = uproot4.DiskArrayCache(str(tmpdir), None)
+    with uproot4.open(path) as f:
+        got = f["events/Muon_Px"].array(library="ak", array_cache=cache)
+        assert cache.num_hits == 1
+        assert awkward1.to_list(got) == awkward1.to_list(expected)
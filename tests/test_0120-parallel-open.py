@@ -0,0 +1,66 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import pytest
+import skhep_testdata
+
+import uproot4
+
+
+def test_same_order():
+    files = skhep_testdata.data_path("uproot-sample-6.20.04-uncompressed.root").replace(
+        "6.20.04", "*"
+    )
+    expected = uproot4.concatenate(
+        {files: "sample"}, ["i8", "f8"], library="np", num_open_workers=1
+    )
+    got = uproot4.concatenate(
+        {files: "sample"}, ["i8", "f8"], library="np", num_open_workers=4
+    )
+    assert got["i8"].tolist() == expected["i8"].tolist()
+    assert got["f8"].tolist() == expected["f8"].tolist()
+
+    reports = [
+        (report.file_path, report.global_entry_start)
+        for arrays, report in uproot4.iterate(
+            {files: "sample"}, "i8", report=True, library="np", num_open_workers=1
+        )
+    ]
+    assert reports == [
+        (report.file_path, report.global_entry_start)
+        for arrays, report in uproot4.iterate(
+            {files: "sample"}, "i8", report=True, library="np", num_open_workers=4
+        )
+    ]
+
+
+def test_stop_early():
+    files = skhep_testdata.data_path("uproot-sample-6.20.04-uncompressed.root").replace(
+        "6.20.04", "*"
+    )
+    for arrays in uproot4.iterate(
+        {files: "sample"}, "i8", library="np", num_open_workers=4
+    ):
+        break
+
+
+def test_errors_in_order():
+    files = [
+        skhep_testdata.data_path("uproot-HZZ.root") + ":events",
+        skhep_testdata.data_path("uproot-Zmumu.root") + ":nonexistent",
+    ]
+    steps = uproot4.iterate(files, "NJet", library="np", num_open_workers=4)
+    assert len(next(steps)["NJet"]) == 2421
+    with pytest.raises(uproot4.KeyInFileError):
+        next(steps)
+
+
+def test_lazy():
+    awkward1 = pytest.importorskip("awkward1")
+    files = skhep_testdata.data_path("uproot-sample-6.20.04-uncompressed.root").replace(
+        "6.20.04", "*"
+    )
+    expected = uproot4.concatenate({files: "sample"}, "i8", library="np")["i8"]
+    array = uproot4.lazy({files: "sample"}, num_open_workers=4)
+    assert awkward1.to_list(array["i8"]) == expected.tolist()
@@ -0,0 +1,77 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest
+import skhep_testdata
+
+import uproot4
+
+
+def test_reopen(tmpdir):
+    directory = os.path.join(str(tmpdir), "metadata")
+    path = skhep_testdata.data_path("uproot-small-evnt-tree-fullsplit.root")
+
+    with uproot4.open(path, metadata_dir=directory) as f:
+        expected = f["tree"].arrays(["I32", "StlVecI32", "Str"], library="np")
+        uuid = f.file.hex_uuid
+    assert os.listdir(directory) == [uuid]
+
+    with uproot4.open(path, metadata_dir=directory) as f:
+        num_requests = f.file.source.num_requests
+        tree = f["tree"]
+        # the TTree's own TKey was not read
+        assert f.file.source.num_requests == num_requests
+        assert tree.file is f.file
+        assert tree.num_entries == 100
+        got = tree.arrays(["I32", "StlVecI32", "Str"], library="np")
+
+    assert got["I32"].tolist() == expected["I32"].tolist()
+    assert [x.tolist() for x in got["StlVecI32"]] == [
+        x.tolist() for x in expected["StlVecI32"]
+    ]
+    assert got["Str"].tolist() == expected["Str"].tolist()
+
+
+def test_stale_entry(tmpdir):
+    path = skhep_testdata.data_path("uproot-Zmumu.root")
+    with uproot4.open(path, metadata_dir=str(tmpdir)) as f:
+        key = f.key("events")
+        f["events"]
+        index = uproot4.metadata.MetadataIndex(str(tmpdir))
+        with open(index.path(key), "wb") as file:
+            file.write(b"not a pickle")
+        assert index.load(key) is None
+
+    with uproot4.open(path, metadata_dir=str(tmpdir)) as f:
+        assert f["events/px1"].array(library="np")[:3].tolist() == pytest.approx(
+            [-41.1952876442, 35.1180497674, 35.1180497674]
+        )
+
+
+def test_lazy_branches(tmpdir):
+    path = skhep_testdata.data_path("uproot-HZZ.root")
+
+    with uproot4.open(path, metadata_dir=str(tmpdir)) as f:
+        tree = f["events"]
+        assert tree.member("fBranches").num_unread == 51
+        expected = tree.arrays(["NMuon", "Muon_Px"], library="np")
+        typenames = tree.typenames()
+        leaves = [x.member("fName") for x in tree.member("fLeaves")]
+
+    with uproot4.open(path, metadata_dir=str(tmpdir)) as f:
+        tree = f["events"]
+        branches = tree.member("fBranches")
+        assert branches.num_unread == 51
+        got = tree.arrays(["NMuon", "Muon_Px"], library="np")
+        assert branches.num_unread > 40
+        assert tree["Muon_Px"].count_branch is tree["NMuon"]
+        assert [x.member("fName") for x in tree.member("fLeaves")] == leaves
+        assert tree.typenames() == typenames
+
+    assert got["NMuon"].tolist() == expected["NMuon"].tolist()
+    assert [x.tolist() for x in got["Muon_Px"]] == [
+        x.tolist() for x in expected["Muon_Px"]
+    ]
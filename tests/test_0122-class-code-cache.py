@@ -0,0 +1,62 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest
+import skhep_testdata
+
+import uproot4
+
+
+def test_reopen(tmpdir):
+    path = skhep_testdata.data_path("uproot-demo-double32.root")
+
+    with uproot4.open(
+        path, custom_classes=dict(uproot4.classes), class_cache_dir=str(tmpdir)
+    ) as f:
+        expected = f["T/fD64"].array(library="np")
+        class_cache = f.file.class_cache
+        assert class_cache.num_hits == 0
+        assert class_cache.num_misses > 0
+    assert len(os.listdir(str(tmpdir))) == class_cache.num_misses
+
+    with uproot4.open(
+        path, custom_classes=dict(uproot4.classes), class_cache_dir=str(tmpdir)
+    ) as f:
+        got = f["T/fD64"].array(library="np")
+        assert f.file.class_cache.num_hits == class_cache.num_misses
+        assert f.file.class_cache.num_misses == 0
+
+    assert got.tolist() == expected.tolist()
+
+
+def test_corrupt_entry(tmpdir):
+    path = skhep_testdata.data_path("uproot-demo-double32.root")
+
+    with uproot4.open(
+        path, custom_classes=dict(uproot4.classes), class_cache_dir=str(tmpdir)
+    ) as f:
+        expected = f["T/fD64"].array(library="np")
+
+    for name in os.listdir(str(tmpdir)):
+        with open(os.path.join(str(tmpdir), name), "wb") as file:
+            file.write(b"not bytecode")
+
+    with uproot4.open(
+        path, custom_classes=dict(uproot4.classes), class_cache_dir=str(tmpdir)
+    ) as f:
+        assert f["T/fD64"].array(library="np").tolist() == expected.tolist()
+        assert f.file.class_cache.num_hits == 0
+
+    with uproot4.open(
+        path, custom_classes=dict(uproot4.classes), class_cache_dir=str(tmpdir)
+    ) as f:
+        f["T/fD64"].array(library="np")
+        assert f.file.class_cache.num_misses == 0
+
+
+def test_no_class_cache():
+    with uproot4.open(skhep_testdata.data_path("uproot-demo-double32.root")) as f:
+        assert f.file.class_cache is None
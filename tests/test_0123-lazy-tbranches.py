@@ -0,0 +1,148 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import threading
+import time
+
+import pytest
+import skhep_testdata
+
+import uproot4
+
+
+def test_only_names_are_read():
+    with uproot4.open(skhep_testdata.data_path("uproot-HZZ.root")) as f:
+        tree = f["events"]
+        branches = tree.member("fBranches")
+        assert isinstance(
+            branches, uproot4.models.TObjArray.Model_TObjArrayOfTBranches
+        )
+        assert len(branches) == 51
+        assert branches.num_unread == 51
+        assert branches.names[:3] == ["NJet", "Jet_Px", "Jet_Py"]
+
+        assert tree["Muon_Px"].name == "Muon_Px"
+        assert tree["Muon_Px"].index == branches.names.index("Muon_Px")
+        assert 0 < branches.num_unread < 51
+
+
+def test_arrays():
+    with uproot4.open(skhep_testdata.data_path("uproot-HZZ.root")) as f:
+        tree = f["events"]
+        branches = tree.member("fBranches")
+        arrays = tree.arrays(["NMuon", "Muon_Px"], library="np")
+        assert arrays["NMuon"][:3].tolist() == [2, 1, 2]
+        assert [len(x) for x in arrays["Muon_Px"][:3]] == [2, 1, 2]
+        assert branches.num_unread > 40
+
+
+def test_same_as_eager():
+    with uproot4.open(skhep_testdata.data_path("uproot-HZZ.root")) as f:
+        tree = f["events"]
+        branches = tree.member("fBranches")
+        assert [x.name for x in tree.values()] == branches.names
+        assert branches.num_unread == 0
+        assert len(tree.member("fLeaves")) == 51
+        assert all(
+            leaf is branch.member("fLeaves")[0]
+            for leaf, branch in zip(tree.member("fLeaves"), branches)
+        )
+        assert (
+            tree["Jet_Px"].member("fLeaves")[0].member("fLeafCount")
+            is tree["NJet"].member("fLeaves")[0]
+        )
+
+
+def test_references_to_other_branches():
+    with uproot4.open(skhep_testdata.data_path("uproot-HZZ.root")) as f:
+        tree = f["events"]
+        # reading Muon_Px's TLeaf needs NMuon's TLeaf as its fLeafCount
+        assert tree["Muon_Px"].interpretation == uproot4.interpretation.jagged.AsJagged(
+            uproot4.interpretation.numerical.AsDtype(">f4")
+        )
+        assert tree["Muon_Px"].count_branch is tree["NMuon"]
+
+
+def test_fallback_to_streamers():
+    with uproot4.open(skhep_testdata.data_path("uproot-stl_containers.root")) as f:
+        tree = f["tree"]
+        assert tree["vector_int32"].array(library="np")[1].tolist() == [1, 2]
+        assert tree.keys(recursive=False)[0] == "string"
+
+
+def test_missing():
+    with uproot4.open(skhep_testdata.data_path("uproot-HZZ.root")) as f:
+        with pytest.raises(uproot4.KeyInFileError):
+            f["events"]["nonexistent"]
+
+
+def test_default_read_paths():
+    path = skhep_testdata.data_path("uproot-HZZ.root")
+
+    with uproot4.open(path) as f:
+        tree = f["events"]
+        for arrays in tree.iterate(["NMuon", "Muon_Px"], library="np"):
+            pass
+        assert tree.member("fBranches").num_unread > 40
+
+    with uproot4.open(path) as f:
+        tree = f["events"]
+        tree.arrays(["Muon_Px"], cut="NMuon > 1", library="np")
+        assert tree.member("fBranches").num_unread > 40
+
+    with uproot4.open(path) as f:
+        tree = f["events"]
+        for arrays in tree.iterate(["NMuon"], step_size="cluster", library="np"):
+            pass
+        assert tree.member("fBranches").num_unread > 40
+
+    with uproot4.open(path) as f:
+        tree = f["events"]
+        assert tree.num_entries_for("1 kB", ["NMuon", "Muon_Px"]) > 0
+        assert tree.member("fBranches").num_unread > 40
+
+
+@pytest.mark.parametrize(
+    "filename", ["uproot-HZZ-objects.root", "uproot-small-evnt-tree-fullsplit.root"]
+)
+def test_after_close(filename):
+    path = skhep_testdata.data_path(filename)
+    with uproot4.open(path) as f:
+        name = f.keys(cycle=False)[0]
+        expected = f[name].typenames()
+
+    with uproot4.open(path) as f:
+        tree = f[name]
+    assert tree.member("fBranches").num_unread != 0
+    assert tree.typenames() == expected
+
+    tree = uproot4.open(path)[name]
+    tree.file.close()
+    assert tree.typenames() == expected
+
+
+def test_concurrent_access():
+    with uproot4.open(skhep_testdata.data_path("uproot-HZZ.root")) as f:
+        branches = f["events"].member("fBranches")
+        read = branches._read
+
+        def slow_read(index):
+            time.sleep(0.2)
+            return read(index)
+
+        branches._read = slow_read
+        results = []
+
+        def get():
+            results.append(branches[5])
+
+        threads = [threading.Thread(target=get) for i in range(2)]
+        threads[0].start()
+        time.sleep(0.05)
+        threads[1].start()
+        for thread in threads:
+            thread.join()
+
+        assert [x.name for x in results] == ["Jet_btag", "Jet_btag"]
+        assert results[0] is results[1]
@@ -0,0 +1,83 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import fnmatch
+
+import pytest
+import skhep_testdata
+
+import uproot4
+
+
+def test_compiled_filter():
+    f = uproot4._util.regularize_filter(["Jet_*", "NJet", "/^muon_p[xy]$/i"])
+    assert isinstance(f, uproot4._util.CompiledFilter)
+    assert f("Jet_Px")
+    assert f("NJet")
+    assert not f("NJets")
+    assert f("Muon_Px")
+    assert not f("Muon_Pz")
+    assert f.prefixes is None
+
+    f = uproot4._util.regularize_filter(("Jet_P?", "E[lv]*", "x.y"))
+    assert f.prefixes == ["Jet_P", "E", "x.y"]
+    assert f("Jet_Px")
+    assert not f("Jet_E")
+    assert f("Electron_E")
+    assert not f("xzy")
+
+    assert uproot4._util.regularize_filter("Jet_*") is uproot4._util.regularize_filter(
+        "Jet_*"
+    )
+    assert uproot4._util.regularize_filter(x for x in ["NJet"])("NJet")
+
+
+def _all_keys(hasbranches, full_paths):
+    for branch in hasbranches.branches:
+        yield branch.name
+        for key in _all_keys(branch, full_paths):
+            if full_paths:
+                yield branch.name + "/" + key
+            else:
+                yield key
+
+
+@pytest.mark.parametrize(
+    "filter_name", ["evt/P3*", "P3*", "*.P*", "/P3\\.P[xy]/", "evt/StdStr"]
+)
+@pytest.mark.parametrize("full_paths", [True, False])
+def test_same_keys(filter_name, full_paths):
+    with uproot4.open(
+        skhep_testdata.data_path("uproot-small-evnt-tree-fullsplit.root")
+    ) as f:
+        tree = f["tree"]
+        match = uproot4._util.regularize_filter(filter_name)
+        expected = [x for x in _all_keys(tree, full_paths) if match(x)]
+        assert tree.keys(filter_name=filter_name, full_paths=full_paths) == expected
+
+
+def test_only_matches_are_read():
+    with uproot4.open(skhep_testdata.data_path("uproot-HZZ.root")) as f:
+        tree = f["events"]
+        branches = tree.member("fBranches")
+        assert tree.keys(filter_name="Muon_*") == [
+            x for x in branches.names if fnmatch.fnmatchcase(x, "Muon_*")
+        ]
+        # (besides the matches, only the TBranches they refer to are read)
+        assert branches.num_unread >= 40
+
+        arrays = tree.arrays(filter_name="Muon_P[xy]", library="np")
+        assert set(arrays.keys()) == set(["Muon_Px", "Muon_Py"])
+        assert branches.num_unread >= 40
+
+
+def test_paths():
+    with uproot4.open(
+        skhep_testdata.data_path("uproot-small-evnt-tree-fullsplit.root")
+    ) as f:
+        tree = f["tree"]
+        assert tree["evt/P3/P3.Px"] is tree["evt"]["P3"]["P3.Px"]
+        assert tree["/evt"] is tree["evt"]
+        with pytest.raises(uproot4.KeyInFileError):
+            tree["evt/P3/nonexistent"]
@@ -17,6 +17,7 @@ Typical entry points for file-reading are
 
 * :py:func:`~uproot4.reading.open`
 * :py:func:`~uproot4.behaviors.TBranch.iterate`
+* :py:func:`~uproot4.behaviors.TBranch.aiterate`
 * :py:func:`~uproot4.behaviors.TBranch.concatenate`
 * :py:func:`~uproot4.behaviors.TBranch.lazy`
 
@@ -75,23 +76,31 @@ from __future__ import absolute_import
 from uproot4.version import __version__
 
 import uproot4.dynamic
+import uproot4._util
 
 classes = {}
 unknown_classes = {}
 
 from uproot4.cache import LRUCache
 from uproot4.cache import LRUArrayCache
+from uproot4.cache import TwoQueueArrayCache
+from uproot4.cache import DiskArrayCache
 
 from uproot4.source.file import MemmapSource
 from uproot4.source.file import MultithreadedFileSource
 from uproot4.source.http import HTTPSource
 from uproot4.source.http import MultithreadedHTTPSource
+
+if not uproot4._util.py2:
+    from uproot4.source.asynchttp import AsyncHTTPSource
 from uproot4.source.xrootd import XRootDSource
 from uproot4.source.xrootd import MultithreadedXRootDSource
 from uproot4.source.object import ObjectSource
+from uproot4.source.caching import CachingSource
 from uproot4.source.cursor import Cursor
 from uproot4.source.futures import TrivialExecutor
 from uproot4.source.futures import ThreadPoolExecutor
+from uproot4.source.futures import ProcessPoolExecutor
 
 decompression_executor = ThreadPoolExecutor()
 interpretation_executor = TrivialExecutor()
@@ -155,6 +164,7 @@ default_library = "ak"
 from uproot4.behaviors.TTree import TTree
 from uproot4.behaviors.TBranch import TBranch
 from uproot4.behaviors.TBranch import iterate
+from uproot4.behaviors.TBranch import aiterate
 from uproot4.behaviors.TBranch import concatenate
 from uproot4.behaviors.TBranch import lazy
 
@@ -0,0 +1,270 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+"""
+Asynchronous generators behind :py:func:`~uproot4.behaviors.TBranch.aiterate` and
+:py:meth:`~uproot4.behaviors.TBranch.HasBranches.aiterate`.
+
+These are in a separate module because their syntax requires Python 3.6 or
+later; they are imported only when one of the above is called.
+"""
+
+from __future__ import absolute_import
+
+import asyncio
+import functools
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+import uproot4.behaviors.TBranch
+import uproot4.interpretation.library
+import uproot4.source.chunk
+import uproot4._util
+
+
+async def _fill(source, ranges_or_baskets):
+    ranges = [
+        range_or_basket
+        for branch, basket_num, range_or_basket in ranges_or_baskets
+        if isinstance(range_or_basket, tuple) and len(range_or_basket) == 2
+    ]
+    if len(ranges) == 0:
+        return
+
+    ranges = [(int(start), int(stop)) for start, stop in ranges]
+    if hasattr(source, "achunks"):
+        chunks = await source.achunks(ranges)
+    else:
+        loop = asyncio.get_event_loop()
+        chunks = await loop.run_in_executor(
+            None, functools.partial(source.chunks, ranges, queue.Queue())
+        )
+
+    chunks = iter(chunks)
+    for i, (branch, basket_num, range_or_basket) in enumerate(ranges_or_baskets):
+        if isinstance(range_or_basket, tuple) and len(range_or_basket) == 2:
+            ranges_or_baskets[i] = (branch, basket_num, next(chunks))
+
+
+async def hasbranches_aiterate(
+    hasbranches,
+    expressions,
+    cut,
+    filter_name,
+    filter_typename,
+    filter_branch,
+    aliases,
+    language,
+    entry_start,
+    entry_stop,
+    step_size,
+    decompression_executor,
+    interpretation_executor,
+    library,
+    how,
+    report,
+):
+    """
+    The asynchronous generator returned by
+    :py:meth:`~uproot4.behaviors.TBranch.HasBranches.aiterate`.
+    """
+    keys = set(hasbranches.keys(recursive=True, full_paths=False))
+    if (
+        isinstance(hasbranches, uproot4.behaviors.TBranch.TBranch)
+        and expressions is None
+        and len(keys) == 0
+    ):
+        filter_branch = uproot4._util.regularize_filter(filter_branch)
+        async for x in hasbranches_aiterate(
+            hasbranches.parent,
+            expressions,
+            cut,
+            filter_name,
+            filter_typename,
+            lambda branch: branch is hasbranches and filter_branch(branch),
+            aliases,
+            language,
+            entry_start,
+            entry_stop,
+            step_size,
+            decompression_executor,
+            interpretation_executor,
+            library,
+            how,
+            report,
+        ):
+            yield x
+        return
+
+    entry_start, entry_stop = uproot4.behaviors.TBranch._regularize_entries_start_stop(
+        hasbranches.tree.num_entries, entry_start, entry_stop
+    )
+    (
+        decompression_executor,
+        interpretation_executor,
+    ) = uproot4.behaviors.TBranch._regularize_executors(
+        decompression_executor, interpretation_executor
+    )
+    library = uproot4.interpretation.library._regularize_library(library)
+
+    aliases = uproot4.behaviors.TBranch._regularize_aliases(hasbranches, aliases)
+    (
+        arrays,
+        expression_context,
+        branchid_interpretation,
+    ) = uproot4.behaviors.TBranch._regularize_expressions(
+        hasbranches,
+        expressions,
+        cut,
+        filter_name,
+        filter_typename,
+        filter_branch,
+        keys,
+        aliases,
+        language,
+        (lambda branchname, interpretation: None),
+    )
+
+    steps = uproot4.behaviors.TBranch._regularize_steps(
+        hasbranches,
+        step_size,
+        entry_start,
+        entry_stop,
+        uproot4.behaviors.TBranch._expression_branches(expression_context),
+    )
+
+    loop = asyncio.get_event_loop()
+
+    previous_baskets = {}
+    for sub_entry_start, sub_entry_stop in steps:
+        if sub_entry_stop - sub_entry_start == 0:
+            continue
+
+        ranges_or_baskets = uproot4.behaviors.TBranch._step_ranges_or_baskets(
+            expression_context, sub_entry_start, sub_entry_stop, previous_baskets
+        )
+
+        # all requests for this step are in flight on the event loop at once
+        await _fill(hasbranches._file.source, ranges_or_baskets)
+
+        def compute(expression_context=expression_context):
+            arrays = {}
+            uproot4.behaviors.TBranch._ranges_or_baskets_to_arrays(
+                hasbranches,
+                ranges_or_baskets,
+                branchid_interpretation,
+                sub_entry_start,
+                sub_entry_stop,
+                decompression_executor,
+                interpretation_executor,
+                library,
+                arrays,
+            )
+            return language.compute_expressions(
+                arrays,
+                expression_context,
+                keys,
+                aliases,
+                hasbranches.file.file_path,
+                hasbranches.object_path,
+            )
+
+        # decompression and interpretation do not block the event loop
+        output = await loop.run_in_executor(None, compute)
+
+        primary_context = [
+            (e, c) for e, c in expression_context if c["is_primary"] and not c["is_cut"]
+        ]
+
+        arrays = library.group(output, primary_context, how)
+
+        if report:
+            yield arrays, uproot4.behaviors.TBranch.Report(
+                hasbranches, sub_entry_start, sub_entry_stop
+            )
+        else:
+            yield arrays
+
+        for branch, basket_num, basket in ranges_or_baskets:
+            previous_baskets[branch.cache_key, basket_num] = basket
+
+
+async def aiterate(
+    files,
+    expressions,
+    cut,
+    filter_name,
+    filter_typename,
+    filter_branch,
+    aliases,
+    language,
+    step_size,
+    decompression_executor,
+    interpretation_executor,
+    library,
+    how,
+    report,
+    custom_classes,
+    allow_missing,
+    options,
+):
+    """
+    The asynchronous generator returned by
+    :py:func:`~uproot4.behaviors.TBranch.aiterate`.
+    """
+    files = uproot4.behaviors.TBranch._regularize_files(files)
+    (
+        decompression_executor,
+        interpretation_executor,
+    ) = uproot4.behaviors.TBranch._regularize_executors(
+        decompression_executor, interpretation_executor
+    )
+    library = uproot4.interpretation.library._regularize_library(library)
+
+    loop = asyncio.get_event_loop()
+
+    global_offset = 0
+    for file_path, object_path in files:
+        # opening a file reads its metadata synchronously
+        hasbranches = await loop.run_in_executor(
+            None,
+            uproot4.behaviors.TBranch._regularize_object_path,
+            file_path,
+            object_path,
+            custom_classes,
+            allow_missing,
+            options,
+        )
+
+        if hasbranches is not None:
+            with hasbranches:
+                async for item in hasbranches_aiterate(
+                    hasbranches,
+                    expressions,
+                    cut,
+                    filter_name,
+                    filter_typename,
+                    filter_branch,
+                    aliases,
+                    language,
+                    None,
+                    None,
+                    step_size,
+                    decompression_executor,
+                    interpretation_executor,
+                    library,
+                    how,
+                    report,
+                ):
+                    if report:
+                        arrays, report = item
+                        arrays = library.global_index(arrays, global_offset)
+                        report = report.to_global(global_offset)
+                        yield arrays, report
+                    else:
+                        arrays = library.global_index(item, global_offset)
+                        yield arrays
+
+                global_offset += hasbranches.num_entries
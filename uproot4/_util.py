@@ -104,24 +104,81 @@ def no_filter(x):
     return True
 
 
+class CompiledFilter(object):
+    """
+    A filter of names that was made from glob patterns, regexes between
+    slashes, and exact names. The glob patterns and exact names are combined
+    into one regular expression, compiled once.
+
+    If there are no regexes, :py:attr:`prefixes` lists a literal prefix for
+    each pattern, one of which every matching name must start with (possibly
+    the empty string); otherwise, it is None.
+    """
+
+    def __init__(self, patterns):
+        combined = []
+        self.prefixes = []
+        self._regexes = []
+        for pattern in patterns:
+            m = _regularize_filter_regex.match(pattern)
+            if m is not None:
+                regex, flags = m.groups()
+                self._regexes.append(
+                    re.compile(regex, _regularize_filter_regex_flags(flags))
+                )
+                self.prefixes = None
+            else:
+                if "*" in pattern or "?" in pattern or "[" in pattern:
+                    regex = glob.fnmatch.translate(pattern)
+                    if regex.endswith("(?ms)"):
+                        # Python 2 puts the flags at the end, which can't be
+                        # combined with other patterns
+                        regex = regex[: -len("(?ms)")]
+                    prefix = re.split(r"[\*\?\[]", pattern, 1)[0]
+                else:
+                    regex = re.escape(pattern) + r"\Z"
+                    prefix = pattern
+                combined.append("(?:{0})".format(regex))
+                if self.prefixes is not None:
+                    self.prefixes.append(prefix)
+
+        if len(combined) == 0:
+            self._match = None
+        else:
+            self._match = re.compile("|".join(combined)).match
+
+    def __call__(self, x):
+        if self._match is not None and self._match(x) is not None:
+            return True
+        for regex in self._regexes:
+            if regex.match(x) is not None:
+                return True
+        return False
+
+
+_compiled_filters = {}
+
+
+def _compiled_filter(patterns):
+    out = _compiled_filters.get(patterns)
+    if out is None:
+        if len(_compiled_filters) >= 1024:
+            _compiled_filters.clear()
+        out = _compiled_filters[patterns] = CompiledFilter(patterns)
+    return out
+
+
 def regularize_filter(filter):
     if filter is None:
         return no_filter
     elif callable(filter):
         return filter
     elif isstr(filter):
-        m = _regularize_filter_regex.match(filter)
-        if m is not None:
-            regex, flags = m.groups()
-            return (
-                lambda x: re.match(regex, x, _regularize_filter_regex_flags(flags))
-                is not None
-            )
-        elif "*" in filter or "?" in filter or "[" in filter:
-            return lambda x: glob.fnmatch.fnmatchcase(x, filter)
-        else:
-            return lambda x: x == filter
+        return _compiled_filter((filter,))
     elif isinstance(filter, Iterable) and not isinstance(filter, bytes):
+        filter = list(filter)
+        if all(isstr(f) for f in filter):
+            return _compiled_filter(tuple(filter))
         filters = [regularize_filter(f) for f in filter]
         return lambda x: any(f(x) for f in filters)
     else:
@@ -14,6 +14,7 @@ objects themselves.
 from __future__ import absolute_import
 
 import os
+import bisect
 import glob
 import sys
 import re
@@ -41,6 +42,7 @@ import numpy
 
 import uproot4.cache
 import uproot4.source.cursor
+import uproot4.source.futures
 import uproot4.streamers
 import uproot4.containers
 import uproot4.interpretation
@@ -52,6 +54,7 @@ import uproot4.reading
 import uproot4.language.python
 import uproot4.models.TBasket
 import uproot4.models.TObjArray
+import uproot4.statistics
 import uproot4._util
 from uproot4._util import no_filter
 
@@ -88,8 +91,12 @@ def iterate(
     library="ak",
     how=None,
     report=False,
+    prefetch=0,
+    prefetch_decompress=False,
+    prefetch_memory=None,
     custom_classes=None,
     allow_missing=False,
+    num_open_workers=8,
     **options  # NOTE: a comma after **options breaks Python 2
 ):
     u"""
@@ -122,7 +129,11 @@ def iterate(
         step_size (int or str): If an integer, the maximum number of entries to
             include in each iteration step; if a string, the maximum memory size
             to include. The string must be a number followed by a memory unit,
-            such as "100 MB".
+            such as "100 MB". If the memory size is followed by "aligned", such
+            as "100 MB aligned", the steps are widened or narrowed to whole
+            clusters, where all of the ``TBaskets`` read begin and end. If
+            "cluster", each step is one such cluster. With either, no ``TBasket``
+            straddles a step boundary, so none is read or interpreted twice.
         decompression_executor (None or Executor with a ``submit`` method): The
             executor that is used to decompress ``TBaskets``; if None, the
             global ``uproot4.decompression_executor`` is used.
@@ -143,10 +154,22 @@ def iterate(
             (arrays, :py:class:`~uproot4.behaviors.TBranch.Report`) pairs; if False,
             it only yields arrays. The report has data about the ``TFile``,
             ``TTree``, and global and local entry ranges.
+        prefetch (int): The number of steps after the current one whose
+            ``TBaskets`` are requested while the current step is being
+            processed. Prefetching does not cross file boundaries.
+        prefetch_decompress (bool): If True, prefetched ``TBaskets`` are also
+            decompressed as soon as they arrive. This can't be used with a
+            :py:class:`~uproot4.source.futures.ProcessPoolExecutor`.
+        prefetch_memory (None, int, or str): If not None, the maximum number
+            of bytes of prefetched data to hold.
         custom_classes (None or dict): If a dict, override the classes from
             the :py:class:`~uproot4.reading.ReadOnlyFile` or ``uproot4.classes``.
         allow_missing (bool): If True, skip over any files that do not contain
             the specified ``TTree``.
+        num_open_workers (int): The number of files that are opened (reading
+            their headers, streamers, and ``TTree`` metadata) concurrently, in
+            background threads, ahead of the file being read. If 1, files are
+            opened one at a time, when they are needed.
         options: See below.
 
     Iterates through contiguous chunks of entries from a set of files.
@@ -188,6 +211,16 @@ def iterate(
     * num_fallback_workers (int; 10)
     * begin_chunk_size (memory_size; 512)
     * minimal_ttree_metadata (bool; True)
+    * zero_copy (bool; False)
+    * coalesce_gap (None or memory_size; None)
+    * http_pool_size (int; 10)
+    * http_idle_timeout (None or float; 30)
+    * max_num_connections (int; 64)
+    * block_cache_dir (None or str; None)
+    * block_cache_size (memory_size; "1 GB")
+    * statistics_dir (None or str; None)
+    * metadata_dir (None or str; None)
+    * class_cache_dir (None or str; None)
 
     See also :py:meth:`~uproot4.behavior.TBranch.HasBranches.iterate` to iterate
     within a single file.
@@ -209,13 +242,9 @@ def iterate(
     library = uproot4.interpretation.library._regularize_library(library)
 
     global_offset = 0
-    for file_path, object_path in files:
-        print(file_path, global_offset)
-
-        hasbranches = _regularize_object_path(
-            file_path, object_path, custom_classes, allow_missing, options
-        )
-
+    for file_path, object_path, hasbranches in _open_files(
+        files, custom_classes, allow_missing, options, num_open_workers
+    ):
         if hasbranches is not None:
             with hasbranches:
                 for item in hasbranches.iterate(
@@ -232,6 +261,9 @@ def iterate(
                     library=library,
                     how=how,
                     report=report,
+                    prefetch=prefetch,
+                    prefetch_decompress=prefetch_decompress,
+                    prefetch_memory=prefetch_memory,
                 ):
                     if report:
                         arrays, report = item
@@ -245,6 +277,81 @@ def iterate(
                 global_offset += hasbranches.num_entries
 
 
+def aiterate(
+    files,
+    expressions=None,
+    cut=None,
+    filter_name=no_filter,
+    filter_typename=no_filter,
+    filter_branch=no_filter,
+    aliases=None,
+    language=uproot4.language.python.PythonLanguage(),
+    step_size="100 MB",
+    decompression_executor=None,
+    interpretation_executor=None,
+    library="ak",
+    how=None,
+    report=False,
+    custom_classes=None,
+    allow_missing=False,
+    **options  # NOTE: a comma after **options breaks Python 2
+):
+    """
+    Args: Same as :py:func:`~uproot4.behaviors.TBranch.iterate`.
+
+    Returns an asynchronous generator that iterates through contiguous chunks
+    of entries from a set of files, like
+    :py:func:`~uproot4.behaviors.TBranch.iterate`, for use in an ``asyncio``
+    event loop.
+
+    For example:
+
+    .. code-block:: python
+
+        >>> async for array in uproot4.aiterate(
+        ...     "https://where/files*.root:tree",
+        ...     ["x", "y"],
+        ...     step_size=100,
+        ...     http_handler=uproot4.AsyncHTTPSource,
+        ... ):
+        ...     # each of the following have 100 entries
+        ...     array["x"], array["y"]
+
+    In each step, all of the ``TBaskets`` are requested before any are awaited.
+    With an :py:class:`~uproot4.source.asynchttp.AsyncHTTPSource`, the requests
+    are made concurrently on the running event loop; with any other
+    :py:class:`~uproot4.source.chunk.Source`, they are made as usual. Opening
+    files, decompression, and interpretation run in the event loop's default
+    executor, so that they do not block the event loop.
+
+    Requires Python 3.6 or later.
+    """
+    if uproot4._util.py2 or uproot4._util.py35:
+        raise NotImplementedError("aiterate requires Python 3.6 or later")
+
+    from uproot4._async import aiterate
+
+    return aiterate(
+        files,
+        expressions,
+        cut,
+        filter_name,
+        filter_typename,
+        filter_branch,
+        aliases,
+        language,
+        step_size,
+        decompression_executor,
+        interpretation_executor,
+        library,
+        how,
+        report,
+        custom_classes,
+        allow_missing,
+        options,
+    )
+
+
 def concatenate(
     files,
     expressions=None,
@@ -260,6 +367,7 @@ def concatenate(
     how=None,
     custom_classes=None,
     allow_missing=False,
+    num_open_workers=8,
     **options  # NOTE: a comma after **options breaks Python 2
 ):
     u"""
@@ -309,6 +417,10 @@ def concatenate(
             the :py:class:`~uproot4.reading.ReadOnlyFile` or ``uproot4.classes``.
         allow_missing (bool): If True, skip over any files that do not contain
             the specified ``TTree``.
+        num_open_workers (int): The number of files that are opened (reading
+            their headers, streamers, and ``TTree`` metadata) concurrently, in
+            background threads, ahead of the file being read. If 1, files are
+            opened one at a time, when they are needed.
         options: See below.
 
     Returns an array with data from a set of files concatenated into one.
@@ -352,6 +464,16 @@ def concatenate(
     * num_fallback_workers (int; 10)
     * begin_chunk_size (memory_size; 512)
     * minimal_ttree_metadata (bool; True)
+    * zero_copy (bool; False)
+    * coalesce_gap (None or memory_size; None)
+    * http_pool_size (int; 10)
+    * http_idle_timeout (None or float; 30)
+    * max_num_connections (int; 64)
+    * block_cache_dir (None or str; None)
+    * block_cache_size (memory_size; "1 GB")
+    * statistics_dir (None or str; None)
+    * metadata_dir (None or str; None)
+    * class_cache_dir (None or str; None)
 
     Other file entry points:
 
@@ -371,11 +493,9 @@ def concatenate(
 
     all_arrays = []
     global_start = 0
-    for file_path, object_path in files:
-        hasbranches = _regularize_object_path(
-            file_path, object_path, custom_classes, allow_missing, options
-        )
-
+    for file_path, object_path, hasbranches in _open_files(
+        files, custom_classes, allow_missing, options, num_open_workers
+    ):
         if hasbranches is not None:
             with hasbranches:
                 arrays = hasbranches.arrays(
@@ -414,6 +534,7 @@ def lazy(
     library="ak",
     custom_classes=None,
     allow_missing=False,
+    num_open_workers=8,
     **options  # NOTE: a comma after **options breaks Python 2
 ):
     u"""
@@ -436,6 +557,13 @@ def lazy(
         full_paths (bool): If True, include the full path to each subbranch
             with slashes (``/``); otherwise, use the descendant's name as
             the field name.
+        step_size (int or str): If an integer, the maximum number of entries to
+            include in each partition; if a string, the maximum memory size
+            to include. The string must be a number followed by a memory unit,
+            such as "100 MB". If the memory size is followed by "aligned", such
+            as "100 MB aligned", the partitions are widened or narrowed to whole
+            clusters, where all of the ``TBaskets`` begin and end. If "cluster",
+            each partition is one such cluster.
         decompression_executor (None or Executor with a ``submit`` method): The
             executor that is used to decompress ``TBaskets``; if None, the
             global ``uproot4.decompression_executor`` is used.
@@ -453,6 +581,10 @@ def lazy(
             the :py:class:`~uproot4.reading.ReadOnlyFile` or ``uproot4.classes``.
         allow_missing (bool): If True, skip over any files that do not contain
             the specified ``TTree``.
+        num_open_workers (int): The number of files that are opened (reading
+            their headers, streamers, and ``TTree`` metadata) concurrently, in
+            background threads, ahead of the file being read. If 1, files are
+            opened one at a time, when they are needed.
         options: See below.
 
     Returns a lazy array, which loads data on demand. Only the files and
@@ -477,7 +609,10 @@ def lazy(
     If the size of the fields used in a calculation do not fit into ``array_cache``,
     lazy arrays may be inefficient, repeatedly rereading data that could be read
     once by iterating through the calculation with
-    :py:func:`~uproot4.behavior.TBranch.iterate`.
+    :py:func:`~uproot4.behavior.TBranch.iterate`. If a few fields are used
+    repeatedly while many others are each used once, a
+    :py:class:`~uproot4.cache.TwoQueueArrayCache` keeps the repeatedly used
+    fields when the others are read.
 
     Allowed types for the ``files`` parameter:
 
@@ -508,6 +643,16 @@ def lazy(
     * num_fallback_workers (int; 10)
     * begin_chunk_size (memory_size; 512)
     * minimal_ttree_metadata (bool; True)
+    * zero_copy (bool; False)
+    * coalesce_gap (None or memory_size; None)
+    * http_pool_size (int; 10)
+    * http_idle_timeout (None or float; 30)
+    * max_num_connections (int; 64)
+    * block_cache_dir (None or str; None)
+    * block_cache_size (memory_size; "1 GB")
+    * statistics_dir (None or str; None)
+    * metadata_dir (None or str; None)
+    * class_cache_dir (None or str; None)
 
     Other file entry points:
 
@@ -547,11 +692,9 @@ def lazy(
     is_self = []
 
     count = 0
-    for file_path, object_path in files:
-        obj = _regularize_object_path(
-            file_path, object_path, custom_classes, allow_missing, real_options
-        )
-
+    for file_path, object_path, obj in _open_files(
+        files, custom_classes, allow_missing, real_options, num_open_workers
+    ):
         if obj is not None:
             count += 1
 
@@ -621,15 +764,15 @@ def lazy(
             obj.tree.num_entries, None, None
         )
         branchid_interpretation = {}
+        branches = []
         for key in common_keys:
             branch = obj[key]
+            if branch.cache_key not in branchid_interpretation:
+                branches.append(branch)
             branchid_interpretation[branch.cache_key] = branch.interpretation
-        entry_step = _regularize_step_size(
-            obj, step_size, entry_start, entry_stop, branchid_interpretation
-        )
+        steps = _regularize_steps(obj, step_size, entry_start, entry_stop, branches)
 
-        for start in uproot4._util.range(entry_start, entry_stop, entry_step):
-            stop = min(start + entry_step, entry_stop)
+        for start, stop in steps:
             length = stop - start
 
             fields = []
@@ -1051,7 +1194,7 @@ class HasBranches(Mapping):
         See also :py:meth:`~uproot4.behavior.TBranch.HasBranches.iterate` to iterate over
         the array in contiguous ranges of entries.
         """
-        keys = set(self.keys(recursive=True, full_paths=False))
+        keys = _KeySet(self)
         if isinstance(self, TBranch) and expressions is None and len(keys) == 0:
             filter_branch = uproot4._util.regularize_filter(filter_branch)
             return self.parent.arrays(
@@ -1108,14 +1251,75 @@ class HasBranches(Mapping):
             get_from_cache,
         )
 
-        ranges_or_baskets = []
-        for expression, context in expression_context:
-            branch = context.get("branch")
-            if branch is not None and not context["is_duplicate"]:
-                for basket_num, range_or_basket in branch.entries_to_ranges_or_baskets(
-                    entry_start, entry_stop
-                ):
-                    ranges_or_baskets.append((branch, basket_num, range_or_basket))
+        previous_baskets = {}
+        if cut is not None and len(arrays) == 0:
+            ranges = _statistics_ranges(self, cut, aliases, entry_start, entry_stop)
+            if ranges is not None:
+                if len(ranges) == 0:
+                    # one entry, which fails the cut, gives empty arrays
+                    ranges = [(entry_start, entry_start + 1)]
+                all_arrays = []
+                for sub_entry_start, sub_entry_stop in ranges:
+                    output = _cut_first_arrays(
+                        self,
+                        expression_context,
+                        branchid_interpretation,
+                        cut,
+                        keys,
+                        aliases,
+                        language,
+                        sub_entry_start,
+                        sub_entry_stop,
+                        decompression_executor,
+                        interpretation_executor,
+                        library,
+                        how,
+                        previous_baskets,
+                    )
+                    if output is None:
+                        output = _step_output(
+                            self,
+                            expression_context,
+                            branchid_interpretation,
+                            keys,
+                            aliases,
+                            language,
+                            sub_entry_start,
+                            sub_entry_stop,
+                            decompression_executor,
+                            interpretation_executor,
+                            library,
+                            how,
+                            previous_baskets,
+                        )
+                    all_arrays.append(output)
+                if len(all_arrays) == 1:
+                    return all_arrays[0]
+                else:
+                    return library.concatenate(all_arrays)
+
+            output = _cut_first_arrays(
+                self,
+                expression_context,
+                branchid_interpretation,
+                cut,
+                keys,
+                aliases,
+                language,
+                entry_start,
+                entry_stop,
+                decompression_executor,
+                interpretation_executor,
+                library,
+                how,
+                previous_baskets,
+            )
+            if output is not None:
+                return output
+
+        ranges_or_baskets = _step_ranges_or_baskets(
+            expression_context, entry_start, entry_stop, previous_baskets
+        )
 
         _ranges_or_baskets_to_arrays(
             self,
@@ -1177,6 +1381,9 @@ class HasBranches(Mapping):
         library="ak",
         how=None,
         report=False,
+        prefetch=0,
+        prefetch_decompress=False,
+        prefetch_memory=None,
     ):
         u"""
         Args:
@@ -1213,7 +1420,11 @@ class HasBranches(Mapping):
             step_size (int or str): If an integer, the maximum number of entries to
                 include in each iteration step; if a string, the maximum memory size
                 to include. The string must be a number followed by a memory unit,
-                such as "100 MB".
+                such as "100 MB". If the memory size is followed by "aligned", such
+                as "100 MB aligned", the steps are widened or narrowed to whole
+                clusters, where all of the ``TBaskets`` read begin and end. If
+                "cluster", each step is one such cluster. With either, no ``TBasket``
+                straddles a step boundary, so none is read or interpreted twice.
             decompression_executor (None or Executor with a ``submit`` method): The
                 executor that is used to decompress ``TBaskets``; if None, the
                 global ``uproot4.decompression_executor`` is used.
@@ -1234,6 +1445,19 @@ class HasBranches(Mapping):
                 (arrays, :py:class:`~uproot4.behaviors.TBranch.Report`) pairs; if False,
                 it only yields arrays. The report has data about the ``TFile``,
                 ``TTree``, and global and local entry ranges.
+            prefetch (int): The number of steps after the current one whose
+                ``TBaskets`` are requested while the current step is being
+                processed (and the consumer is working on the previous one).
+                If 0, each step's ``TBaskets`` are requested only when that
+                step begins.
+            prefetch_decompress (bool): If True, prefetched ``TBaskets`` are
+                also decompressed (on the ``decompression_executor``) as soon as
+                they arrive. This can't be used with a
+                :py:class:`~uproot4.source.futures.ProcessPoolExecutor`.
+            prefetch_memory (None, int, or str): If not None, the maximum number
+                of bytes of prefetched data (compressed, plus uncompressed if
+                ``prefetch_decompress``) to hold; steps that would exceed it
+                are not prefetched until earlier steps have been consumed.
 
         Iterates through contiguous chunks of entries from the ``TTree``.
 
@@ -1245,13 +1469,22 @@ class HasBranches(Mapping):
             ...     # each of the following have 100 entries
             ...     array["x"], array["y"]
 
+        With ``prefetch=2``, the ``TBaskets`` of the next two steps are read
+        (and possibly decompressed) in the background while the current one is
+        being processed, which overlaps I/O with computation:
+
+        .. code-block:: python
+
+            >>> for array in tree.iterate(["x", "y"], prefetch=2, prefetch_memory="1 GB"):
+            ...     do_something_expensive(array)
+
         See also :py:meth:`~uproot4.behavior.TBranch.HasBranches.arrays` to read
         everything in a single step, without iteration.
 
         See also :py:func:`~uproot4.behavior.TBranch.iterate` to iterate over many
         files.
         """
-        keys = set(self.keys(recursive=True, full_paths=False))
+        keys = _KeySet(self)
         if isinstance(self, TBranch) and expressions is None and len(keys) == 0:
             filter_branch = uproot4._util.regularize_filter(filter_branch)
             for x in self.parent.iterate(
@@ -1270,6 +1503,9 @@ class HasBranches(Mapping):
                 library=library,
                 how=how,
                 report=report,
+                prefetch=prefetch,
+                prefetch_decompress=prefetch_decompress,
+                prefetch_memory=prefetch_memory,
             ):
                 yield x
 
@@ -1300,77 +1536,145 @@ class HasBranches(Mapping):
                 (lambda branchname, interpretation: None),
             )
 
-            entry_step = _regularize_step_size(
-                self, step_size, entry_start, entry_stop, branchid_interpretation
+            steps = _regularize_steps(
+                self,
+                step_size,
+                entry_start,
+                entry_stop,
+                _expression_branches(expression_context),
             )
-
-            previous_baskets = {}
-            for sub_entry_start in uproot4._util.range(
-                entry_start, entry_stop, entry_step
-            ):
-                sub_entry_stop = min(sub_entry_start + entry_step, entry_stop)
-                if sub_entry_stop - sub_entry_start == 0:
-                    continue
-
-                ranges_or_baskets = []
-                for expression, context in expression_context:
-                    branch = context.get("branch")
-                    if branch is not None and not context["is_duplicate"]:
-                        for (
-                            basket_num,
-                            range_or_basket,
-                        ) in branch.entries_to_ranges_or_baskets(
-                            sub_entry_start, sub_entry_stop
-                        ):
-                            previous_basket = previous_baskets.get(
-                                (branch.cache_key, basket_num)
-                            )
-                            if previous_basket is None:
-                                ranges_or_baskets.append(
-                                    (branch, basket_num, range_or_basket)
-                                )
-                            else:
-                                ranges_or_baskets.append(
-                                    (branch, basket_num, previous_basket)
-                                )
-
-                arrays = {}
-                _ranges_or_baskets_to_arrays(
+            if cut is not None:
+                ranges = _statistics_ranges(self, cut, aliases, entry_start, entry_stop)
+                if ranges is not None:
+                    steps = [
+                        (start, stop)
+                        for start, stop in steps
+                        if any(x < stop and start < y for x, y in ranges)
+                    ]
+
+            if prefetch > 0:
+                prefetcher = _Prefetcher(
                     self,
-                    ranges_or_baskets,
-                    branchid_interpretation,
-                    sub_entry_start,
-                    sub_entry_stop,
+                    steps,
+                    prefetch,
+                    prefetch_decompress,
+                    prefetch_memory,
                     decompression_executor,
-                    interpretation_executor,
-                    library,
-                    arrays,
                 )
+            else:
+                prefetcher = None
 
-                output = language.compute_expressions(
-                    arrays,
-                    expression_context,
-                    keys,
-                    aliases,
-                    self.file.file_path,
-                    self.object_path,
-                )
+            previous_baskets = {}
+            for step_index, (sub_entry_start, sub_entry_stop) in enumerate(steps):
+                if sub_entry_stop - sub_entry_start == 0:
+                    continue
 
-                expression_context = [
-                    (e, c)
-                    for e, c in expression_context
-                    if c["is_primary"] and not c["is_cut"]
-                ]
+                if prefetcher is not None:
+                    prefetcher.advance(step_index, expression_context, previous_baskets)
+
+                arrays = None
+                if cut is not None and prefetcher is None:
+                    arrays = _cut_first_arrays(
+                        self,
+                        expression_context,
+                        branchid_interpretation,
+                        cut,
+                        keys,
+                        aliases,
+                        language,
+                        sub_entry_start,
+                        sub_entry_stop,
+                        decompression_executor,
+                        interpretation_executor,
+                        library,
+                        how,
+                        previous_baskets,
+                    )
 
-                arrays = library.group(output, expression_context, how)
+                if arrays is None:
+                    arrays = _step_output(
+                        self,
+                        expression_context,
+                        branchid_interpretation,
+                        keys,
+                        aliases,
+                        language,
+                        sub_entry_start,
+                        sub_entry_stop,
+                        decompression_executor,
+                        interpretation_executor,
+                        library,
+                        how,
+                        previous_baskets,
+                        prefetcher,
+                    )
 
                 if report:
                     yield arrays, Report(self, sub_entry_start, sub_entry_stop)
                 else:
                     yield arrays
 
-                for branch, basket_num, basket in ranges_or_baskets:
-                    previous_baskets[branch.cache_key, basket_num] = basket
+    def aiterate(
+        self,
+        expressions=None,
+        cut=None,
+        filter_name=no_filter,
+        filter_typename=no_filter,
+        filter_branch=no_filter,
+        aliases=None,
+        language=uproot4.language.python.PythonLanguage(),
+        entry_start=None,
+        entry_stop=None,
+        step_size="100 MB",
+        decompression_executor=None,
+        interpretation_executor=None,
+        library="ak",
+        how=None,
+        report=False,
+    ):
+        """
+        Args: Same as :py:meth:`~uproot4.behaviors.TBranch.HasBranches.iterate`.
+
+        Returns an asynchronous generator that iterates through contiguous
+        chunks of entries from the ``TTree``, like
+        :py:meth:`~uproot4.behaviors.TBranch.HasBranches.iterate`, for use in an
+        ``asyncio`` event loop.
+
+        For example:
+
+        .. code-block:: python
+
+            >>> async for array in tree.aiterate(["x", "y"], step_size=100):
+            ...     # each of the following have 100 entries
+            ...     array["x"], array["y"]
+
+        See :py:func:`~uproot4.behaviors.TBranch.aiterate` for details.
+
+        Requires Python 3.6 or later.
+        """
+        if uproot4._util.py2 or uproot4._util.py35:
+            raise NotImplementedError("aiterate requires Python 3.6 or later")
+
+        from uproot4._async import hasbranches_aiterate
+
+        return hasbranches_aiterate(
+            self,
+            expressions,
+            cut,
+            filter_name,
+            filter_typename,
+            filter_branch,
+            aliases,
+            language,
+            entry_start,
+            entry_stop,
+            step_size,
+            decompression_executor,
+            interpretation_executor,
+            library,
+            how,
+            report,
+        )
 
     def keys(
         self,
@@ -1633,28 +1937,14 @@ class HasBranches(Mapping):
                     repr(filter_branch)
                 )
             )
-        for branch in self.branches:
+        prefixes = getattr(filter_name, "prefixes", None)
+        for k, v in _name_index(self).candidates(prefixes, recursive, full_paths):
             if (
-                (filter_name is no_filter or filter_name(branch.name))
-                and (filter_typename is no_filter or filter_typename(branch.typename))
-                and (filter_branch is no_filter or filter_branch(branch))
+                (filter_name is no_filter or filter_name(k))
+                and (filter_typename is no_filter or filter_typename(v.typename))
+                and (filter_branch is no_filter or filter_branch(v))
             ):
-                yield branch.name, branch
-
-            if recursive:
-                for k1, v in branch.iteritems(
-                    recursive=recursive,
-                    filter_name=no_filter,
-                    filter_typename=filter_typename,
-                    filter_branch=filter_branch,
-                    full_paths=full_paths,
-                ):
-                    if full_paths:
-                        k2 = "{0}/{1}".format(branch.name, k1)
-                    else:
-                        k2 = k1
-                    if filter_name is no_filter or filter_name(k2):
-                        yield k2, v
+                yield k, v
 
     def itertypenames(
         self,
@@ -1759,7 +2049,11 @@ class HasBranches(Mapping):
 
         This is the algorithm that
         :py:meth:`~uproot4.behavior.TBranch.HasBranches.iterate` uses to convert a
-        ``step_size`` expressed in memory units into a number of entries.
+        ``step_size`` expressed in memory units into a number of entries. (With
+        ``step_size="cluster"`` or an aligned memory size, ``iterate`` then
+        moves the step boundaries onto
+        :py:meth:`~uproot4.behavior.TBranch.HasBranches.common_entry_offsets`,
+        so the steps are not all this size.)
         """
         target_num_bytes = uproot4._util.memory_size(memory_size)
 
@@ -1767,7 +2061,7 @@ class HasBranches(Mapping):
             self.tree.num_entries, entry_start, entry_stop
         )
 
-        keys = set(self.keys(recursive=True, full_paths=False))
+        keys = _KeySet(self)
         aliases = _regularize_aliases(self, aliases)
         arrays, expression_context, branchid_interpretation = _regularize_expressions(
             self,
@@ -1783,7 +2077,11 @@ class HasBranches(Mapping):
         )
 
         return _hasbranches_num_entries_for(
-            self, target_num_bytes, entry_start, entry_stop, branchid_interpretation
+            self,
+            target_num_bytes,
+            entry_start,
+            entry_stop,
+            _expression_branches(expression_context),
         )
 
     def common_entry_offsets(
@@ -1827,6 +2125,68 @@ class HasBranches(Mapping):
                 common_offsets = common_offsets.intersection(set(branch.entry_offsets))
         return sorted(common_offsets)
 
+    def compute_statistics(
+        self,
+        filter_name=no_filter,
+        filter_typename=no_filter,
+        filter_branch=no_filter,
+        directory=None,
+    ):
+        u"""
+        Args:
+            filter_name (None, glob string, regex string in ``"/pattern/i"`` syntax, function of str \u2192 bool, or iterable of the above): A
+                filter to select ``TBranches`` by name.
+            filter_typename (None, glob string, regex string in ``"/pattern/i"`` syntax, function of str \u2192 bool, or iterable of the above): A
+                filter to select ``TBranches`` by type.
+            filter_branch (None or function of :py:class:`~uproot4.behaviors.TBranch.TBranch` \u2192 bool, :py:class:`~uproot4.interpretation.Interpretation`, or None): A
+                filter to select ``TBranches`` using the full
+                :py:class:`~uproot4.behaviors.TBranch.TBranch` object. The ``TBranch`` is
+                included if the function returns True, excluded if it returns False.
+            directory (None or str): Directory in which to store the statistics.
+                If None, use the file's ``statistics_dir`` option.
+
+        Reads all ``TBaskets`` of the selected numerical ``TBranches`` (those
+        with one number per entry; others are ignored) and stores the minimum,
+        maximum, and number of entries of each as a
+        :py:class:`~uproot4.statistics.BasketStatistics` file, along with any
+        statistics of other ``TBranches`` already in it. Returns the
+        :py:class:`~uproot4.statistics.BasketStatistics`.
+
+        If the file was opened with a ``statistics_dir``,
+        :py:meth:`~uproot4.behaviors.TBranch.HasBranches.arrays` and
+        :py:meth:`~uproot4.behaviors.TBranch.HasBranches.iterate` use these
+        statistics to skip ranges of entries in which a ``cut`` like
+        ``"(x > 10) & (y < 3)"`` can't pass, without reading them.
+        """
+        if directory is None:
+            directory = self._file.options["statistics_dir"]
+        if directory is None:
+            raise ValueError(
+                """a directory must be given, either as an argument or as the """
+                """file's statistics_dir option
+in file {0}""".format(
+                    self._file.file_path
+                )
+            )
+
+        statistics = uproot4.statistics.BasketStatistics.load(
+            directory, self._file.hex_uuid
+        )
+        if statistics is None:
+            statistics = uproot4.statistics.BasketStatistics(self._file.hex_uuid)
+
+        for branch in self.itervalues(
+            filter_name=filter_name,
+            filter_typename=filter_typename,
+            filter_branch=filter_branch,
+            recursive=True,
+        ):
+            if uproot4.statistics.can_summarize(branch.interpretation):
+                statistics.update(branch)
+
+        statistics.save(directory)
+        return statistics
+
     def __getitem__(self, where):
         original_where = where
 
@@ -1851,14 +2211,14 @@ class HasBranches(Mapping):
 
         if "/" in where:
             where = "/".join([x for x in where.split("/") if x != ""])
-            for k, v in self.iteritems(recursive=True, full_paths=True):
-                if where == k:
+            for k, v in _name_index(self).candidates([where], True, True):
+                if k == where:
                     self._lookup[original_where] = v
                     return v
             else:
                 raise uproot4.KeyInFileError(
                     original_where,
-                    keys=self.keys(recursive=recursive),
+                    keys=_name_index(self).names(),
                     file_path=self._file.file_path,
                     object_path=self.object_path,
                 )
@@ -1871,20 +2231,21 @@ class HasBranches(Mapping):
             else:
                 raise uproot4.KeyInFileError(
                     original_where,
-                    keys=self.keys(recursive=recursive),
+                    keys=_name_index(self).names(),
                     file_path=self._file.file_path,
                     object_path=self.object_path,
                 )
 
         else:
-            for branch in self.branches:
-                if branch.name == where:
-                    self._lookup[original_where] = branch
-                    return branch
+            position = _name_index(self).position(where)
+            if position is not None:
+                got = self.branches[position]
+                self._lookup[original_where] = got
+                return got
             else:
                 raise uproot4.KeyInFileError(
                     original_where,
-                    keys=self.keys(recursive=recursive),
+                    keys=_name_index(self).names(),
                     file_path=self._file.file_path,
                     object_path=self.object_path,
                 )
@@ -2094,10 +2455,9 @@ class TBranch(HasBranches):
         :py:attr:`~uproot4.behavior.TBranch.TBranch.name` is not unique: the
         non-recursive index is always unique.
         """
-        for i, branch in enumerate(self.parent.branches):
-            if branch is self:
-                return i
-        else:
+        try:
+            return self.parent.branches.index(self)
+        except ValueError:
             raise AssertionError
 
     @property
@@ -2535,6 +2895,7 @@ in file {3}""".format(
         fWriteBasket = self.member("fWriteBasket")
 
         self._lookup = {}
+        self._name_index = None
         self._interpretation = None
         self._typename = None
         self._streamer = None
@@ -2542,6 +2903,7 @@ in file {3}""".format(
         self._cache_key = None
         self._context = dict(context)
         self._context["breadcrumbs"] = ()
+        self._context.pop("resolve_reference", None)
         self._context["in_TBranch"] = True
 
         self._num_normal_baskets = 0
@@ -2793,17 +3155,248 @@ in file {1}""".format(
             return file[object_path]
 
 
+def _open_files(files, custom_classes, allow_missing, options, num_open_workers):
+    """
+    Yields (file_path, object_path, hasbranches) for each of the ``files``, in
+    order, while up to ``num_open_workers`` of the following files are opened in
+    background threads. If the generator is closed early, the files that have
+    already been opened are closed.
+    """
+    if num_open_workers <= 1 or len(files) <= 1:
+        for file_path, object_path in files:
+            yield file_path, object_path, _regularize_object_path(
+                file_path, object_path, custom_classes, allow_missing, options
+            )
+        return
+
+    executor = uproot4.source.futures.ThreadPoolExecutor(
+        min(num_open_workers, len(files))
+    )
+    pending = []
+    index = 0
+    try:
+        while index < len(files) or len(pending) != 0:
+            while index < len(files) and len(pending) < num_open_workers:
+                file_path, object_path = files[index]
+                future = executor.submit(
+                    _regularize_object_path,
+                    file_path,
+                    object_path,
+                    custom_classes,
+                    allow_missing,
+                    options,
+                )
+                pending.append((file_path, object_path, future))
+                index += 1
+
+            file_path, object_path, future = pending.pop(0)
+            yield file_path, object_path, future.result()
+
+    finally:
+        for file_path, object_path, future in pending:
+            try:
+                hasbranches = future.result()
+            except Exception:
+                pass
+            else:
+                if hasbranches is not None:
+                    with hasbranches:
+                        pass
+        executor.shutdown()
+
+
+class _KeySet(object):
+    """
+    The set of ``keys(recursive=True, full_paths=False)`` of a
+    :py:class:`~uproot4.behavior.TBranch.HasBranches`, which is only filled
+    (deserializing all of the ``TBranches``) if a name is not found among the
+    direct subbranches.
+    """
+
+    def __init__(self, hasbranches):
+        self._hasbranches = hasbranches
+        self._keys = None
+
+    def _all(self):
+        if self._keys is None:
+            self._keys = set(
+                self._hasbranches.keys(recursive=True, full_paths=False)
+            )
+        return self._keys
+
+    def __contains__(self, key):
+        if self._keys is None:
+            if _name_index(self._hasbranches).position(key) is not None:
+                return True
+        return key in self._all()
+
+    def __iter__(self):
+        return iter(self._all())
+
+    def __len__(self):
+        return len(self._all())
+
+
 def _get_recursive(hasbranches, where):
-    for branch in hasbranches.branches:
-        if branch.name == where:
-            return branch
-        got = _get_recursive(branch, where)
+    index = _name_index(hasbranches)
+    # direct subbranches can be found without deserializing the others
+    position = index.position(where)
+    if position is not None:
+        return hasbranches.branches[position]
+    for position in index.parents():
+        got = _get_recursive(hasbranches.branches[position], where)
         if got is not None:
             return got
     else:
         return None
 
 
+class _NameIndex(object):
+    """
+    An index of the names of the subbranches of a
+    :py:class:`~uproot4.behavior.TBranch.HasBranches`, which is built once and
+    shared by ``__getitem__``, ``keys``, ``arrays``, ``iterate``, and ``lazy``.
+
+    The direct subbranches are indexed by name without deserializing them, and
+    a :py:class:`~uproot4._util.CompiledFilter` with literal prefixes only has
+    to be tested on names that start with one of them (found by bisection in a
+    sorted list of names). Subbranches that can't match and can't have
+    matching descendants are not deserialized: plain ``TBranch`` objects have
+    no subbranches of their own.
+    """
+
+    def __init__(self, hasbranches):
+        self._hasbranches = hasbranches
+        branches = hasbranches.branches
+        if isinstance(branches, uproot4.models.TObjArray.Model_TObjArrayOfTBranches):
+            self._names = branches.names
+            self._childless = set(
+                i for i, x in enumerate(branches.classnames) if x == "TBranch"
+            )
+        else:
+            self._names = [x.name for x in branches]
+            self._childless = set(
+                i for i, x in enumerate(branches) if len(x.branches) == 0
+            )
+
+        self._positions = {}
+        for i, name in enumerate(self._names):
+            if name not in self._positions:
+                self._positions[name] = i
+        self._sorted = sorted(
+            (name, i) for i, name in enumerate(self._names) if name is not None
+        )
+
+        self._entries = None
+
+    def names(self):
+        """
+        The names of the direct subbranches, without deserializing them.
+        """
+        return [x for x in self._names if x is not None]
+
+    def position(self, name):
+        """
+        The position of the first direct subbranch named ``name``, or None.
+        """
+        return self._positions.get(name)
+
+    def parents(self):
+        """
+        The positions of the direct subbranches that may have subbranches of
+        their own.
+        """
+        return [
+            i
+            for i in uproot4._util.range(len(self._names))
+            if i not in self._childless
+        ]
+
+    def entries(self):
+        """
+        All descendants in depth-first order (the order of
+        :py:meth:`~uproot4.behavior.TBranch.HasBranches.iteritems`) as
+        (full path, name, branch) triples. This deserializes all of them.
+        """
+        if self._entries is None:
+            entries = []
+            for branch in self._hasbranches.branches:
+                entries.append((branch.name, branch.name, branch))
+                for full, short, subbranch in _name_index(branch).entries():
+                    entries.append(
+                        ("{0}/{1}".format(branch.name, full), short, subbranch)
+                    )
+            self._entries = entries
+        return self._entries
+
+    def _starting_with(self, prefix):
+        i = bisect.bisect_left(self._sorted, (prefix,))
+        while i < len(self._sorted) and self._sorted[i][0].startswith(prefix):
+            yield self._sorted[i][1]
+            i += 1
+
+    def candidates(self, prefixes, recursive, full_paths):
+        """
+        Yields (key, branch) pairs in the order of
+        :py:meth:`~uproot4.behavior.TBranch.HasBranches.iteritems`, skipping
+        the ones whose key does not start with any of the ``prefixes`` (if
+        not None). The name filter still has to be applied to the others.
+        """
+        branches = self._hasbranches.branches
+
+        if prefixes is None or "" in prefixes:
+            if not recursive:
+                for i, name in enumerate(self._names):
+                    yield name, branches[i]
+            else:
+                for full, short, branch in self.entries():
+                    if full_paths:
+                        yield full, branch
+                    else:
+                        yield short, branch
+            return
+
+        matching = set()
+        for prefix in prefixes:
+            matching.update(self._starting_with(prefix))
+
+        if not recursive:
+            for i in sorted(matching):
+                yield self._names[i], branches[i]
+
+        elif full_paths:
+            # a full path starts with the name of a direct subbranch, so only
+            # the subbranches whose names can begin a match are needed
+            for prefix in prefixes:
+                for j, char in enumerate(prefix):
+                    if char == "/":
+                        for i in self._starting_with(prefix[:j]):
+                            if self._names[i] == prefix[:j]:
+                                matching.add(i)
+            for i in sorted(matching):
+                branch = branches[i]
+                yield branch.name, branch
+                for full, short, subbranch in _name_index(branch).entries():
+                    yield "{0}/{1}".format(branch.name, full), subbranch
+
+        else:
+            parents = set(self.parents())
+            for i, name in enumerate(self._names):
+                if i in matching:
+                    yield name, branches[i]
+                if i in parents:
+                    for k, v in _name_index(branches[i]).candidates(
+                        prefixes, True, False
+                    ):
+                        yield k, v
+
+
+def _name_index(hasbranches):
+    if hasbranches._name_index is None:
+        hasbranches._name_index = _NameIndex(hasbranches)
+    return hasbranches._name_index
+
+
 def _regularize_entries_start_stop(num_entries, entry_start, entry_stop):
     if entry_start is None:
         entry_start = 0
@@ -3143,6 +3736,429 @@ def _regularize_expressions(
     return arrays, expression_context, branchid_interpretation
 
 
+def _step_ranges_or_baskets(
+    expression_context, entry_start, entry_stop, previous_baskets, prefetcher=None
+):
+    ranges_or_baskets = []
+    for expression, context in expression_context:
+        branch = context.get("branch")
+        if branch is not None and not context["is_duplicate"]:
+            for basket_num, range_or_basket in branch.entries_to_ranges_or_baskets(
+                entry_start, entry_stop
+            ):
+                previous_basket = previous_baskets.get((branch.cache_key, basket_num))
+                if previous_basket is None and prefetcher is not None:
+                    previous_basket = prefetcher.take(branch, basket_num)
+                if previous_basket is None:
+                    ranges_or_baskets.append((branch, basket_num, range_or_basket))
+                else:
+                    ranges_or_baskets.append((branch, basket_num, previous_basket))
+    return ranges_or_baskets
+
+
+def _basket_cache_key(branch, basket_num):
+    return "{0}:{1}".format(branch.cache_key, basket_num)
+
+
+def _chunk_to_basket(
+    hasbranches, chunk, branch, basket_num, decompression_executor=None
+):
+    cursor = uproot4.source.cursor.Cursor(chunk.start)
+    return uproot4.models.TBasket.Model_TBasket.read(
+        chunk,
+        cursor,
+        {"basket_num": basket_num, "decompression_executor": decompression_executor},
+        hasbranches._file,
+        hasbranches._file,
+        branch,
+    )
+
+
+class _Prefetcher(object):
+    """
+    Requests the ``TBaskets`` of upcoming iteration steps before they are
+    needed, with one :py:meth:`~uproot4.source.chunk.Source.chunks` call per
+    step.
+
+    Prefetched ``TBaskets`` are held as :py:class:`~uproot4.source.chunk.Chunk`
+    objects or, if ``decompress``, as :py:class:`~uproot4.source.futures.Future`
+    objects that are decompressed on the ``decompression_executor`` as soon as
+    their chunk is filled (this object is the ``notifications`` of the
+    :py:meth:`~uproot4.source.chunk.Source.chunks` call).
+    """
+
+    def __init__(
+        self, hasbranches, steps, depth, decompress, memory, decompression_executor
+    ):
+        if decompress and isinstance(
+            decompression_executor, uproot4.source.futures.ProcessPoolExecutor
+        ):
+            raise ValueError(
+                "prefetch_decompress=True requires a thread-based "
+                "decompression_executor, not {0}, because the prefetched "
+                "TBaskets are decompressed in the process that reads them".format(
+                    repr(decompression_executor)
+                )
+            )
+        self._hasbranches = hasbranches
+        self._steps = steps
+        self._depth = depth
+        self._decompress = decompress
+        if memory is None:
+            self._memory = None
+        else:
+            self._memory = uproot4._util.memory_size(memory)
+        self._decompression_executor = decompression_executor
+        self._next_step = 0
+        self._prefetched = {}
+        self._num_bytes = 0
+        self._waiting = {}
+        self._filled = set()
+        self._lock = threading.Lock()
+
+    @property
+    def num_bytes(self):
+        """
+        The number of bytes of prefetched data that have not been taken yet.
+        """
+        return self._num_bytes
+
+    def advance(self, step_index, expression_context, previous_baskets):
+        """
+        Requests the ``TBaskets`` of step ``step_index`` (if not already
+        requested) and of as many of the next ``depth`` steps as fit within
+        the memory limit.
+        """
+        last = min(step_index + self._depth, len(self._steps) - 1)
+        while self._next_step <= last:
+            entry_start, entry_stop = self._steps[self._next_step]
+
+            requests = []
+            num_bytes = 0
+            for expression, context in expression_context:
+                branch = context.get("branch")
+                if branch is not None and not context["is_duplicate"]:
+                    for (
+                        basket_num,
+                        range_or_basket,
+                    ) in branch.entries_to_ranges_or_baskets(entry_start, entry_stop):
+                        key = (branch.cache_key, basket_num)
+                        if (
+                            isinstance(range_or_basket, tuple)
+                            and key not in previous_baskets
+                            and key not in self._prefetched
+                            and not self._in_basket_cache(branch, basket_num)
+                        ):
+                            start = int(range_or_basket[0])
+                            stop = int(range_or_basket[1])
+                            size = stop - start
+                            if self._decompress:
+                                size += branch.basket_uncompressed_bytes(basket_num)
+                            requests.append((branch, basket_num, start, stop, size))
+                            num_bytes += size
+
+            # the current step is always requested; later ones only if they fit
+            if (
+                self._next_step > step_index
+                and self._memory is not None
+                and self._num_bytes + num_bytes > self._memory
+            ):
+                break
+
+            self._request(requests)
+            self._next_step += 1
+
+    def _in_basket_cache(self, branch, basket_num):
+        basket_cache = self._hasbranches._file.basket_cache
+        return (
+            basket_cache is not None
+            and _basket_cache_key(branch, basket_num) in basket_cache
+        )
+
+    def _request(self, requests):
+        for branch, basket_num, start, stop, size in requests:
+            self._prefetched[branch.cache_key, basket_num] = (None, size)
+            self._num_bytes += size
+        if len(requests) == 0:
+            return
+
+        ranges = [(start, stop) for branch, basket_num, start, stop, size in requests]
+        chunks = self._hasbranches._file.source.chunks(ranges, notifications=self)
+
+        for (branch, basket_num, start, stop, size), chunk in zip(requests, chunks):
+            if self._decompress:
+                future = uproot4.source.futures.Future(
+                    _chunk_to_basket,
+                    (
+                        self._hasbranches,
+                        chunk,
+                        branch,
+                        basket_num,
+                        self._decompression_executor,
+                    ),
+                )
+                with self._lock:
+                    filled = (start, stop) in self._filled
+                    if filled:
+                        self._filled.discard((start, stop))
+                    else:
+                        self._waiting[start, stop] = future
+                if filled:
+                    self._decompression_executor.submit(future._run)
+                self._prefetched[branch.cache_key, basket_num] = (future, size)
+            else:
+                self._prefetched[branch.cache_key, basket_num] = (chunk, size)
+
+    def put(self, chunk):
+        """
+        Called by the :py:class:`~uproot4.source.chunk.Source` when a chunk is
+        filled; submits its decompression if ``decompress``.
+        """
+        if self._decompress:
+            with self._lock:
+                future = self._waiting.pop((chunk.start, chunk.stop), None)
+                if future is None:
+                    self._filled.add((chunk.start, chunk.stop))
+            if future is not None:
+                self._decompression_executor.submit(future._run)
+
+    def take(self, branch, basket_num):
+        """
+        Returns the prefetched :py:class:`~uproot4.source.chunk.Chunk` or
+        :py:class:`~uproot4.models.TBasket.Model_TBasket` for a ``TBasket`` and
+        forgets it, or returns None if it has not been prefetched.
+        """
+        item = self._prefetched.pop((branch.cache_key, basket_num), None)
+        if item is None:
+            return None
+        item, size = item
+        self._num_bytes -= size
+        if isinstance(item, uproot4.source.futures.Future):
+            return item.result()
+        else:
+            return item
+
+
+def _step_output(
+    hasbranches,
+    expression_context,
+    branchid_interpretation,
+    keys,
+    aliases,
+    language,
+    entry_start,
+    entry_stop,
+    decompression_executor,
+    interpretation_executor,
+    library,
+    how,
+    previous_baskets,
+    prefetcher=None,
+):
+    """
+    Reads all of the ``TBranches`` in one range of entries, evaluates the
+    expressions (applying the ``cut``, if any), and returns the grouped output.
+    The ``TBaskets`` that continue past ``entry_stop`` are kept in
+    ``previous_baskets``.
+    """
+    ranges_or_baskets = _step_ranges_or_baskets(
+        expression_context, entry_start, entry_stop, previous_baskets, prefetcher
+    )
+
+    arrays = {}
+    _ranges_or_baskets_to_arrays(
+        hasbranches,
+        ranges_or_baskets,
+        branchid_interpretation,
+        entry_start,
+        entry_stop,
+        decompression_executor,
+        interpretation_executor,
+        library,
+        arrays,
+    )
+
+    output = language.compute_expressions(
+        arrays,
+        expression_context,
+        keys,
+        aliases,
+        hasbranches.file.file_path,
+        hasbranches.object_path,
+    )
+
+    primary_context = [
+        (e, c) for e, c in expression_context if c["is_primary"] and not c["is_cut"]
+    ]
+
+    for branch, basket_num, basket in ranges_or_baskets:
+        if basket is not None:
+            previous_baskets[branch.cache_key, basket_num] = basket
+
+    return library.group(output, primary_context, how)
+
+
+def _statistics_ranges(hasbranches, cut, aliases, entry_start, entry_stop):
+    """
+    Returns the (start, stop) ranges of entries that may pass the ``cut``,
+    according to the :py:class:`~uproot4.statistics.BasketStatistics` in the
+    file's ``statistics_dir``, or None if there are no statistics or they can't
+    rule out any entries.
+    """
+    directory = hasbranches.file.options["statistics_dir"]
+    if directory is None or entry_start >= entry_stop:
+        return None
+    statistics = uproot4.statistics.BasketStatistics.load(
+        directory, hasbranches.file.hex_uuid
+    )
+    if statistics is None:
+        return None
+    return statistics.entry_ranges(hasbranches, cut, aliases, entry_start, entry_stop)
+
+
+def _cut_first_arrays(
+    hasbranches,
+    expression_context,
+    branchid_interpretation,
+    cut,
+    keys,
+    aliases,
+    language,
+    entry_start,
+    entry_stop,
+    decompression_executor,
+    interpretation_executor,
+    library,
+    how,
+    previous_baskets,
+):
+    """
+    Reads only the ``TBranches`` that the ``cut`` needs, evaluates it, and then
+    reads the other ``TBranches`` only in ranges of entries that have surviving
+    entries, skipping ``TBaskets`` that have none.
+
+    Returns the grouped output, or None if the ``cut`` can't be evaluated as a
+    flat array of booleans (one per entry), in which case the caller reads
+    everything as usual. Either way, the ``TBaskets`` that were read are in
+    ``previous_baskets``.
+    """
+    cut_context = []
+    cut_interpretation = {}
+    _regularize_expression(
+        hasbranches,
+        cut,
+        keys,
+        aliases,
+        language,
+        (lambda branchname, interpretation: None),
+        {},
+        cut_context,
+        cut_interpretation,
+        (),
+        True,
+    )
+    if all(x in cut_interpretation for x in branchid_interpretation):
+        return None
+    cut_interpretation = dict(
+        (x, branchid_interpretation[x]) for x in cut_interpretation
+    )
+
+    # phase 1: the cut
+    cut_arrays = {}
+    ranges_or_baskets = _step_ranges_or_baskets(
+        cut_context, entry_start, entry_stop, previous_baskets
+    )
+    _ranges_or_baskets_to_arrays(
+        hasbranches,
+        ranges_or_baskets,
+        cut_interpretation,
+        entry_start,
+        entry_stop,
+        decompression_executor,
+        interpretation_executor,
+        library,
+        cut_arrays,
+        keep_baskets=True,
+    )
+    for branch, basket_num, basket in ranges_or_baskets:
+        previous_baskets[branch.cache_key, basket_num] = basket
+
+    mask = language.compute_expressions(
+        cut_arrays,
+        [(e, dict(c, is_cut=False)) for e, c in cut_context],
+        keys,
+        aliases,
+        hasbranches.file.file_path,
+        hasbranches.object_path,
+    )[cut]
+    try:
+        mask = numpy.asarray(mask)
+    except Exception:
+        return None
+    if mask.shape != (entry_stop - entry_start,) or mask.dtype == numpy.dtype(object):
+        return None
+
+    survivors = numpy.nonzero(mask)[0] + entry_start
+    if len(survivors) == 0:
+        # read one entry that fails the cut to get empty arrays of the right type
+        survivors = numpy.array([entry_start])
+
+    # phase 2: ranges of entries with survivors, split wherever any TBranch has
+    # a TBasket without survivors
+    split = numpy.zeros(len(survivors) - 1, numpy.bool_)
+    for branch in _expression_branches(expression_context):
+        basket_nums = numpy.searchsorted(branch.entry_offsets, survivors, side="right")
+        split |= basket_nums[1:] - basket_nums[:-1] > 1
+    split = numpy.nonzero(split)[0]
+    starts = survivors[numpy.concatenate([[0], split + 1])]
+    stops = survivors[numpy.concatenate([split, [len(survivors) - 1]])] + 1
+
+    primary_context = [
+        (e, c) for e, c in expression_context if c["is_primary"] and not c["is_cut"]
+    ]
+    all_arrays = []
+    for sub_entry_start, sub_entry_stop in zip(starts.tolist(), stops.tolist()):
+        ranges_or_baskets = _step_ranges_or_baskets(
+            expression_context, sub_entry_start, sub_entry_stop, previous_baskets
+        )
+        arrays = {}
+        _ranges_or_baskets_to_arrays(
+            hasbranches,
+            ranges_or_baskets,
+            branchid_interpretation,
+            sub_entry_start,
+            sub_entry_stop,
+            decompression_executor,
+            interpretation_executor,
+            library,
+            arrays,
+        )
+        for branch, basket_num, basket in ranges_or_baskets:
+            if basket is not None:
+                previous_baskets[branch.cache_key, basket_num] = basket
+
+        output = language.compute_expressions(
+            arrays,
+            expression_context,
+            keys,
+            aliases,
+            hasbranches.file.file_path,
+            hasbranches.object_path,
+        )
+        all_arrays.append(library.group(output, primary_context, how))
+
+    # keep only the TBaskets that continue past this range of entries
+    for key in list(previous_baskets):
+        branch, basket_num = previous_baskets[key].parent, key[1]
+        if branch.entry_offsets[basket_num + 1] <= entry_stop:
+            del previous_baskets[key]
+
+    if len(all_arrays) == 1:
+        return all_arrays[0]
+    else:
+        return library.concatenate(all_arrays)
+
+
 def _ranges_or_baskets_to_arrays(
     hasbranches,
     ranges_or_baskets,
@@ -3153,33 +4169,65 @@ def _ranges_or_baskets_to_arrays(
     interpretation_executor,
     library,
     arrays,
+    keep_baskets=False,
 ):
     notifications = queue.Queue()
+    basket_cache = hasbranches._file.basket_cache
 
     branchid_arrays = {}
     branchid_num_baskets = {}
+    branchid_preallocated = {}
     ranges = []
     range_args = {}
     range_original_index = {}
+    basket_original_index = {}
     original_index = 0
 
     for branch, basket_num, range_or_basket in ranges_or_baskets:
         if branch.cache_key not in branchid_arrays:
             branchid_arrays[branch.cache_key] = {}
             branchid_num_baskets[branch.cache_key] = 0
+
+            # numerical TBaskets are copied into the final array as they arrive
+            interpretation = branchid_interpretation[branch.cache_key]
+            if isinstance(interpretation, uproot4.interpretation.numerical.AsDtype):
+                branchid_preallocated[branch.cache_key] = interpretation.preallocate(
+                    entry_start, entry_stop, branch.entry_offsets, library
+                )
+
         branchid_num_baskets[branch.cache_key] += 1
+        basket_original_index[branch.cache_key, basket_num] = original_index
+
+        if basket_cache is not None and not isinstance(
+            range_or_basket, uproot4.models.TBasket.Model_TBasket
+        ):
+            basket = basket_cache.get(_basket_cache_key(branch, basket_num))
+            if basket is not None:
+                range_or_basket = basket
+                ranges_or_baskets[original_index] = branch, basket_num, basket
 
         if isinstance(range_or_basket, tuple) and len(range_or_basket) == 2:
             range_or_basket = (int(range_or_basket[0]), int(range_or_basket[1]))
             ranges.append(range_or_basket)
             range_args[range_or_basket] = (branch, basket_num)
             range_original_index[range_or_basket] = original_index
+        elif isinstance(range_or_basket, uproot4.source.chunk.Chunk):
+            chunk = range_or_basket
+            range_args[(chunk.start, chunk.stop)] = (branch, basket_num)
+            range_original_index[(chunk.start, chunk.stop)] = original_index
+            notifications.put(chunk)
         else:
-            notifications.put(range_or_basket)
+            basket = range_or_basket
+            if basket_cache is not None and not basket.is_embedded:
+                key = _basket_cache_key(branch, basket_num)
+                if key not in basket_cache:
+                    basket_cache[key] = basket
+            notifications.put(basket)
 
         original_index += 1
 
-    hasbranches._file.source.chunks(ranges, notifications=notifications)
+    if len(ranges) != 0:
+        hasbranches._file.source.chunks(ranges, notifications=notifications)
 
     def replace(ranges_or_baskets, original_index, basket):
         branch, basket_num, range_or_basket = ranges_or_baskets[original_index]
@@ -3187,15 +4235,11 @@ def _ranges_or_baskets_to_arrays(
 
     def chunk_to_basket(chunk, branch, basket_num):
         try:
-            cursor = uproot4.source.cursor.Cursor(chunk.start)
-            basket = uproot4.models.TBasket.Model_TBasket.read(
-                chunk,
-                cursor,
-                {"basket_num": basket_num},
-                hasbranches._file,
-                hasbranches._file,
-                branch,
+            basket = _chunk_to_basket(
+                hasbranches, chunk, branch, basket_num, decompression_executor
             )
+            if basket_cache is not None:
+                basket_cache[_basket_cache_key(branch, basket_num)] = basket
             original_index = range_original_index[(chunk.start, chunk.stop)]
             replace(ranges_or_baskets, original_index, basket)
         except Exception:
@@ -3203,14 +4247,71 @@ def _ranges_or_baskets_to_arrays(
         else:
             notifications.put(basket)
 
+    def store_basket_array(branch, basket_num, num_entries, basket_array):
+        interpretation = branchid_interpretation[branch.cache_key]
+        basket_arrays = branchid_arrays[branch.cache_key]
+
+        if num_entries != len(basket_array):
+            raise ValueError(
+                """basket {0} in tree/branch {1} has the wrong number of entries """
+                """(expected {2}, obtained {3}) when interpreted as {4}
+    in file {5}""".format(
+                    basket_num,
+                    branch.object_path,
+                    num_entries,
+                    len(basket_array),
+                    interpretation,
+                    branch.file.file_path,
+                )
+            )
+
+        preallocated = branchid_preallocated.get(branch.cache_key)
+        if preallocated is not None:
+            basket_array = interpretation.fill(
+                preallocated,
+                basket_num,
+                basket_array,
+                entry_start,
+                entry_stop,
+                branch.entry_offsets,
+            )
+            if not keep_baskets and branch.entry_offsets[basket_num + 1] <= entry_stop:
+                # no later step of iterate needs this TBasket, so let it go
+                replace(
+                    ranges_or_baskets,
+                    basket_original_index[branch.cache_key, basket_num],
+                    None,
+                )
+
+        basket_arrays[basket_num] = basket_array
+        if len(basket_arrays) == branchid_num_baskets[branch.cache_key]:
+            if preallocated is None:
+                arrays[branch.cache_key] = interpretation.final_array(
+                    basket_arrays,
+                    entry_start,
+                    entry_stop,
+                    branch.entry_offsets,
+                    library,
+                    branch,
+                )
+            else:
+                arrays[branch.cache_key] = interpretation.final_array(
+                    basket_arrays,
+                    entry_start,
+                    entry_stop,
+                    branch.entry_offsets,
+                    library,
+                    branch,
+                    preallocated=preallocated,
+                )
+
     def basket_to_array(basket):
         try:
             assert basket.basket_num is not None
             branch = basket.parent
             interpretation = branchid_interpretation[branch.cache_key]
-            basket_arrays = branchid_arrays[branch.cache_key]
 
-            basket_arrays[basket.basket_num] = interpretation.basket_array(
+            basket_array = interpretation.basket_array(
                 basket.data,
                 basket.byte_offsets,
                 basket,
@@ -3219,45 +4320,74 @@ def _ranges_or_baskets_to_arrays(
                 basket.member("fKeylen"),
                 library,
             )
-            if basket.num_entries != len(basket_arrays[basket.basket_num]):
-                raise ValueError(
-                    """basket {0} in tree/branch {1} has the wrong number of entries """
-                    """(expected {2}, obtained {3}) when interpreted as {4}
-    in file {5}""".format(
-                        basket.basket_num,
-                        branch.object_path,
-                        basket.num_entries,
-                        len(basket_arrays[basket.basket_num]),
-                        interpretation,
-                        branch.file.file_path,
-                    )
-                )
-
-            if len(basket_arrays) == branchid_num_baskets[branch.cache_key]:
-                arrays[branch.cache_key] = interpretation.final_array(
-                    basket_arrays,
-                    entry_start,
-                    entry_stop,
-                    branch.entry_offsets,
-                    library,
-                    branch,
-                )
+            store_basket_array(
+                branch, basket.basket_num, basket.num_entries, basket_array
+            )
         except Exception:
             notifications.put(sys.exc_info())
         else:
             notifications.put(None)
 
+    in_processes = isinstance(
+        decompression_executor, uproot4.source.futures.ProcessPoolExecutor
+    ) and uproot4._util.isstr(hasbranches._file.file_path)
+
+    # the closures below can't be pickled, so if the workers can't reopen the
+    # file by path, decompress and interpret in this thread instead
+    if not in_processes and isinstance(
+        decompression_executor, uproot4.source.futures.ProcessPoolExecutor
+    ):
+        decompression_executor = uproot4.source.futures.TrivialExecutor()
+    if isinstance(interpretation_executor, uproot4.source.futures.ProcessPoolExecutor):
+        interpretation_executor = uproot4.source.futures.TrivialExecutor()
+
+    def chunk_to_process(chunk, branch, basket_num):
+        future = decompression_executor.submit(
+            _process_basket_array,
+            _ProcessBranch(branch),
+            basket_num,
+            chunk.start,
+            chunk.stop,
+            chunk.raw_data,
+            _process_interpretation(branch, branchid_interpretation[branch.cache_key]),
+            library.name,
+        )
+        future.add_done_callback(
+            lambda future: notifications.put(
+                _ProcessedBasket(branch, basket_num, future)
+            )
+        )
+
+    def process_to_array(processed):
+        try:
+            num_entries, basket_array = processed.result()
+            store_basket_array(
+                processed.branch, processed.basket_num, num_entries, basket_array
+            )
+        except Exception:
+            notifications.put(sys.exc_info())
+
     while len(arrays) < len(branchid_interpretation):
         obj = notifications.get()
 
         if isinstance(obj, uproot4.source.chunk.Chunk):
             chunk = obj
             args = range_args[(chunk.start, chunk.stop)]
-            decompression_executor.submit(chunk_to_basket, chunk, *args)
+            if in_processes:
+                chunk_to_process(chunk, *args)
+            else:
+                decompression_executor.submit(chunk_to_basket, chunk, *args)
 
         elif isinstance(obj, uproot4.models.TBasket.Model_TBasket):
             basket = obj
-            interpretation_executor.submit(basket_to_array, basket)
+            if in_processes:
+                # already in this process (e.g. embedded TBaskets)
+                basket_to_array(basket)
+            else:
+                interpretation_executor.submit(basket_to_array, basket)
+
+        elif isinstance(obj, _ProcessedBasket):
+            process_to_array(obj)
 
         elif obj is None:
             pass
@@ -3269,18 +4399,108 @@ def _ranges_or_baskets_to_arrays(
             raise AssertionError(obj)
 
 
+class _ProcessBranch(object):
+    """
+    Pickleable reference to a ``TBranch``, which is found again in a worker
+    process by opening its file by path.
+    """
+
+    def __init__(self, branch):
+        self.file_path = branch.file.file_path
+        self.options = dict(branch.file.options)
+        self.hex_uuid = branch.file.hex_uuid
+        self.tree_path = branch.tree.object_path
+        self.indexes = []
+        while branch is not branch.tree:
+            self.indexes.insert(0, branch.index)
+            branch = branch.parent
+
+    def branch(self):
+        file = _process_files.get(self.file_path)
+        if file is None or file.hex_uuid != self.hex_uuid:
+            if file is not None:
+                file.close()
+            file = uproot4.reading.ReadOnlyFile(
+                self.file_path,
+                object_cache=None,
+                array_cache=None,
+                **self.options  # NOTE: a comma after **options breaks Python 2
+            )
+            _process_files[self.file_path] = file
+
+        out = file.root_directory[self.tree_path]
+        for index in self.indexes:
+            out = out.branches[index]
+        return out
+
+
+_process_files = {}
+
+
+def _process_interpretation(branch, interpretation):
+    # generated Model classes can't be pickled, but the worker's own TBranch has
+    # the same default interpretation
+    if interpretation.cache_key == branch.interpretation.cache_key:
+        return None
+    else:
+        return interpretation
+
+
+def _process_basket_array(
+    process_branch, basket_num, start, stop, raw_data, interpretation, library
+):
+    branch = process_branch.branch()
+    if interpretation is None:
+        interpretation = branch.interpretation
+    library = uproot4.interpretation.library._regularize_library(library)
+
+    chunk = uproot4.source.chunk.Chunk(
+        branch.file.source, start, stop, uproot4.source.futures.NoFuture(raw_data)
+    )
+    basket = _chunk_to_basket(branch, chunk, branch, basket_num)
+    basket_array = interpretation.basket_array(
+        basket.data,
+        basket.byte_offsets,
+        basket,
+        branch,
+        branch.context,
+        basket.member("fKeylen"),
+        library,
+    )
+
+    return basket.num_entries, basket_array
+
+
+class _ProcessedBasket(object):
+    def __init__(self, branch, basket_num, future):
+        self.branch = branch
+        self.basket_num = basket_num
+        self._future = future
+
+    def result(self):
+        return self._future.result()
+
+
+def _expression_branches(expression_context):
+    # only the TBranches that are used, so that the others are not deserialized
+    return [
+        context["branch"]
+        for expression, context in expression_context
+        if context.get("branch") is not None and not context["is_duplicate"]
+    ]
+
+
 def _hasbranches_num_entries_for(
-    hasbranches, target_num_bytes, entry_start, entry_stop, branchid_interpretation
+    hasbranches, target_num_bytes, entry_start, entry_stop, branches
 ):
     total_bytes = 0.0
-    for branch in hasbranches.itervalues(recursive=True):
-        if branch.cache_key in branchid_interpretation:
-            entry_offsets = branch.entry_offsets
-            start = entry_offsets[0]
-            for basket_num, stop in enumerate(entry_offsets[1:]):
-                if entry_start < stop and start <= entry_stop:
-                    total_bytes += branch.basket_compressed_bytes(basket_num)
-                start = stop
+    for branch in branches:
+        entry_offsets = branch.entry_offsets
+        start = entry_offsets[0]
+        for basket_num, stop in enumerate(entry_offsets[1:]):
+            if entry_start < stop and start <= entry_stop:
+                total_bytes += branch.basket_compressed_bytes(basket_num)
+            start = stop
 
     total_entries = entry_stop - entry_start
     num_entries = int(round(target_num_bytes * total_entries / total_bytes))
@@ -3290,19 +4510,79 @@ def _hasbranches_num_entries_for(
         return num_entries
 
 
-def _regularize_step_size(
-    hasbranches, step_size, entry_start, entry_stop, branchid_interpretation
-):
+def _regularize_step_size(hasbranches, step_size, entry_start, entry_stop, branches):
     if uproot4._util.isint(step_size):
         return step_size
     target_num_bytes = uproot4._util.memory_size(
         step_size,
-        "number of entries or memory size string with units "
-        "(such as '100 MB') required, not {0}".format(repr(step_size)),
+        "number of entries, memory size string with units (such as '100 MB' "
+        "or '100 MB aligned'), or 'cluster' required, not {0}".format(
+            repr(step_size)
+        ),
     )
     return _hasbranches_num_entries_for(
-        hasbranches, target_num_bytes, entry_start, entry_stop, branchid_interpretation
+        hasbranches, target_num_bytes, entry_start, entry_stop, branches
+    )
+
+
+_aligned_suffix = re.compile(r"\s+aligned\s*$", re.I)
+
+
+def _hasbranches_common_boundaries(hasbranches, entry_start, entry_stop, branches):
+    common = None
+    for branch in branches:
+        if common is None:
+            common = set(branch.entry_offsets)
+        else:
+            common.intersection_update(branch.entry_offsets)
+    if common is None:
+        common = set()
+    common = [x for x in common if entry_start < x < entry_stop]
+    return sorted(common) + [entry_stop]
+
+
+def _regularize_steps(hasbranches, step_size, entry_start, entry_stop, branches):
+    if entry_start >= entry_stop:
+        return []
+
+    aligned = False
+    if uproot4._util.isstr(step_size):
+        if step_size.strip().lower() == "cluster":
+            boundaries = _hasbranches_common_boundaries(
+                hasbranches, entry_start, entry_stop, branches
+            )
+            return list(zip([entry_start] + boundaries[:-1], boundaries))
+
+        if _aligned_suffix.search(step_size) is not None:
+            aligned = True
+            step_size = _aligned_suffix.sub("", step_size)
+
+    entry_step = _regularize_step_size(
+        hasbranches, step_size, entry_start, entry_stop, branches
+    )
+
+    if not aligned:
+        return [
+            (sub_entry_start, min(sub_entry_start + entry_step, entry_stop))
+            for sub_entry_start in uproot4._util.range(
+                entry_start, entry_stop, entry_step
+            )
+        ]
+
+    # largest run of whole clusters within entry_step, but at least one cluster
+    boundaries = _hasbranches_common_boundaries(
+        hasbranches, entry_start, entry_stop, branches
     )
+    steps = []
+    sub_entry_start = entry_start
+    index = 0
+    while sub_entry_start < entry_stop:
+        stop_index = bisect.bisect_right(boundaries, sub_entry_start + entry_step)
+        stop_index = max(stop_index - 1, index)
+        steps.append((sub_entry_start, boundaries[stop_index]))
+        sub_entry_start = boundaries[stop_index]
+        index = stop_index + 1
+    return steps
 
 
 class _WrapDict(MutableMapping):
@@ -127,4 +127,5 @@ class TTree(uproot4.behaviors.TBranch.HasBranches):
     def postprocess(self, chunk, cursor, context, file):
         self._chunk = chunk
         self._lookup = {}
+        self._name_index = None
         return self
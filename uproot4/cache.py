@@ -9,10 +9,24 @@ policy that limits the number of items in the cache (used as an
 
 The :py:class:`~uproot4.cache.LRUArrayCache` implements the same policy, limiting the
 total number of bytes, as reported by ``nbytes``.
+
+The :py:class:`~uproot4.cache.TwoQueueArrayCache` also limits the total number
+of bytes, but with the scan-resistant "2Q" policy, which keeps arrays that are
+used repeatedly when many other arrays are used once.
+
+The :py:class:`~uproot4.cache.DiskArrayCache` stores arrays in a directory, so
+that they can be memory-mapped by later processes instead of being read again.
 """
 
 from __future__ import absolute_import
 
+import hashlib
+import itertools
+import json
+import os
+import re
+import shutil
+import tempfile
 import threading
 
 try:
@@ -20,7 +34,50 @@ try:
 except ImportError:
     from collections import MutableMapping
 
+import numpy
+
 import uproot4._util
+import uproot4.extras
+
+
+_PREV, _NEXT, _KEY, _VALUE, _SIZE, _TICK = 0, 1, 2, 3, 4, 5
+
+
+class _Shard(object):
+    """
+    One lock, one hash map, and one circular doubly linked list, ordered from
+    least-recently used (``root[_NEXT]``) to most-recently used
+    (``root[_PREV]``), so that getting, setting, and evicting are O(1).
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.current = 0
+        self.data = {}
+        self.root = []
+        self.root[:] = [self.root, self.root, None, None, 0, None]
+        self.lock = threading.Lock()
+        self.num_hits = 0
+        self.num_misses = 0
+        self.num_evictions = 0
+        self.num_evicted = 0
+
+    def unlink(self, node):
+        node[_PREV][_NEXT] = node[_NEXT]
+        node[_NEXT][_PREV] = node[_PREV]
+
+    def append(self, node):
+        last = self.root[_PREV]
+        node[_PREV] = last
+        node[_NEXT] = self.root
+        last[_NEXT] = node
+        self.root[_PREV] = node
+
+    def nodes(self):
+        node = self.root[_NEXT]
+        while node is not self.root:
+            yield node
+            node = node[_NEXT]
 
 
 class LRUCache(MutableMapping):
@@ -28,6 +85,10 @@ class LRUCache(MutableMapping):
     Args:
         limit (None or int): Number of objects to allow in the cache before
             evicting the least-recently used. If None, this cache never evicts.
+        shards (int): Number of independently locked parts of the cache. Each
+            key is assigned to a shard by its hash and each shard holds an
+            equal part of the ``limit``. The default, 1, is an exact
+            least-recently used cache.
 
     LRUCache is a ``MutableMapping`` that evicts the least-recently used
     objects when the ``current`` number of objects exceeds the ``limit``.
@@ -36,7 +97,14 @@ class LRUCache(MutableMapping):
     square bracket subscripting.
 
     LRUCache is thread-safe for all options: getting, setting, deleting,
-    iterating, listing keys, values, and items.
+    iterating, listing keys, values, and items. Getting, setting, and evicting
+    take constant time, regardless of the number of items in the cache. With
+    more than one shard, threads that access keys in different shards do not
+    wait for each other, but each shard evicts its own least-recently used
+    items, so the eviction order is only approximately global.
+
+    The ``num_hits``, ``num_misses``, and ``num_evictions`` counters can be
+    polled to monitor the cache's effectiveness.
 
     This cache is insensitive to the size of the objects it stores, and hence
     is a better ``object_cache`` than an ``array_cache``.
@@ -49,18 +117,24 @@ class LRUCache(MutableMapping):
         """
         return 1
 
-    def __init__(self, limit):
+    def __init__(self, limit, shards=1):
+        if not uproot4._util.isint(shards) or shards < 1:
+            raise ValueError("shards must be a positive integer")
         self._limit = limit
-        self._current = 0
-        self._order = []
-        self._data = {}
-        self._lock = threading.Lock()
+        if limit is None:
+            self._shards = [_Shard(None) for i in uproot4._util.range(shards)]
+        else:
+            self._shards = [
+                _Shard(limit // shards + (1 if i < limit % shards else 0))
+                for i in uproot4._util.range(shards)
+            ]
+        self._tick = itertools.count()
 
     def __repr__(self):
         if self._limit is None:
             limit = "(no limit)"
         else:
-            limit = "({0}/{1} full)".format(self._current, self._limit)
+            limit = "({0}/{1} full)".format(self.current, self._limit)
         return "<LRUCache {0} at 0x{1:012x}>".format(limit, id(self))
 
     @property
@@ -76,7 +150,55 @@ class LRUCache(MutableMapping):
         """
         Current number of items in the cache.
         """
-        return self._current
+        return sum(shard.current for shard in self._shards)
+
+    @property
+    def shards(self):
+        """
+        Number of independently locked parts of the cache.
+        """
+        return len(self._shards)
+
+    @property
+    def num_hits(self):
+        """
+        Number of times an item was requested and found in the cache.
+        """
+        return sum(shard.num_hits for shard in self._shards)
+
+    @property
+    def num_misses(self):
+        """
+        Number of times an item was requested and not found in the cache.
+        """
+        return sum(shard.num_misses for shard in self._shards)
+
+    @property
+    def num_evictions(self):
+        """
+        Number of items that have been evicted to stay within the ``limit``.
+        (Items that are explicitly deleted or replaced are not counted.)
+        """
+        return sum(shard.num_evictions for shard in self._shards)
+
+    def _shard(self, where):
+        if len(self._shards) == 1:
+            return self._shards[0]
+        else:
+            return self._shards[hash(where) % len(self._shards)]
+
+    def _nodes(self):
+        if len(self._shards) == 1:
+            shard = self._shards[0]
+            with shard.lock:
+                return list(shard.nodes())
+        else:
+            out = []
+            for shard in self._shards:
+                with shard.lock:
+                    out.extend(shard.nodes())
+            out.sort(key=lambda node: node[_TICK])
+            return out
 
     def keys(self):
         """
@@ -89,8 +211,7 @@ class LRUCache(MutableMapping):
 
         (Calling this method does not change the order.)
         """
-        with self._lock:
-            return list(self._order)
+        return [node[_KEY] for node in self._nodes()]
 
     def values(self):
         """
@@ -103,8 +224,7 @@ class LRUCache(MutableMapping):
 
         (Calling this method does not change the order.)
         """
-        with self._lock:
-            return [self._data[where] for where in self._order]
+        return [node[_VALUE] for node in self._nodes()]
 
     def items(self):
         """
@@ -117,45 +237,63 @@ class LRUCache(MutableMapping):
 
         (Calling this method does not change the order.)
         """
-        with self._lock:
-            return [(where, self._data[where]) for where in self._order]
+        return [(node[_KEY], node[_VALUE]) for node in self._nodes()]
 
     def __getitem__(self, where):
-        with self._lock:
-            out = self._data[where]
-            self._order.remove(where)
-            self._order.append(where)
-            return out
+        shard = self._shard(where)
+        with shard.lock:
+            node = shard.data.get(where)
+            if node is None:
+                shard.num_misses += 1
+                raise KeyError(where)
+            shard.num_hits += 1
+            shard.unlink(node)
+            shard.append(node)
+            node[_TICK] = next(self._tick)
+            return node[_VALUE]
 
     def __setitem__(self, where, what):
-        with self._lock:
-            if where in self._data:
-                self._order.remove(where)
-            self._order.append(where)
-            self._data[where] = what
-            self._current += self.sizeof(what)
-
-            if self._limit is not None:
-                while self._current > self._limit and len(self._order) > 0:
-                    key = self._order.pop(0)
-                    self._current -= self.sizeof(self._data[key])
-                    del self._data[key]
+        shard = self._shard(where)
+        size = self.sizeof(what)
+        with shard.lock:
+            node = shard.data.get(where)
+            if node is not None:
+                shard.unlink(node)
+                shard.current -= node[_SIZE]
+            node = [None, None, where, what, size, next(self._tick)]
+            shard.append(node)
+            shard.data[where] = node
+            shard.current += size
+
+            if shard.limit is not None:
+                root = shard.root
+                while shard.current > shard.limit and root[_NEXT] is not root:
+                    oldest = root[_NEXT]
+                    shard.unlink(oldest)
+                    del shard.data[oldest[_KEY]]
+                    shard.current -= oldest[_SIZE]
+                    shard.num_evictions += 1
+                    shard.num_evicted += oldest[_SIZE]
 
     def __delitem__(self, where):
-        with self._lock:
-            self._current -= self.sizeof(self._data[where])
-            del self._data[where]
-            self._order.remove(where)
+        shard = self._shard(where)
+        with shard.lock:
+            node = shard.data.pop(where)
+            shard.unlink(node)
+            shard.current -= node[_SIZE]
+
+    def __contains__(self, where):
+        # does not change the order or count as a hit or miss
+        shard = self._shard(where)
+        with shard.lock:
+            return where in shard.data
 
     def __iter__(self):
-        with self._lock:
-            order = list(self._order)
-        for x in order:
-            yield x
+        for node in self._nodes():
+            yield node[_KEY]
 
     def __len__(self):
-        with self._lock:
-            return len(self._order)
+        return sum(len(shard.data) for shard in self._shards)
 
 
 class LRUArrayCache(LRUCache):
@@ -165,6 +303,9 @@ class LRUArrayCache(LRUCache):
             before evicting the least-recently used. An integer is interpreted
             as a number of bytes and a string must be a number followed by a
             unit, such as "100 MB". If None, this cache never evicts.
+        shards (int): Number of independently locked parts of the cache. Each
+            key is assigned to a shard by its hash and each shard holds an
+            equal part of the ``limit``.
 
     LRUArrayCache is a ``MutableMapping`` that evicts the least-recently used
     objects when the ``current`` number of bytes exceeds the ``limit``. The
@@ -175,7 +316,9 @@ class LRUArrayCache(LRUCache):
     square bracket subscripting.
 
     LRUArrayCache is thread-safe for all options: getting, setting, deleting,
-    iterating, listing keys, values, and items.
+    iterating, listing keys, values, and items. Like
+    :py:class:`~uproot4.cache.LRUCache`, it counts hits, misses, evictions,
+    and evicted bytes (``num_evicted_bytes``).
 
     This cache is sensitive to the size of the objects it stores, but only if
     those objects have meaningful ``nbytes``. It is therefore a better
@@ -202,18 +345,18 @@ class LRUArrayCache(LRUCache):
                 return tmp.sum()
         return cls.default_nbytes
 
-    def __init__(self, limit_bytes):
+    def __init__(self, limit_bytes, shards=1):
         if limit_bytes is None:
             limit = None
         else:
             limit = uproot4._util.memory_size(limit_bytes)
-        super(LRUArrayCache, self).__init__(limit)
+        super(LRUArrayCache, self).__init__(limit, shards)
 
     def __repr__(self):
         if self._limit is None:
             limit = "(no limit)"
         else:
-            limit = "({0}/{1} bytes full)".format(self._current, self._limit)
+            limit = "({0}/{1} bytes full)".format(self.current, self._limit)
         return "<LRUArrayCache {0} at 0x{1:012x}>".format(limit, id(self))
 
     @property
@@ -229,4 +372,587 @@ class LRUArrayCache(LRUCache):
         """
         Current number of bytes in the cache.
         """
-        return self._current
+        return super(LRUArrayCache, self).current
+
+    @property
+    def num_evicted_bytes(self):
+        """
+        Number of bytes in items that have been evicted to stay within the
+        ``limit``.
+        """
+        return sum(shard.num_evicted for shard in self._shards)
+
+
+class TwoQueueArrayCache(MutableMapping):
+    """
+    Args:
+        limit_bytes (None, int, or str): Amount of data to allow in the cache
+            before evicting. An integer is interpreted as a number of bytes and
+            a string must be a number followed by a unit, such as "100 MB". If
+            None, this cache never evicts.
+        probation_fraction (float): Fraction of ``limit_bytes`` for objects
+            that have been used only once, before they are evicted by newer
+            objects that have been used only once.
+        ghost_factor (float): Multiple of ``limit_bytes`` (counting the sizes
+            of the evicted objects) for the keys of recently evicted objects,
+            which are remembered without their values. A larger factor
+            promotes objects that are used again after longer scans.
+
+    TwoQueueArrayCache is a ``MutableMapping`` with the same interface as
+    :py:class:`~uproot4.cache.LRUArrayCache`, but with the "2Q" policy, which
+    resists scans: a single pass over a large dataset does not evict the
+    objects that are used repeatedly.
+
+    A new object enters a first-in, first-out "probation" queue. If it is used
+    again while in probation, or set again shortly after being evicted from
+    probation (while its key is still remembered), it is promoted to a
+    least-recently used "main" queue. When the ``current`` number of bytes
+    exceeds the ``limit``, objects are evicted from probation while it holds
+    more than ``probation_fraction`` of the limit, and from the least-recently
+    used end of the main queue otherwise.
+
+    This makes it a better ``array_cache`` than
+    :py:class:`~uproot4.cache.LRUArrayCache` for
+    :py:func:`~uproot4.behavior.TBranch.lazy` arrays, in which a small set of
+    arrays (such as those used in a cut) is used again and again while other
+    arrays are used once.
+
+    TwoQueueArrayCache is thread-safe for all options: getting, setting,
+    deleting, iterating, listing keys, values, and items. Getting, setting, and
+    evicting take constant time. It counts ``num_hits``, ``num_misses``,
+    ``num_evictions``, and ``num_evicted_bytes``.
+    """
+
+    default_nbytes = 1024
+
+    @classmethod
+    def sizeof(cls, what):
+        """
+        The "size of" an object in this cache is the same as in
+        :py:meth:`~uproot4.cache.LRUArrayCache.sizeof`.
+        """
+        return LRUArrayCache.sizeof.__func__(cls, what)
+
+    def __init__(self, limit_bytes, probation_fraction=0.25, ghost_factor=2.0):
+        if limit_bytes is None:
+            self._limit = None
+        else:
+            self._limit = uproot4._util.memory_size(limit_bytes)
+        if not 0 < probation_fraction < 1:
+            raise ValueError("probation_fraction must be between 0 and 1")
+        if ghost_factor < 0:
+            raise ValueError("ghost_factor must be non-negative")
+        self._probation_fraction = probation_fraction
+        self._ghost_factor = ghost_factor
+        self._probation = _Shard(None)
+        self._main = _Shard(None)
+        self._ghosts = _Shard(None)
+        self._lock = threading.Lock()
+        self._num_hits = 0
+        self._num_misses = 0
+        self._num_evictions = 0
+        self._num_evicted_bytes = 0
+
+    def __repr__(self):
+        if self._limit is None:
+            limit = "(no limit)"
+        else:
+            limit = "({0}/{1} bytes full)".format(self.current, self._limit)
+        return "<TwoQueueArrayCache {0} at 0x{1:012x}>".format(limit, id(self))
+
+    @property
+    def limit(self):
+        """
+        Number of bytes to allow in the cache before evicting. If None, this
+        cache never evicts.
+        """
+        return self._limit
+
+    @property
+    def current(self):
+        """
+        Current number of bytes in the cache.
+        """
+        return self._probation.current + self._main.current
+
+    @property
+    def probation_fraction(self):
+        """
+        Fraction of ``limit`` for objects that have been used only once.
+        """
+        return self._probation_fraction
+
+    @property
+    def ghost_factor(self):
+        """
+        Multiple of ``limit`` (counting the sizes of the evicted objects) for
+        the keys of recently evicted objects.
+        """
+        return self._ghost_factor
+
+    @property
+    def num_hits(self):
+        """
+        Number of times an item was requested and found in the cache.
+        """
+        return self._num_hits
+
+    @property
+    def num_misses(self):
+        """
+        Number of times an item was requested and not found in the cache.
+        """
+        return self._num_misses
+
+    @property
+    def num_evictions(self):
+        """
+        Number of items that have been evicted to stay within the ``limit``.
+        (Items that are explicitly deleted or replaced are not counted.)
+        """
+        return self._num_evictions
+
+    @property
+    def num_evicted_bytes(self):
+        """
+        Number of bytes in items that have been evicted to stay within the
+        ``limit``.
+        """
+        return self._num_evicted_bytes
+
+    def _nodes(self):
+        with self._lock:
+            return list(self._probation.nodes()) + list(self._main.nodes())
+
+    def keys(self):
+        """
+        Returns a copy of the keys currently in the cache: first the objects
+        in probation, oldest first, then the objects in the main queue, from
+        least-recently used to most-recently used.
+
+        (Calling this method does not change the order.)
+        """
+        return [node[_KEY] for node in self._nodes()]
+
+    def values(self):
+        """
+        Returns a copy of the values currently in the cache, in the same order
+        as ``keys``.
+
+        (Calling this method does not change the order.)
+        """
+        return [node[_VALUE] for node in self._nodes()]
+
+    def items(self):
+        """
+        Returns a copy of the items currently in the cache, in the same order
+        as ``keys``.
+
+        (Calling this method does not change the order.)
+        """
+        return [(node[_KEY], node[_VALUE]) for node in self._nodes()]
+
+    def _remove(self, queue, node):
+        queue.unlink(node)
+        del queue.data[node[_KEY]]
+        queue.current -= node[_SIZE]
+
+    def _add(self, queue, node):
+        queue.append(node)
+        queue.data[node[_KEY]] = node
+        queue.current += node[_SIZE]
+
+    def __getitem__(self, where):
+        with self._lock:
+            node = self._main.data.get(where)
+            if node is not None:
+                self._main.unlink(node)
+                self._main.append(node)
+            else:
+                node = self._probation.data.get(where)
+                if node is None:
+                    self._num_misses += 1
+                    raise KeyError(where)
+                self._remove(self._probation, node)
+                self._add(self._main, node)
+            self._num_hits += 1
+            return node[_VALUE]
+
+    def __setitem__(self, where, what):
+        node = [None, None, where, what, self.sizeof(what), None]
+        with self._lock:
+            if where in self._main.data:
+                self._remove(self._main, self._main.data[where])
+                self._add(self._main, node)
+            elif where in self._probation.data:
+                self._remove(self._probation, self._probation.data[where])
+                self._add(self._probation, node)
+            elif where in self._ghosts.data:
+                self._remove(self._ghosts, self._ghosts.data[where])
+                self._add(self._main, node)
+            else:
+                self._add(self._probation, node)
+
+            if self._limit is not None:
+                self._evict()
+
+    def _evict(self):
+        probation_limit = self._limit * self._probation_fraction
+        ghost_limit = self._limit * self._ghost_factor
+        while self.current > self._limit:
+            if self._probation.current > probation_limit or len(self._main.data) == 0:
+                queue = self._probation
+            else:
+                queue = self._main
+            oldest = queue.root[_NEXT]
+            if oldest is queue.root:
+                break
+            self._remove(queue, oldest)
+            self._num_evictions += 1
+            self._num_evicted_bytes += oldest[_SIZE]
+
+            if queue is self._probation:
+                ghost = [None, None, oldest[_KEY], None, oldest[_SIZE], None]
+                self._add(self._ghosts, ghost)
+                while self._ghosts.current > ghost_limit:
+                    self._remove(self._ghosts, self._ghosts.root[_NEXT])
+
+    def __delitem__(self, where):
+        with self._lock:
+            if where in self._main.data:
+                self._remove(self._main, self._main.data[where])
+            else:
+                self._remove(self._probation, self._probation.data[where])
+
+    def __contains__(self, where):
+        # does not change the order or count as a hit or miss
+        with self._lock:
+            return where in self._main.data or where in self._probation.data
+
+    def __iter__(self):
+        for node in self._nodes():
+            yield node[_KEY]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._probation.data) + len(self._main.data)
+
+
+_disk_array_cache_version = 1
+_not_a_uuid = re.compile(r"[^0-9A-Za-z_-]")
+
+
+def _awkward_to_buffers(awkward1, array):
+    if hasattr(awkward1, "to_buffers"):
+        form, length, container = awkward1.to_buffers(array)
+    else:
+        form, container, length = awkward1.to_arrayset(array)
+    return form.tojson(), length, container
+
+
+def _awkward_from_buffers(awkward1, form, length, container, highlevel):
+    form = awkward1.forms.Form.fromjson(form)
+    if hasattr(awkward1, "from_buffers"):
+        return awkward1.from_buffers(form, length, container, highlevel=highlevel)
+    else:
+        return awkward1.from_arrayset(
+            form, container, num_partitions=length, highlevel=highlevel
+        )
+
+
+class DiskArrayCache(MutableMapping):
+    """
+    Args:
+        directory (str): Path of the cache directory, which is created if it
+            does not exist.
+        limit_bytes (None, int, or str): Approximate amount of data to allow in
+            the directory before evicting the least-recently used. An integer
+            is interpreted as a number of bytes and a string must be a number
+            followed by a unit, such as "10 GB". If None, this cache never
+            evicts.
+
+    DiskArrayCache is a ``MutableMapping`` that stores arrays as files, so that
+    a later process (or a later file handle) that reads the same ``TBranch``
+    with the same interpretation, entry range, and library memory-maps the
+    array instead of reading, decompressing, and interpreting it again.
+
+    NumPy arrays (without Python objects) and Awkward Arrays are stored, each
+    buffer as a ``.npy`` file. Any other value is not stored: setting it is
+    ignored. Arrays are memory-mapped copy-on-write (``mmap_mode="c"``), so
+    changing an array in memory does not change the cache.
+
+    Each array is a subdirectory of a subdirectory named by the file UUID
+    at the beginning of uproot's cache keys. Since a rewritten file has a new
+    UUID, its old arrays are never returned; they are evicted as they become
+    the least-recently used, or :py:meth:`~uproot4.cache.DiskArrayCache.remove_uuid`
+    can delete them immediately.
+
+    Getting an array updates its modification time, and when the total size
+    exceeds ``limit``, the arrays with the oldest modification times are
+    deleted. Multiple processes may share a cache directory: arrays are written
+    to temporary directories and atomically renamed into place.
+
+    DiskArrayCache counts ``num_hits`` and ``num_misses``.
+    """
+
+    def __init__(self, directory, limit_bytes):
+        self._directory = directory
+        if limit_bytes is None:
+            self._limit = None
+        else:
+            self._limit = uproot4._util.memory_size(limit_bytes)
+        self._current = None
+        self._lock = threading.Lock()
+        self._num_hits = 0
+        self._num_misses = 0
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                if not os.path.isdir(directory):
+                    raise
+
+    def __repr__(self):
+        return "<DiskArrayCache {0} at 0x{1:012x}>".format(
+            repr(self._directory), id(self)
+        )
+
+    @property
+    def directory(self):
+        """
+        Path of the cache directory.
+        """
+        return self._directory
+
+    @property
+    def limit(self):
+        """
+        Approximate number of bytes to allow in the directory before evicting
+        the least-recently used. If None, this cache never evicts.
+        """
+        return self._limit
+
+    @property
+    def current(self):
+        """
+        Current number of bytes in the directory (from all processes).
+        """
+        return sum(size for mtime, size, path in self._entries())
+
+    @property
+    def num_hits(self):
+        """
+        Number of times an item was requested and found in the cache.
+        """
+        return self._num_hits
+
+    @property
+    def num_misses(self):
+        """
+        Number of times an item was requested and not found in the cache.
+        """
+        return self._num_misses
+
+    def _path(self, where):
+        where = str(where)
+        uuid = _not_a_uuid.sub("_", where.split(":", 1)[0]) or "_"
+        digest = hashlib.sha1(where.encode("utf-8")).hexdigest()
+        return os.path.join(self._directory, uuid, digest)
+
+    def _entries(self):
+        out = []
+        for uuid in os.listdir(self._directory):
+            directory = os.path.join(self._directory, uuid)
+            if not os.path.isdir(directory):
+                continue
+            for name in os.listdir(directory):
+                if name.startswith(".tmp"):
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    mtime = os.stat(path).st_mtime
+                    size = sum(
+                        os.path.getsize(os.path.join(path, x))
+                        for x in os.listdir(path)
+                    )
+                except OSError:
+                    pass
+                else:
+                    out.append((mtime, size, path))
+        return out
+
+    def _metadata(self, path):
+        with open(os.path.join(path, "metadata.json")) as file:
+            return json.load(file)
+
+    def __getitem__(self, where):
+        path = self._path(where)
+        try:
+            metadata = self._metadata(path)
+            if (
+                metadata["version"] != _disk_array_cache_version
+                or metadata["key"] != str(where)
+            ):
+                raise KeyError(where)
+            container = {}
+            for name in metadata["buffers"]:
+                container[name] = numpy.load(
+                    os.path.join(path, name + ".npy"), mmap_mode="c"
+                ).view(numpy.ndarray)
+            os.utime(path, None)
+        except (OSError, IOError, ValueError, KeyError):
+            with self._lock:
+                self._num_misses += 1
+            raise KeyError(where)
+
+        if metadata["kind"] == "numpy":
+            out = container["array"]
+        else:
+            out = _awkward_from_buffers(
+                uproot4.extras.awkward1(),
+                metadata["form"],
+                metadata["length"],
+                container,
+                metadata["kind"] == "awkward",
+            )
+        with self._lock:
+            self._num_hits += 1
+        return out
+
+    def _to_buffers(self, what):
+        if isinstance(what, numpy.ndarray):
+            if what.dtype.hasobject:
+                return None
+            return {"kind": "numpy"}, {"array": what}
+
+        try:
+            awkward1 = uproot4.extras.awkward1()
+        except ImportError:
+            return None
+        if isinstance(what, awkward1.Array):
+            kind = "awkward"
+        elif isinstance(what, awkward1.layout.Content):
+            kind = "layout"
+        else:
+            return None
+        try:
+            form, length, container = _awkward_to_buffers(awkward1, what)
+        except (TypeError, ValueError, NotImplementedError):
+            return None
+        metadata = {"kind": kind, "form": form, "length": length}
+        return metadata, dict((k, numpy.asarray(v)) for k, v in container.items())
+
+    def __setitem__(self, where, what):
+        buffers = self._to_buffers(what)
+        if buffers is None:
+            return
+        metadata, container = buffers
+        metadata["version"] = _disk_array_cache_version
+        metadata["key"] = str(where)
+        metadata["buffers"] = sorted(container)
+
+        path = self._path(where)
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                if not os.path.isdir(directory):
+                    raise
+
+        tmp = tempfile.mkdtemp(dir=directory, prefix=".tmp")
+        try:
+            size = 0
+            for name, array in container.items():
+                filename = os.path.join(tmp, name + ".npy")
+                numpy.save(filename, array, allow_pickle=False)
+                size += os.path.getsize(filename)
+            with open(os.path.join(tmp, "metadata.json"), "w") as file:
+                json.dump(metadata, file)
+            if os.path.exists(path):
+                shutil.rmtree(path, ignore_errors=True)
+            try:
+                os.rename(tmp, path)
+            except OSError:
+                # another thread or process stored the same array first
+                if not os.path.isdir(path):
+                    raise
+        finally:
+            if os.path.exists(tmp):
+                shutil.rmtree(tmp, ignore_errors=True)
+
+        with self._lock:
+            if self._current is None:
+                self._current = self.current
+            else:
+                self._current += size
+            if self._limit is not None and self._current > self._limit:
+                self._evict()
+
+    def _evict(self):
+        # other processes may be writing to and evicting from the same
+        # directory, so the total is recomputed from the files themselves
+        entries = sorted(self._entries())
+        total = sum(size for mtime, size, path in entries)
+        for mtime, size, path in entries:
+            if total <= self._limit:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+        self._current = total
+
+    def __delitem__(self, where):
+        path = self._path(where)
+        if not os.path.isdir(path):
+            raise KeyError(where)
+        shutil.rmtree(path, ignore_errors=True)
+        with self._lock:
+            self._current = None
+
+    def __contains__(self, where):
+        try:
+            return self._metadata(self._path(where))["key"] == str(where)
+        except (OSError, IOError, ValueError, KeyError):
+            return False
+
+    def remove_uuid(self, uuid):
+        """
+        Deletes all arrays from the file with this ``uuid`` (a ``uuid.UUID`` or
+        the ``hex_uuid`` string at the beginning of its cache keys).
+        """
+        if not uproot4._util.isstr(uuid):
+            uuid = str(uuid)
+        uuid = _not_a_uuid.sub("_", uuid)
+        shutil.rmtree(os.path.join(self._directory, uuid), ignore_errors=True)
+        with self._lock:
+            self._current = None
+
+    def clear(self):
+        """
+        Deletes all arrays in the cache (for all files).
+        """
+        for mtime, size, path in self._entries():
+            shutil.rmtree(path, ignore_errors=True)
+        with self._lock:
+            self._current = 0
+
+    def keys(self):
+        """
+        Returns the keys currently in the cache, in least-recently used order.
+
+        (Calling this method does not change the order.)
+        """
+        out = []
+        for mtime, size, path in sorted(self._entries()):
+            try:
+                out.append(self._metadata(path)["key"])
+            except (OSError, IOError, ValueError, KeyError):
+                pass
+        return out
+
+    def __iter__(self):
+        for x in self.keys():
+            yield x
+
+    def __len__(self):
+        return len(self.keys())
@@ -0,0 +1,171 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+"""
+A persistent cache of the Python classes that are generated from
+``TStreamerInfo``, which lets new processes skip generating and compiling the
+code for classes they have seen before.
+
+If the ``class_cache_dir`` option is not None,
+:py:meth:`~uproot4.streamers.Model_TStreamerInfo.new_class` looks for the
+class's code in the :py:class:`~uproot4.class_cache.ClassCodeCache` in that
+directory before generating it, and adds the code (and its bytecode) if it
+is not there.
+
+Entries are keyed by a hash of the class name, class version, and
+``fCheckSum`` of the ``TStreamerInfo``, so files that declare the same
+streamers share entries, as well as the version of uproot and the bytecode
+format of the Python interpreter, so that different installations can share
+a directory. Since the bytecode is executed when it is loaded, the directory
+should only be shared with trusted users.
+"""
+
+from __future__ import absolute_import
+
+import hashlib
+import marshal
+import os
+import tempfile
+
+import uproot4._util
+
+
+_format_version = 1
+
+
+def _magic():
+    if uproot4._util.py2:
+        import imp
+
+        return imp.get_magic()
+    else:
+        import importlib.util
+
+        return importlib.util.MAGIC_NUMBER
+
+
+class ClassCodeCache(object):
+    """
+    Args:
+        directory (str): Path of the cache directory, which is created if it
+            does not exist.
+
+    A directory of Python code and bytecode for classes generated from
+    ``TStreamerInfo`` (:py:class:`~uproot4.streamers.Model_TStreamerInfo`),
+    one file for each class name, version, and ``fCheckSum``.
+
+    There is no size limit: entries are a few kilobytes each, and the
+    directory can be deleted at any time.
+    """
+
+    def __init__(self, directory):
+        self._directory = directory
+        self._num_hits = 0
+        self._num_misses = 0
+
+    def __repr__(self):
+        return "<ClassCodeCache {0} at 0x{1:012x}>".format(
+            repr(self._directory), id(self)
+        )
+
+    @property
+    def directory(self):
+        """
+        Path of the cache directory.
+        """
+        return self._directory
+
+    @property
+    def num_hits(self):
+        """
+        The number of times :py:meth:`~uproot4.class_cache.ClassCodeCache.load`
+        found an entry.
+        """
+        return self._num_hits
+
+    @property
+    def num_misses(self):
+        """
+        The number of times :py:meth:`~uproot4.class_cache.ClassCodeCache.load`
+        did not find an entry.
+        """
+        return self._num_misses
+
+    def _identity(self, streamer):
+        return (
+            streamer.name,
+            streamer.class_version,
+            streamer.member("fCheckSum"),
+        )
+
+    def path(self, streamer):
+        """
+        Path of the file for a
+        :py:class:`~uproot4.streamers.Model_TStreamerInfo`.
+        """
+        import uproot4.version
+
+        key = repr(
+            (_format_version, uproot4.version.__version__, _magic())
+            + self._identity(streamer)
+        )
+        return os.path.join(
+            self._directory,
+            hashlib.sha1(key.encode("utf-8")).hexdigest() + ".bin",
+        )
+
+    def load(self, streamer):
+        """
+        Returns a tuple of Python code (str) and compiled bytecode for a
+        :py:class:`~uproot4.streamers.Model_TStreamerInfo`, or None if it is not
+        in the cache (or the entry can't be used).
+        """
+        try:
+            with open(self.path(streamer), "rb") as file:
+                entry = marshal.loads(file.read())
+            identity, class_code, code = entry
+            if tuple(identity) != self._identity(streamer):
+                raise ValueError("hash collision")
+        except (IOError, OSError):
+            self._num_misses += 1
+            return None
+        except Exception:
+            # an entry that can't be loaded (truncated or from another Python)
+            # is treated as missing and will be replaced
+            self._num_misses += 1
+            return None
+        else:
+            self._num_hits += 1
+            return class_code, code
+
+    def save(self, streamer, class_code, code):
+        """
+        Adds the Python code (str) and compiled bytecode for a
+        :py:class:`~uproot4.streamers.Model_TStreamerInfo` to the cache.
+
+        The entry is written to a temporary name and renamed into place, so
+        that other processes never see a partial file.
+        """
+        if not os.path.isdir(self._directory):
+            try:
+                os.makedirs(self._directory)
+            except OSError:
+                if not os.path.isdir(self._directory):
+                    raise
+
+        path = self.path(streamer)
+        fd, tmp = tempfile.mkstemp(dir=self._directory, prefix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(
+                    marshal.dumps((self._identity(streamer), class_code, code))
+                )
+            if uproot4._util.py2:
+                if os.name == "nt" and os.path.exists(path):
+                    os.remove(path)
+                os.rename(tmp, path)
+            else:
+                os.replace(tmp, path)
+        except (OSError, IOError):
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
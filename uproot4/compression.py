@@ -8,10 +8,13 @@ for compressing and decompressing a :py:class:`~uproot4.source.chunk.Chunk`.
 from __future__ import absolute_import
 
 import struct
+import sys
+import threading
 
 import numpy
 
 import uproot4.source.chunk
+import uproot4.source.futures
 import uproot4.const
 import uproot4._util
 import uproot4.extras
@@ -88,6 +91,28 @@ class Compression(object):
             raise ValueError("Compression level must be between 0 and 9 (inclusive)")
         self._level = int(value)
 
+    @classmethod
+    def decompress_into(cls, data, output):
+        """
+        Args:
+            data (bytes or ``numpy.ndarray``): One compressed block.
+            output (``numpy.ndarray`` of ``numpy.uint8``): The slice of the
+                output array that the block decompresses into.
+
+        Decompresses ``data`` into ``output`` and returns the number of
+        uncompressed bytes.
+
+        This default implementation decompresses to a new bytestring and
+        copies it; subclasses whose codec can write into a buffer may
+        override it.
+        """
+        uncompressed = cls.decompress(data, len(output))
+        if len(uncompressed) == len(output):
+            output[:] = numpy.frombuffer(
+                uncompressed, dtype=uproot4.source.chunk.Chunk._dtype
+            )
+        return len(uncompressed)
+
 
 class ZLIB(Compression):
     """
@@ -177,7 +202,105 @@ _decompress_header_format = struct.Struct("2sBBBBBBB")
 _decompress_checksum_format = struct.Struct(">Q")
 
 
-def decompress(chunk, cursor, context, compressed_bytes, uncompressed_bytes):
+def _check_lz4_checksum(data, expected_checksum, file_path):
+    xxhash = uproot4.extras.xxhash()
+    computed_checksum = xxhash.xxh64(data).intdigest()
+    if computed_checksum != expected_checksum:
+        raise ValueError(
+            """computed checksum {0} didn't match expected checksum {1}
+in file {2}""".format(
+                computed_checksum, expected_checksum, file_path
+            )
+        )
+
+
+def _decompress_block(block, output, file_path):
+    (
+        block_index,
+        cls,
+        data,
+        expected_checksum,
+        block_compressed_bytes,
+        block_uncompressed_bytes,
+        filled,
+    ) = block
+
+    if expected_checksum is not None:
+        _check_lz4_checksum(data, expected_checksum, file_path)
+
+    num_bytes = cls.decompress_into(
+        data, output[filled : filled + block_uncompressed_bytes]
+    )
+
+    if num_bytes != block_uncompressed_bytes:
+        raise ValueError(
+            """after successfully decompressing {0} blocks, a block of """
+            """compressed size {1} decompressed to {2} bytes, but the """
+            """block header expects {3} bytes.
+in file {4}""".format(
+                block_index,
+                block_compressed_bytes,
+                num_bytes,
+                block_uncompressed_bytes,
+                file_path,
+            )
+        )
+
+
+class _BlockTasks(object):
+    """
+    The blocks of one compressed object, each decompressed exactly once by
+    whichever thread claims it first: an executor's worker or the thread that
+    waits for the result. Since the waiting thread claims and runs every block
+    that has not started yet, the waiting does not deadlock when it happens
+    on one of the executor's own workers.
+    """
+
+    def __init__(self, blocks, output, file_path):
+        self._blocks = blocks
+        self._output = output
+        self._file_path = file_path
+        self._lock = threading.Lock()
+        self._claimed = [False] * len(blocks)
+        self._finished = [threading.Event() for block in blocks]
+        self._excinfo = [None] * len(blocks)
+
+    def run(self, index):
+        with self._lock:
+            if self._claimed[index]:
+                return
+            self._claimed[index] = True
+        try:
+            _decompress_block(self._blocks[index], self._output, self._file_path)
+        except Exception:
+            self._excinfo[index] = sys.exc_info()
+        self._finished[index].set()
+
+    def wait(self):
+        for index in uproot4._util.range(len(self._blocks)):
+            self.run(index)
+        for index in uproot4._util.range(len(self._blocks)):
+            self._finished[index].wait()
+            if self._excinfo[index] is not None:
+                uproot4.source.futures.delayed_raise(*self._excinfo[index])
+
+
+def _thread_based(executor):
+    if isinstance(executor, uproot4.source.futures.ResourceThreadPoolExecutor):
+        return False
+    elif isinstance(executor, uproot4.source.futures.ThreadPoolExecutor):
+        return True
+    try:
+        import concurrent.futures
+    except ImportError:
+        return False
+    else:
+        return isinstance(executor, concurrent.futures.ThreadPoolExecutor)
+
+
+def decompress(
+    chunk, cursor, context, compressed_bytes, uncompressed_bytes, executor=None
+):
     """
     Args:
         chunk (:py:class:`~uproot4.source.chunk.Chunk`): Buffer of contiguous data
@@ -188,6 +311,11 @@ def decompress(chunk, cursor, context, compressed_bytes, uncompressed_bytes):
         compressed_bytes (int): Number of compressed bytes to decompress.
         uncompressed_bytes (int): Number of uncompressed bytes to expect after
             decompression.
+        executor (None or Executor with a ``submit`` method): If a thread-based
+            executor and the data consist of more than one block, the blocks
+            are decompressed in parallel on this executor. Blocks can't be
+            decompressed in other processes because they are written into one
+            shared output array, so other executors are ignored.
 
     Decompresses ``compressed_bytes`` of a :py:class:`~uproot4.source.chunk.Chunk`
     of data, starting at the ``cursor``.
@@ -195,13 +323,18 @@ def decompress(chunk, cursor, context, compressed_bytes, uncompressed_bytes):
     This function parses ROOT's 9-byte compression headers (17 bytes for LZ4
     because it includes a checksum), combining blocks if there are more than
     one, returning the result as a new :py:class:`~uproot4.source.chunk.Chunk`.
+
+    All of the headers are parsed before any block is decompressed. If there is
+    only one block, its decompressed bytestring is used without copying;
+    otherwise, each block is decompressed into its slice of one preallocated
+    output array.
     """
     assert compressed_bytes >= 0
     assert uncompressed_bytes >= 0
 
     start = cursor.copy()
     filled = 0
-    num_blocks = 0
+    blocks = []
 
     while cursor.displacement(start) < compressed_bytes:
         # https://github.com/root-project/root/blob/master/core/zip/src/RZip.cxx#L217
@@ -212,6 +345,7 @@ def decompress(chunk, cursor, context, compressed_bytes, uncompressed_bytes):
         )
         block_compressed_bytes = c1 + (c2 << 8) + (c3 << 16)
         block_uncompressed_bytes = u1 + (u2 << 8) + (u3 << 16)
+        expected_checksum = None
 
         if algo == b"ZL":
             cls = ZLIB
@@ -229,16 +363,6 @@ def decompress(chunk, cursor, context, compressed_bytes, uncompressed_bytes):
             )
             data = cursor.bytes(chunk, block_compressed_bytes, context)
 
-            xxhash = uproot4.extras.xxhash()
-            computed_checksum = xxhash.xxh64(data).intdigest()
-            if computed_checksum != expected_checksum:
-                raise ValueError(
-                    """computed checksum {0} didn't match expected checksum {1}
-in file {2}""".format(
-                        computed_checksum, expected_checksum, chunk.source.file_path
-                    )
-                )
-
         elif algo == b"ZS":
             cls = ZSTD
             data = cursor.bytes(chunk, block_compressed_bytes, context)
@@ -260,6 +384,34 @@ in file {1}""".format(
                 )
             )
 
+        blocks.append(
+            (
+                len(blocks),
+                cls,
+                data,
+                expected_checksum,
+                block_compressed_bytes,
+                block_uncompressed_bytes,
+                filled,
+            )
+        )
+        filled += block_uncompressed_bytes
+
+    if len(blocks) == 1 and blocks[0][5] == uncompressed_bytes:
+        # the usual case: only one block
+        (
+            block_index,
+            cls,
+            data,
+            expected_checksum,
+            block_compressed_bytes,
+            block_uncompressed_bytes,
+            filled,
+        ) = blocks[0]
+
+        if expected_checksum is not None:
+            _check_lz4_checksum(data, expected_checksum, chunk.source.file_path)
+
         uncompressed_bytestring = cls.decompress(data, block_uncompressed_bytes)
 
         if len(uncompressed_bytestring) != block_uncompressed_bytes:
@@ -268,7 +420,7 @@ in file {1}""".format(
                 """compressed size {1} decompressed to {2} bytes, but the """
                 """block header expects {3} bytes.
 in file {4}""".format(
-                    num_blocks,
+                    0,
                     block_compressed_bytes,
                     len(uncompressed_bytestring),
                     block_uncompressed_bytes,
@@ -276,23 +428,29 @@ in file {4}""".format(
                 )
             )
 
-        uncompressed_array = numpy.frombuffer(
+        output = numpy.frombuffer(
             uncompressed_bytestring, dtype=uproot4.source.chunk.Chunk._dtype
         )
 
-        if num_blocks == 0:
-            if uncompressed_bytes == block_uncompressed_bytes:
-                # the usual case: only one block
-                output = uncompressed_array
-                break
-
-            else:
-                output = numpy.empty(
-                    uncompressed_bytes, dtype=uproot4.source.chunk.Chunk._dtype
+    else:
+        if filled > uncompressed_bytes:
+            raise ValueError(
+                """the block headers expect {0} uncompressed bytes in total, """
+                """but the object has only {1}
+in file {2}""".format(
+                    filled, uncompressed_bytes, chunk.source.file_path
                 )
+            )
 
-        output[filled : filled + block_uncompressed_bytes] = uncompressed_array
-        filled += block_uncompressed_bytes
-        num_blocks += 1
+        output = numpy.empty(
+            uncompressed_bytes, dtype=uproot4.source.chunk.Chunk._dtype
+        )
+        tasks = _BlockTasks(blocks, output, chunk.source.file_path)
+
+        if _thread_based(executor):
+            for index in uproot4._util.range(1, len(blocks)):
+                executor.submit(tasks.run, index)
+
+        tasks.wait()
 
     return uproot4.source.chunk.Chunk.wrap(chunk.source, output)
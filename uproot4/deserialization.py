@@ -27,8 +27,19 @@ scope = {
 }
 
 
-def _actually_compile(class_code, new_scope):
-    exec(compile(class_code, "<dynamic>", "exec"), new_scope)
+def _actually_compile(class_code, new_scope, code=None):
+    if code is None:
+        code = compile_code(class_code)
+    exec(code, new_scope)
+
+
+def compile_code(class_code):
+    """
+    Compiles Python code for a class (generated from ``TStreamerInfo``) into
+    bytecode, which can be passed to
+    :py:func:`~uproot4.deserialization.compile_class` to skip this step.
+    """
+    return compile(class_code, "<dynamic>", "exec")
 
 
 def _yield_all_behaviors(cls, c):
@@ -41,7 +52,7 @@ def _yield_all_behaviors(cls, c):
                 yield x
 
 
-def compile_class(file, classes, class_code, class_name):
+def compile_class(file, classes, class_code, class_name, code=None):
     """
     Args:
         file (:py:class:`~uproot4.reading.ReadOnlyFile`): File to use to generate
@@ -53,6 +64,9 @@ def compile_class(file, classes, class_code, class_name):
         class_name (str): Python (encoded) name of the new class. See
             :py:func:`~uproot4.model.classname_decode` and
             :py:func:`~uproot4.model.classname_encode`.
+        code (None or code object): Bytecode of ``class_code`` from
+            :py:func:`~uproot4.deserialization.compile_code`, if it has already
+            been compiled.
 
     Compile a new class from Python code and insert it in the dict of classes.
     """
@@ -70,7 +84,7 @@ def compile_class(file, classes, class_code, class_name):
 
     new_scope["c"] = c
 
-    _actually_compile(class_code, new_scope)
+    _actually_compile(class_code, new_scope, code)
 
     out = new_scope[class_name]
     out.class_code = class_code
@@ -180,6 +194,13 @@ def numbytes_check(
 _read_object_any_format1 = struct.Struct(">I")
 
 
+def _resolve_reference(context, ref):
+    # objects that have not been read yet, such as TBranches that are
+    # deserialized on demand, can provide a "resolve_reference" function
+    resolve = context.get("resolve_reference")
+    return resolve is not None and resolve(ref)
+
+
 def read_object_any(chunk, cursor, context, file, selffile, parent, as_class=None):
     """
     Args:
@@ -241,7 +262,7 @@ def read_object_any(chunk, cursor, context, file, selffile, parent, as_class=Non
         elif tag == 1:
             return parent  # return parent
 
-        elif tag not in cursor.refs:
+        elif tag not in cursor.refs and not _resolve_reference(context, int(tag)):
             # jump past this object
             cursor.move_to(cursor.origin + beg + bcnt + 4)
             return None  # return null
@@ -279,7 +300,7 @@ def read_object_any(chunk, cursor, context, file, selffile, parent, as_class=Non
         ref = int(tag & ~uproot4.const.kClassMask)
 
         if as_class is None:
-            if ref not in cursor.refs:
+            if ref not in cursor.refs and not _resolve_reference(context, ref):
                 if getattr(file, "file_path") is None:
                     in_file = ""
                 else:
@@ -313,6 +334,26 @@ def read_object_any(chunk, cursor, context, file, selffile, parent, as_class=Non
 scope["read_object_any"] = read_object_any
 
 
+def _remove_general_classes(file, breadcrumbs):
+    # after a DeserializationError, removes the predefined classes that were
+    # being read so that they are remade from the file's streamers; returns
+    # False if they are already the most specialized versions of each class
+    import uproot4.containers
+
+    if breadcrumbs is None or all(
+        breadcrumb_cls.classname in uproot4.model.bootstrap_classnames
+        or isinstance(breadcrumb_cls, uproot4.containers.AsContainer)
+        or getattr(breadcrumb_cls.class_streamer, "file_uuid", None) == file.uuid
+        for breadcrumb_cls in breadcrumbs
+    ):
+        return False
+
+    for breadcrumb_cls in breadcrumbs:
+        if breadcrumb_cls.classname not in uproot4.model.bootstrap_classnames:
+            file.remove_class_definition(breadcrumb_cls.classname)
+    return True
+
+
 class DeserializationError(Exception):
     """
     Error raised when a ROOT file cannot be deserialized.
@@ -243,3 +243,25 @@ def hist():
         )
     else:
         return hist
+
+
+def numexpr():
+    """
+    Imports and returns ``numexpr``.
+    """
+    try:
+        import numexpr
+    except ImportError:
+        raise ImportError(
+            """install the 'numexpr' package with:
+
+    pip install numexpr
+
+or
+
+    conda install numexpr
+
+or use uproot4.language.python.PythonLanguage, the default language."""
+        )
+    else:
+        return numexpr
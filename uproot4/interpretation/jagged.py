@@ -33,6 +33,49 @@ def fast_divide(array, divisor):
         return numpy.floor_divide(array, divisor)
 
 
+_copy_ranges_block_bytes = 1 << 20
+
+
+def _copy_ranges(data, byte_starts, byte_stops, out):
+    """
+    Concatenates ``data[byte_starts[i] : byte_stops[i]]`` for all ``i`` into
+    ``out``, which must have exactly the total length. Ranges must be
+    increasing and non-overlapping.
+
+    The ranges are gathered with a mask, but only for groups of ranges that
+    span about ``_copy_ranges_block_bytes`` of ``data`` at a time, so the
+    temporary memory does not scale with the size of ``data``.
+    """
+    nonempty = byte_starts < byte_stops
+    byte_starts = byte_starts[nonempty]
+    byte_stops = byte_stops[nonempty]
+
+    filled = 0
+    i = 0
+    while i < len(byte_starts):
+        j = int(
+            numpy.searchsorted(
+                byte_starts, byte_starts[i] + _copy_ranges_block_bytes, side="right"
+            )
+        )
+        j = max(j, i + 1)
+
+        low, high = byte_starts[i], byte_stops[j - 1]
+        mask = numpy.zeros(high - low + 1, dtype=numpy.int8)
+        mask[byte_stops[i:j] - low] = -1
+        mask[byte_starts[i:j] - low] += 1
+        numpy.cumsum(mask, out=mask)
+
+        length = int(numpy.sum(byte_stops[i:j] - byte_starts[i:j]))
+        numpy.compress(
+            mask[:-1].view(numpy.bool_),
+            data[low:high],
+            out=out[filled : filled + length],
+        )
+        filled += length
+        i = j
+
+
 class AsJagged(uproot4.interpretation.Interpretation):
     """
     Args:
@@ -175,24 +218,23 @@ class AsJagged(uproot4.interpretation.Interpretation):
             byte_starts = byte_offsets[:-1] + self._header_bytes
             byte_stops = byte_offsets[1:]
 
-            # mask out the headers
-            header_offsets = numpy.arange(self._header_bytes)
-            header_idxs = (byte_offsets[:-1] + header_offsets[:, numpy.newaxis]).ravel()
-            mask = numpy.full(len(data), True, dtype=numpy.bool_)
-            mask[header_idxs] = False
-            data = data[mask]
-
-            content = self._content.basket_array(
-                data, None, basket, branch, context, cursor_offset, library
-            )
-
             byte_counts = byte_stops - byte_starts
             counts = fast_divide(byte_counts, self._content.itemsize)
 
             offsets = numpy.empty(len(counts) + 1, dtype=numpy.int32)
             offsets[0] = 0
             numpy.cumsum(counts, out=offsets[1:])
-            output = JaggedArray(offsets, content)
+
+            # the headers are not removed until the content is needed, which
+            # may be while copying it into final_array's output
+            output = HeaderedJaggedArray(
+                offsets,
+                data,
+                byte_starts,
+                byte_stops,
+                self._content,
+                (basket, branch, context, cursor_offset, library),
+            )
 
         self.hook_after_basket_array(
             data=data,
@@ -220,12 +262,11 @@ class AsJagged(uproot4.interpretation.Interpretation):
         )
 
         basket_offsets = {}
-        basket_content = {}
         for k, v in basket_arrays.items():
             basket_offsets[k] = v.offsets
-            basket_content[k] = v.content
 
         if entry_start >= entry_stop:
+            basket_content = dict((k, v.content) for k, v in basket_arrays.items())
             offsets = library.zeros((1,), numpy.int64)
             content = self._content.final_array(
                 basket_content, entry_start, entry_stop, entry_offsets, library, branch
@@ -233,70 +274,36 @@ class AsJagged(uproot4.interpretation.Interpretation):
             return JaggedArray(offsets, content)
 
         else:
-            length = 0
-            start = entry_offsets[0]
-            for basket_num, stop in enumerate(entry_offsets[1:]):
-                if start <= entry_start and entry_stop <= stop:
-                    length += entry_stop - entry_start
-                elif start <= entry_start < stop:
-                    length += stop - entry_start
-                elif start <= entry_stop <= stop:
-                    length += entry_stop - start
-                elif entry_start < stop and start <= entry_stop:
-                    length += stop - start
-                start = stop
-
-            offsets = numpy.empty((length + 1,), numpy.int64)
-
+            # one pass over the TBaskets to find the pieces and fill the offsets
+            offsets = numpy.empty((entry_stop - entry_start + 1,), numpy.int64)
+            offsets[0] = 0
+            pieces = []
             before = 0
             start = entry_offsets[0]
-            contents = []
             for basket_num, stop in enumerate(entry_offsets[1:]):
-                if start <= entry_start and entry_stop <= stop:
-                    local_start = entry_start - start
-                    local_stop = entry_stop - start
-                    off, cnt = basket_offsets[basket_num], basket_content[basket_num]
-                    offsets[:] = (
-                        before - off[local_start] + off[local_start : local_stop + 1]
-                    )
-                    before += off[local_stop] - off[local_start]
-                    contents.append(cnt[off[local_start] : off[local_stop]])
-
-                elif start <= entry_start < stop:
-                    local_start = entry_start - start
-                    local_stop = stop - start
-                    off, cnt = basket_offsets[basket_num], basket_content[basket_num]
-                    offsets[: stop - entry_start + 1] = (
-                        before - off[local_start] + off[local_start : local_stop + 1]
-                    )
-                    before += off[local_stop] - off[local_start]
-                    contents.append(cnt[off[local_start] : off[local_stop]])
-
-                elif start <= entry_stop <= stop:
-                    local_start = 0
-                    local_stop = entry_stop - start
-                    off, cnt = basket_offsets[basket_num], basket_content[basket_num]
-                    offsets[start - entry_start :] = (
+                if start < entry_stop and entry_start < stop:
+                    local_start = max(entry_start, start) - start
+                    local_stop = min(entry_stop, stop) - start
+                    off = basket_offsets[basket_num]
+                    global_start = start + local_start - entry_start
+                    global_stop = start + local_stop - entry_start
+                    offsets[global_start : global_stop + 1] = (
                         before - off[local_start] + off[local_start : local_stop + 1]
                     )
+                    pieces.append((basket_num, local_start, local_stop, before))
                     before += off[local_stop] - off[local_start]
-                    contents.append(cnt[off[local_start] : off[local_stop]])
-
-                elif entry_start < stop and start <= entry_stop:
-                    off, cnt = basket_offsets[basket_num], basket_content[basket_num]
-                    offsets[start - entry_start : stop - entry_start + 1] = (
-                        before - off[0] + off
-                    )
-                    before += off[-1] - off[0]
-                    contents.append(cnt[off[0] : off[-1]])
-
                 start = stop
 
-            content = numpy.empty((before,), self.content.to_dtype)
-            before = 0
-            for cnt in contents:
-                content[before : before + len(cnt)] = cnt
-                before += len(cnt)
+            # one allocation of the output, each piece copied straight into it
+            content = numpy.empty((before,), self._content.to_dtype)
+            for basket_num, local_start, local_stop, filled in pieces:
+                basket_array = basket_arrays[basket_num]
+                off = basket_array.offsets
+                piece = content[filled : filled + off[local_stop] - off[local_start]]
+                if isinstance(basket_array, HeaderedJaggedArray):
+                    basket_array.copy_into(local_start, local_stop, piece)
+                else:
+                    piece[:] = basket_array.content[off[local_start] : off[local_stop]]
 
             content = self._content._wrap_almost_finalized(content)
 
@@ -365,14 +372,14 @@ class JaggedArray(object):
         return self._content
 
     def __getitem__(self, where):
-        return self._content[self._offsets[where] : self._offsets[where + 1]]
+        return self.content[self._offsets[where] : self._offsets[where + 1]]
 
     def __len__(self):
         return len(self._offsets) - 1
 
     def __iter__(self):
         start = self._offsets[0]
-        content = self._content
+        content = self.content
         for stop in self._offsets[1:]:
             yield content[start:stop]
             start = stop
@@ -409,3 +416,107 @@ class JaggedArray(object):
         localindex -= self._offsets[parents]
 
         return parents + entry_start, localindex
+
+
+class HeaderedJaggedArray(JaggedArray):
+    """
+    Args:
+        offsets (array of ``numpy.int32``): Starting and stopping entries for
+            each variable-length list. The length of the ``offsets`` is one
+            greater than the number of lists.
+        data (array of ``numpy.uint8``): Raw ``TBasket`` data, including a
+            header before each list.
+        byte_starts (array of integers): Index in ``data`` where each list's
+            content starts (after its header).
+        byte_stops (array of integers): Index in ``data`` where each list's
+            content stops.
+        content_interpretation (:py:class:`~uproot4.interpretation.numerical.Numerical`): The
+            :py:attr:`~uproot4.interpretation.jagged.AsJagged.content` that
+            interprets the data without headers.
+        args (tuple): Remaining arguments to the ``content_interpretation``'s
+            ``basket_array``.
+
+    A :py:class:`~uproot4.interpretation.jagged.JaggedArray` from
+    :py:meth:`~uproot4.interpretation.jagged.AsJagged.basket_array` with
+    ``header_bytes != 0``, whose headers are removed only when its
+    :py:attr:`~uproot4.interpretation.jagged.HeaderedJaggedArray.content` is
+    requested. :py:meth:`~uproot4.interpretation.jagged.AsJagged.final_array`
+    instead uses
+    :py:meth:`~uproot4.interpretation.jagged.HeaderedJaggedArray.copy_into` to
+    copy the lists directly into its output.
+    """
+
+    def __init__(
+        self, offsets, data, byte_starts, byte_stops, content_interpretation, args
+    ):
+        self._offsets = offsets
+        self._content = None
+        self._data = data
+        self._byte_starts = byte_starts
+        self._byte_stops = byte_stops
+        self._content_interpretation = content_interpretation
+        self._args = args
+
+        if int(numpy.sum(byte_stops - byte_starts)) % content_interpretation.itemsize:
+            # raises the content interpretation's error
+            self.content
+
+    def __repr__(self):
+        return "HeaderedJaggedArray({0}, {1})".format(self._offsets, self._data)
+
+    def __reduce__(self):
+        # the interpretation's arguments include the TBranch; send the content
+        return JaggedArray, (self._offsets, self.content)
+
+    @property
+    def content(self):
+        if self._content is None:
+            stripped = numpy.empty(
+                int(numpy.sum(self._byte_stops - self._byte_starts)), numpy.uint8
+            )
+            _copy_ranges(self._data, self._byte_starts, self._byte_stops, stripped)
+            self._content = self._content_interpretation.basket_array(
+                stripped, None, *self._args
+            )
+        return self._content
+
+    def copy_into(self, entry_start, entry_stop, output):
+        """
+        Args:
+            entry_start (int): First list (in this ``TBasket``) to copy.
+            entry_stop (int): First list to not copy.
+            output (``numpy.ndarray``): Slice of the final content array, with
+                the interpretation's ``to_dtype``, to fill.
+
+        Copies the content of lists ``entry_start`` through ``entry_stop`` into
+        ``output``, converting from the interpretation's ``from_dtype``.
+        """
+        if self._content is not None or not isinstance(
+            self._content_interpretation, uproot4.interpretation.numerical.AsDtype
+        ):
+            start = self._offsets[entry_start]
+            stop = self._offsets[entry_stop]
+            output[:] = self.content[start:stop]
+            return
+
+        from_dtype = self._content_interpretation.from_dtype
+        byte_starts = self._byte_starts[entry_start:entry_stop]
+        byte_stops = self._byte_stops[entry_start:entry_stop]
+
+        if output.dtype == from_dtype.base and output.flags.c_contiguous:
+            raw = output.reshape(-1).view(numpy.uint8)
+            _copy_ranges(self._data, byte_starts, byte_stops, raw)
+
+        elif (
+            from_dtype.names is None
+            and output.dtype == from_dtype.base.newbyteorder("=")
+            and output.flags.c_contiguous
+        ):
+            raw = output.reshape(-1).view(numpy.uint8)
+            _copy_ranges(self._data, byte_starts, byte_stops, raw)
+            raw.view(from_dtype.base).byteswap(inplace=True)
+
+        else:
+            raw = numpy.empty(int(numpy.sum(byte_stops - byte_starts)), numpy.uint8)
+            _copy_ranges(self._data, byte_starts, byte_stops, raw)
+            output[:] = raw.view(from_dtype.base).reshape(output.shape)
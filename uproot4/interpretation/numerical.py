@@ -43,8 +43,74 @@ class Numerical(uproot4.interpretation.Interpretation):
     def _wrap_almost_finalized(self, array):
         return array
 
+    def preallocate(self, entry_start, entry_stop, entry_offsets, library):
+        """
+        Args:
+            entry_start (int): First entry to include.
+            entry_stop (int): First entry to exclude (one greater than the last
+                entry to include).
+            entry_offsets (list of int): The
+                :py:attr:`~uproot4.behaviors.TBranch.TBranch.entry_offsets` for this
+                ``TBranch``.
+            library (:py:class:`~uproot4.interpretation.library.Library`): The
+                requested library for output.
+
+        Returns an uninitialized array with the
+        :py:attr:`~uproot4.interpretation.numerical.Numerical.to_dtype` and
+        length of the final array, to be filled by
+        :py:meth:`~uproot4.interpretation.numerical.Numerical.fill` and passed
+        to :py:meth:`~uproot4.interpretation.Interpretation.final_array` as
+        ``preallocated``.
+        """
+        entry_start = max(entry_start, entry_offsets[0])
+        entry_stop = min(entry_stop, entry_offsets[-1])
+        return library.empty((max(entry_stop - entry_start, 0),), self.to_dtype)
+
+    def fill(
+        self, output, basket_num, basket_array, entry_start, entry_stop, entry_offsets
+    ):
+        """
+        Args:
+            output (array): The array from
+                :py:meth:`~uproot4.interpretation.numerical.Numerical.preallocate`.
+            basket_num (int): Number of the ``TBasket`` to copy.
+            basket_array (array): The temporary array returned by
+                :py:meth:`~uproot4.interpretation.Interpretation.basket_array`
+                for that ``TBasket``.
+            entry_start (int): First entry to include.
+            entry_stop (int): First entry to exclude (one greater than the last
+                entry to include).
+            entry_offsets (list of int): The
+                :py:attr:`~uproot4.behaviors.TBranch.TBranch.entry_offsets` for this
+                ``TBranch``.
+
+        Copies (and converts to
+        :py:attr:`~uproot4.interpretation.numerical.Numerical.to_dtype`) the
+        entries of one ``TBasket`` that are in the requested range into their
+        place in ``output``. Different ``TBaskets`` can be filled concurrently.
+
+        Returns the filled part of ``output``.
+        """
+        start, stop = entry_offsets[basket_num], entry_offsets[basket_num + 1]
+        first = max(entry_start, entry_offsets[0])
+        local_start = max(entry_start, start) - start
+        local_stop = min(entry_stop, stop) - start
+        if local_start >= local_stop:
+            return output[:0]
+        global_start = start + local_start - first
+        global_stop = start + local_stop - first
+        output[global_start:global_stop] = basket_array[local_start:local_stop]
+        return output[global_start:global_stop]
+
     def final_array(
-        self, basket_arrays, entry_start, entry_stop, entry_offsets, library, branch
+        self,
+        basket_arrays,
+        entry_start,
+        entry_stop,
+        entry_offsets,
+        library,
+        branch,
+        preallocated=None,
     ):
         self.hook_before_final_array(
             basket_arrays=basket_arrays,
@@ -55,49 +121,23 @@ class Numerical(uproot4.interpretation.Interpretation):
             branch=branch,
         )
 
-        if entry_start >= entry_stop:
-            output = library.empty((0,), self.to_dtype)
+        if preallocated is not None:
+            # every TBasket has already been copied into it by fill
+            output = preallocated
 
         else:
-            length = 0
+            output = self.preallocate(entry_start, entry_stop, entry_offsets, library)
             start = entry_offsets[0]
             for basket_num, stop in enumerate(entry_offsets[1:]):
-                if start <= entry_start and entry_stop <= stop:
-                    length += entry_stop - entry_start
-                elif start <= entry_start < stop:
-                    length += stop - entry_start
-                elif start <= entry_stop <= stop:
-                    length += entry_stop - start
-                elif entry_start < stop and start <= entry_stop:
-                    length += stop - start
-                start = stop
-
-            output = library.empty((length,), self.to_dtype)
-
-            start = entry_offsets[0]
-            for basket_num, stop in enumerate(entry_offsets[1:]):
-                if start <= entry_start and entry_stop <= stop:
-                    local_start = entry_start - start
-                    local_stop = entry_stop - start
-                    basket_array = basket_arrays[basket_num]
-                    output[:] = basket_array[local_start:local_stop]
-
-                elif start <= entry_start < stop:
-                    local_start = entry_start - start
-                    local_stop = stop - start
-                    basket_array = basket_arrays[basket_num]
-                    output[: stop - entry_start] = basket_array[local_start:local_stop]
-
-                elif start <= entry_stop <= stop:
-                    local_start = 0
-                    local_stop = entry_stop - start
-                    basket_array = basket_arrays[basket_num]
-                    output[start - entry_start :] = basket_array[local_start:local_stop]
-
-                elif entry_start < stop and start <= entry_stop:
-                    basket_array = basket_arrays[basket_num]
-                    output[start - entry_start : stop - entry_start] = basket_array
-
+                if start < entry_stop and entry_start < stop:
+                    self.fill(
+                        output,
+                        basket_num,
+                        basket_arrays[basket_num],
+                        entry_start,
+                        entry_stop,
+                        entry_offsets,
+                    )
                 start = stop
 
         self.hook_before_library_finalize(
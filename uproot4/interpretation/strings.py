@@ -23,6 +23,148 @@ import uproot4.interpretation
 
 
 _string_4byte_size = struct.Struct(">I")
+_max_speculative_length = 8
+
+
+def _speculative_length_headers(data, block):
+    """
+    Returns the positions of the "1-5" length headers in ``data`` using
+    vectorized passes over blocks of ``block`` bytes.
+
+    Each header's position depends on the previous string's length, so every
+    block is first walked in lockstep as though a header starts at its
+    beginning. Then every block is walked again from where the previous
+    block's walk leaves off, until it lands on the first walk, which it
+    follows from there. When the strings are short, these walks join after a
+    few strings; blocks where they do not are walked one header at a time.
+    """
+    num_bytes = len(data)
+    following = numpy.arange(1, num_bytes + 2, dtype=numpy.int64)
+    following[:num_bytes] += data
+    escaped = numpy.nonzero(data[: max(num_bytes - 4, 0)] == 255)[0]
+    if len(escaped) != 0:
+        size = numpy.zeros(len(escaped), dtype=numpy.int64)
+        for i in range(1, 5):
+            size = (size << 8) | data[escaped + i]
+        following[escaped] = escaped + 5 + size
+    numpy.minimum(following, num_bytes, out=following)
+
+    starts = numpy.arange(0, num_bytes, block, dtype=numpy.int64)
+    limits = starts + block
+    limits[-1] = num_bytes
+
+    position = starts
+    steps = [position]
+    while True:
+        position = numpy.minimum(following[position], limits)
+        if (position == limits).all():
+            break
+        steps.append(position)
+    speculative = numpy.array(steps)
+    in_block = speculative < limits
+    exits = following[numpy.where(in_block, speculative, 0).max(axis=0)]
+    visited = numpy.zeros(num_bytes + 1, dtype=numpy.bool_)
+    visited[speculative[in_block]] = True
+
+    position = numpy.empty_like(starts)
+    position[0] = 0
+    position[1:] = exits[:-1]
+    steps = [position]
+    while True:
+        done = (position >= limits) | visited[position]
+        if done.all():
+            break
+        position = numpy.where(done, position, following[position])
+        steps.append(position)
+    catchup = numpy.array(steps)
+    merges = position
+
+    entries = catchup[0]
+    caught_up = numpy.ones(len(limits), dtype=numpy.bool_)
+    walked = []
+    if ((merges[:-1] >= limits[:-1]) & (merges[:-1] != exits[:-1])).any():
+        pos = 0
+        for index, limit in enumerate(limits.tolist()):
+            if pos != entries[index]:
+                caught_up[index] = False
+                while pos < limit and not visited[pos]:
+                    walked.append(pos)
+                    pos = following[pos]
+                merges[index] = pos
+            pos = exits[index] if merges[index] < limit else merges[index]
+
+    is_header = numpy.zeros(num_bytes, dtype=numpy.bool_)
+    is_header[catchup[(catchup < merges) & caught_up]] = True
+    is_header[speculative[in_block & (speculative >= merges)]] = True
+    is_header[walked] = True
+    return numpy.nonzero(is_header)[0]
+
+
+def _walk_length_headers(data, length_bytes, num_entries=None):
+    """
+    Returns the start and stop of each string's content in ``data``, a
+    sequence of length-prefixed strings without entry offsets.
+
+    Each length header's position depends on the previous string's length.
+    If ``num_entries`` is known and the strings are short, the "1-5" headers
+    are found by
+    :py:func:`~uproot4.interpretation.strings._speculative_length_headers`;
+    otherwise, they are visited in one loop. All of the string content is
+    gathered afterward in a single vectorized pass.
+    """
+    num_bytes = len(data)
+
+    if length_bytes == "1-5":
+        if (
+            num_bytes != 0
+            and num_entries
+            and num_bytes <= _max_speculative_length * num_entries
+        ):
+            block = max(1024, (1024 * num_bytes) // num_entries)
+            headers = _speculative_length_headers(data, block)
+            end = num_bytes
+
+        else:
+            raw = bytearray(data)
+            unpack_from = _string_4byte_size.unpack_from
+            positions = []
+            append = positions.append
+            pos = 0
+            while pos < num_bytes:
+                append(pos)
+                size = raw[pos]
+                if size == 255:
+                    (size,) = unpack_from(raw, pos + 1)
+                    pos += 4
+                pos += size + 1
+            headers = numpy.array(positions, dtype=numpy.int64)
+            end = pos
+
+        header_size = numpy.ones(len(headers), dtype=numpy.int64)
+        header_size[data[headers] == 255] += 4
+
+    elif length_bytes == "4":
+        raw = bytearray(data)
+        unpack_from = _string_4byte_size.unpack_from
+        positions = []
+        append = positions.append
+        pos = 0
+        while pos < num_bytes:
+            append(pos)
+            (size,) = unpack_from(raw, pos)
+            pos += size + 4
+        headers = numpy.array(positions, dtype=numpy.int64)
+        end = pos
+        header_size = 4
+
+    else:
+        raise AssertionError(repr(length_bytes))
+
+    byte_starts = headers + header_size
+    byte_stops = numpy.empty(len(headers), dtype=numpy.int64)
+    byte_stops[:-1] = headers[1:]
+    byte_stops[-1:] = end
+    return byte_starts, byte_stops
 
 
 class AsStrings(uproot4.interpretation.Interpretation):
@@ -157,45 +299,11 @@ class AsStrings(uproot4.interpretation.Interpretation):
         )
 
         if byte_offsets is None:
-            counts = numpy.empty(len(data), dtype=numpy.int32)
-            outdata = numpy.empty(len(data), dtype=data.dtype)
-
-            pos = 0
-            entry_num = 0
-            len_outdata = 0
-
-            if self._length_bytes == "1-5":
-                while True:
-                    if pos >= len(data):
-                        break
-                    size = data[pos]
-                    pos += 1
-                    if size == 255:
-                        (size,) = _string_4byte_size.unpack(data[pos : pos + 4])
-                        pos += 4
-                    counts[entry_num] = size
-                    entry_num += 1
-                    outdata[len_outdata : len_outdata + size] = data[pos : pos + size]
-                    len_outdata += size
-                    pos += size
-
-            elif self._length_bytes == "4":
-                while True:
-                    if pos >= len(data):
-                        break
-                    (size,) = _string_4byte_size.unpack(data[pos : pos + 4])
-                    pos += 4
-                    counts[entry_num] = size
-                    entry_num += 1
-                    outdata[len_outdata : len_outdata + size] = data[pos : pos + size]
-                    len_outdata += size
-                    pos += size
-
-            else:
-                raise AssertionError(repr(self._length_bytes))
-
-            counts = counts[:entry_num]
-            data = outdata[:len_outdata]
+            byte_starts, byte_stops = _walk_length_headers(
+                data,
+                self._length_bytes,
+                None if basket is None else basket.num_entries,
+            )
 
         else:
             byte_starts = byte_offsets[:-1] + self._header_bytes
@@ -210,13 +318,13 @@ class AsStrings(uproot4.interpretation.Interpretation):
                 raise AssertionError(repr(self._length_bytes))
             byte_starts += length_header_size
 
-            mask = numpy.zeros(len(data), dtype=numpy.int8)
-            mask[byte_starts[byte_starts < len(data)]] = 1
-            numpy.add.at(mask, byte_stops[byte_stops < len(data)], -1)
-            numpy.cumsum(mask, out=mask)
-            data = data[mask.view(numpy.bool_)]
+        mask = numpy.zeros(len(data), dtype=numpy.int8)
+        mask[byte_starts[byte_starts < len(data)]] = 1
+        numpy.add.at(mask, byte_stops[byte_stops < len(data)], -1)
+        numpy.cumsum(mask, out=mask)
+        data = data[mask.view(numpy.bool_)]
 
-            counts = byte_stops - byte_starts
+        counts = byte_stops - byte_starts
 
         offsets = numpy.empty(len(counts) + 1, dtype=numpy.int32)
         offsets[0] = 0
@@ -5,6 +5,8 @@ Defines languages for expressions passed to
 :py:meth:`~uproot4.behavior.TBranch.HasBranches.arrays` (and similar).
 
 The default is :py:class:`~uproot4.language.python.PythonLanguage`.
+:py:class:`~uproot4.language.numexpr.NumExprLanguage` has the same syntax and
+evaluates numerical expressions with ``numexpr``, if it is installed.
 
 All languages must be subclasses of :py:class:`~uproot4.language.Language`.
 """
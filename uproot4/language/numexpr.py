@@ -0,0 +1,340 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+"""
+Defines a :py:class:`~uproot4.language.Language` for expressions passed to
+:py:meth:`~uproot4.behavior.TBranch.HasBranches.arrays` (and similar) that
+evaluates them with `numexpr <https://github.com/pydata/numexpr>`__.
+
+The :py:class:`~uproot4.language.numexpr.NumExprLanguage` has Python syntax,
+like :py:class:`~uproot4.language.python.PythonLanguage`, but each flat,
+numerical expression is compiled into a single pass over the data, in blocks
+that fit in the CPU cache and on several threads, without making a full-size
+temporary array for each operation. Any expression that numexpr can't
+evaluate is computed by :py:class:`~uproot4.language.python.PythonLanguage`.
+"""
+
+from __future__ import absolute_import
+
+import ast
+
+import numpy
+
+import uproot4.extras
+import uproot4.language.python
+import uproot4._util
+
+
+_binary_operators = {
+    ast.Add: "+",
+    ast.Sub: "-",
+    ast.Mult: "*",
+    ast.Div: "/",
+    ast.Pow: "**",
+    ast.BitAnd: "&",
+    ast.BitOr: "|",
+}
+
+_unary_operators = {ast.USub: "-", ast.UAdd: "+", ast.Invert: "~"}
+
+_comparisons = {
+    ast.Eq: "==",
+    ast.NotEq: "!=",
+    ast.Lt: "<",
+    ast.LtE: "<=",
+    ast.Gt: ">",
+    ast.GtE: ">=",
+}
+
+# functions in PythonLanguage.default_functions that numexpr implements
+_functions = {
+    numpy.absolute: "abs",
+    numpy.arccos: "arccos",
+    numpy.arccosh: "arccosh",
+    numpy.arcsin: "arcsin",
+    numpy.arcsinh: "arcsinh",
+    numpy.arctan: "arctan",
+    numpy.arctan2: "arctan2",
+    numpy.arctanh: "arctanh",
+    numpy.conjugate: "conj",
+    numpy.cos: "cos",
+    numpy.cosh: "cosh",
+    numpy.exp: "exp",
+    numpy.expm1: "expm1",
+    numpy.imag: "imag",
+    numpy.log: "log",
+    numpy.log10: "log10",
+    numpy.log1p: "log1p",
+    numpy.real: "real",
+    numpy.sin: "sin",
+    numpy.sinh: "sinh",
+    numpy.sqrt: "sqrt",
+    numpy.tan: "tan",
+    numpy.tanh: "tanh",
+    numpy.where: "where",
+}
+
+
+def _string(node):
+    if isinstance(node, ast.Index):
+        node = node.value
+    if isinstance(node, ast.Str):
+        return node.s
+    return None
+
+
+def _number(node):
+    if isinstance(node, ast.Num):
+        value = node.n
+    elif isinstance(node, getattr(ast, "Constant", ())):
+        value = node.value
+    else:
+        return None
+    if isinstance(value, bool):
+        return str(value)
+    elif uproot4._util.isint(value):
+        return str(int(value))
+    elif isinstance(value, float):
+        return repr(value)
+    return None
+
+
+def _to_numexpr(node, functions, getter, variables):
+    """
+    Returns the numexpr source code for an expression in which aliases have
+    been inlined, or None if numexpr can't evaluate it. The ``variables`` are
+    filled with a numexpr variable name for each ``TBranch`` name.
+    """
+    if uproot4.language.python._is_getter_call(node, getter):
+        name = node.args[0].s
+        if name not in variables:
+            variables[name] = "v{0}".format(len(variables))
+        return variables[name]
+
+    elif isinstance(node, ast.BinOp):
+        operator = _binary_operators.get(type(node.op))
+        left = _to_numexpr(node.left, functions, getter, variables)
+        right = _to_numexpr(node.right, functions, getter, variables)
+        if operator is None or left is None or right is None:
+            return None
+        return "({0} {1} {2})".format(left, operator, right)
+
+    elif isinstance(node, ast.UnaryOp):
+        operator = _unary_operators.get(type(node.op))
+        operand = _to_numexpr(node.operand, functions, getter, variables)
+        if operator is None or operand is None:
+            return None
+        return "({0}{1})".format(operator, operand)
+
+    elif isinstance(node, ast.Compare):
+        terms = [_to_numexpr(node.left, functions, getter, variables)]
+        for comparator in node.comparators:
+            terms.append(_to_numexpr(comparator, functions, getter, variables))
+        operators = [_comparisons.get(type(x)) for x in node.ops]
+        if any(x is None for x in terms + operators):
+            return None
+        return "({0})".format(
+            " & ".join(
+                "({0} {1} {2})".format(terms[i], operators[i], terms[i + 1])
+                for i in uproot4._util.range(len(operators))
+            )
+        )
+
+    elif isinstance(node, ast.Call):
+        if (
+            not isinstance(node.func, ast.Subscript)
+            or not isinstance(node.func.value, ast.Name)
+            or node.func.value.id != "function"
+            or len(node.keywords) != 0
+            or getattr(node, "starargs", None) is not None
+            or getattr(node, "kwargs", None) is not None
+        ):
+            return None
+        function = functions.get(_string(node.func.slice))
+        try:
+            name = _functions.get(function)
+        except TypeError:
+            return None
+        args = [_to_numexpr(x, functions, getter, variables) for x in node.args]
+        if name is None or any(x is None for x in args):
+            return None
+        return "{0}({1})".format(name, ", ".join(args))
+
+    else:
+        return _number(node)
+
+
+def _numexpr_input(array):
+    """
+    Returns the array in a form that numexpr accepts, or None if it can't.
+    """
+    if type(array) is not numpy.ndarray or array.ndim != 1:
+        return None
+    if not array.dtype.isnative:
+        return None
+    kind, itemsize = array.dtype.kind, array.dtype.itemsize
+    if kind == "b" or (kind in "if" and itemsize >= 4):
+        return array
+    elif kind == "i" or (kind == "u" and itemsize < 4):
+        return array.astype(numpy.int32)
+    elif kind == "u" and itemsize == 4:
+        return array.astype(numpy.int64)
+    elif kind == "f":
+        return array.astype(numpy.float32)
+    elif kind == "c":
+        return array.astype(numpy.complex128)
+    else:
+        return None
+
+
+class NumExprLanguage(uproot4.language.python.PythonLanguage):
+    """
+    Args:
+        functions (None or dict): Mapping from function name to function, or
+            None for ``default_functions``.
+        getter (str): Name of the function that extracts branches by name;
+            needed for branches whose names are not valid Python symbols.
+            Default is "get".
+        plan_cache (None or int): Number of compiled sets of expressions to
+            keep. If None, there is no limit.
+
+    NumExprLanguage is a :py:class:`~uproot4.language.Language` with the same
+    syntax and functions as
+    :py:class:`~uproot4.language.python.PythonLanguage`, which evaluates
+    expressions with ``numexpr``. Each expression (with its aliases
+    substituted) is evaluated in a single, multithreaded pass over blocks of
+    its inputs, so an expression like ``sqrt(px**2 + py**2) > 20`` does not
+    allocate a full-size array for each intermediate result. The number of
+    threads is controlled by ``numexpr.set_num_threads``.
+
+    Only expressions of flat, numerical arrays (one number per entry, as in
+    ``library="np"``), numbers, arithmetic (except ``//`` and ``%``),
+    comparisons, ``&``, ``|``, ``~``, and the functions that numexpr
+    implements (``sqrt``, ``exp``, ``log``, ``where``, trigonometric functions,
+    etc.) are evaluated by numexpr. All other expressions are evaluated by
+    :py:class:`~uproot4.language.python.PythonLanguage`, so the results are
+    the same (except possibly in integer or floating-point precision).
+    """
+
+    def __init__(self, functions=None, getter="get", plan_cache=100):
+        uproot4.extras.numexpr()
+        super(NumExprLanguage, self).__init__(functions, getter, plan_cache)
+
+    def compute_expressions(
+        self, arrays, expression_context, keys, aliases, file_path, object_path
+    ):
+        """
+        Args:
+            arrays (dict of arrays): Inputs to the computation.
+            expression_context (list of (str, dict) tuples): Expression strings
+                and a dict of metadata about each.
+            keys (list of str): Names of branches or aliases (for aliases that
+                refer to aliases).
+            aliases (list of str): Names of aliases.
+            file_path (str): File path for error messages.
+            object_path (str): Object path for error messages.
+
+        Computes an array for each expression, using ``numexpr`` where
+        possible.
+        """
+        numexpr = uproot4.extras.numexpr()
+
+        values = {}
+        for expression, context in expression_context:
+            branch = context.get("branch")
+            if branch is not None:
+                values[expression] = arrays[branch.cache_key]
+
+        names = []
+        cut = None
+        for expression, context in expression_context:
+            if context["is_primary"] and not context["is_cut"]:
+                names.append(expression)
+            elif context["is_primary"] and context["is_cut"] and cut is None:
+                cut = expression
+        expressions = tuple(names) if cut is None else tuple(names) + (cut,)
+
+        plan_key = (
+            "numexpr",
+            expressions,
+            uproot4.language.python._keys_in_expressions(expressions, keys, aliases),
+            tuple(sorted(aliases.items())),
+            frozenset(values),
+        )
+        translations = self._plan_cache.get(plan_key)
+        if translations is None:
+            translations = []
+            for expression in expressions:
+                variables = {}
+                source = _to_numexpr(
+                    uproot4.language.python._expression_to_inlined(
+                        expression,
+                        keys,
+                        aliases,
+                        self._functions,
+                        self._getter,
+                        values,
+                        file_path,
+                        object_path,
+                    ),
+                    self._functions,
+                    self._getter,
+                    variables,
+                )
+                if source is None or source in variables.values():
+                    # a single TBranch (no computation) or not numexpr
+                    translations.append(None)
+                else:
+                    translations.append((source, sorted(variables.items())))
+            self._plan_cache[plan_key] = translations
+
+        results = {}
+        fallback = set()
+        for expression, translation in zip(expressions, translations):
+            local_dict = None
+            if translation is not None:
+                source, variables = translation
+                local_dict = {}
+                for name, variable in variables:
+                    array = values.get(name)
+                    if array is not None:
+                        array = _numexpr_input(array)
+                    if array is None:
+                        local_dict = None
+                        break
+                    local_dict[variable] = array
+
+            if local_dict is not None:
+                try:
+                    results[expression] = numexpr.evaluate(
+                        source, local_dict=local_dict, global_dict={}
+                    )
+                except (KeyError, TypeError, ValueError, NotImplementedError):
+                    fallback.add(expression)
+            else:
+                fallback.add(expression)
+
+        if len(fallback) != 0:
+            fallback_context = []
+            for expression, context in expression_context:
+                if not context["is_primary"]:
+                    fallback_context.append((expression, context))
+                elif expression in fallback:
+                    fallback_context.append((expression, dict(context, is_cut=False)))
+                else:
+                    fallback_context.append(
+                        (expression, dict(context, is_primary=False))
+                    )
+            results.update(
+                super(NumExprLanguage, self).compute_expressions(
+                    arrays, fallback_context, keys, aliases, file_path, object_path
+                )
+            )
+
+        output = dict((name, results[name]) for name in names)
+
+        if cut is not None:
+            cut = results[cut] != 0
+            for name in output:
+                output[name] = output[name][cut]
+
+        return output
@@ -11,10 +11,12 @@ the default language.
 from __future__ import absolute_import
 
 import ast
+import re
 
 import numpy
 
 import uproot4.language
+import uproot4.cache
 
 
 def _expression_to_node(expression, file_path, object_path):
@@ -36,6 +38,23 @@ def _expression_to_node(expression, file_path, object_path):
     return node
 
 
+_dotted_name = re.compile(r"[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*")
+
+
+def _keys_in_expressions(expressions, keys, aliases):
+    # a plan only depends on which (dotted) names in its expressions are keys,
+    # and checking those names doesn't require listing all of the keys
+    out = set()
+    for expression in tuple(expressions) + tuple(aliases.values()):
+        for name in _dotted_name.findall(expression):
+            parts = name.split(".")
+            for i in range(1, len(parts) + 1):
+                prefix = ".".join(parts[:i])
+                if prefix in keys:
+                    out.add(prefix)
+    return frozenset(out)
+
+
 def _attribute_to_dotted_name(node):
     if isinstance(node, ast.Attribute):
         tmp = _attribute_to_dotted_name(node.value)
@@ -180,6 +199,279 @@ def _expression_to_function(
     return eval(compile(expression, "<dynamic>", "eval"), scope)
 
 
+def _is_getter_call(node, getter):
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id == getter
+        and len(node.args) == 1
+        and isinstance(node.args[0], ast.Str)
+    )
+
+
+def _expression_to_inlined(
+    expression,
+    keys,
+    aliases,
+    functions,
+    getter,
+    branch_names,
+    file_path,
+    object_path,
+    symbol_path=(),
+):
+    node = _expression_to_node(expression, file_path, object_path)
+    try:
+        expr = _ast_as_branch_expression(
+            node.body[0].value, keys, aliases, functions, getter
+        )
+    except KeyError as err:
+        raise uproot4.KeyInFileError(
+            err.args[0],
+            keys=sorted(keys) + list(aliases),
+            file_path=file_path,
+            object_path=object_path,
+        )
+    return _inline_aliases(
+        expr,
+        keys,
+        aliases,
+        functions,
+        getter,
+        branch_names,
+        file_path,
+        object_path,
+        symbol_path,
+    )
+
+
+def _inline_aliases(
+    node,
+    keys,
+    aliases,
+    functions,
+    getter,
+    branch_names,
+    file_path,
+    object_path,
+    symbol_path,
+):
+    if _is_getter_call(node, getter):
+        name = node.args[0].s
+        if name in aliases and name not in branch_names and name not in symbol_path:
+            return _expression_to_inlined(
+                aliases[name],
+                keys,
+                aliases,
+                functions,
+                getter,
+                branch_names,
+                file_path,
+                object_path,
+                symbol_path + (name,),
+            )
+        else:
+            return node
+
+    elif isinstance(node, ast.AST):
+        args = []
+        for field_name in node._fields:
+            args.append(
+                _inline_aliases(
+                    getattr(node, field_name),
+                    keys,
+                    aliases,
+                    functions,
+                    getter,
+                    branch_names,
+                    file_path,
+                    object_path,
+                    symbol_path,
+                )
+            )
+        new_node = type(node)(*args)
+        new_node.lineno = getattr(node, "lineno", 1)
+        new_node.col_offset = getattr(node, "col_offset", 0)
+        return new_node
+
+    elif isinstance(node, list):
+        return [
+            _inline_aliases(
+                x,
+                keys,
+                aliases,
+                functions,
+                getter,
+                branch_names,
+                file_path,
+                object_path,
+                symbol_path,
+            )
+            for x in node
+        ]
+
+    else:
+        return node
+
+
+_cse_types = (
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.BoolOp,
+    ast.Compare,
+    ast.IfExp,
+    ast.Call,
+    ast.Subscript,
+    ast.Attribute,
+)
+_lazy_types = tuple(
+    getattr(ast, x)
+    for x in ("Lambda", "ListComp", "SetComp", "DictComp", "GeneratorExp")
+    if hasattr(ast, x)
+)
+
+
+def _is_cse_candidate(node, getter):
+    if not isinstance(node, _cse_types) or _is_getter_call(node, getter):
+        return False
+    if (
+        isinstance(node, ast.Subscript)
+        and isinstance(node.value, ast.Name)
+        and node.value.id == "function"
+    ):
+        return False
+    return True
+
+
+def _always_evaluated(node):
+    # which fields of a node are evaluated whenever the node is evaluated
+    # (subexpressions that may be skipped can't be computed ahead of time)
+    if isinstance(node, ast.BoolOp):
+        return lambda field_name, index: field_name == "values" and index == 0
+    elif isinstance(node, ast.IfExp):
+        return lambda field_name, index: field_name == "test"
+    elif isinstance(node, _lazy_types):
+        return lambda field_name, index: False
+    else:
+        return lambda field_name, index: True
+
+
+def _count_subexpressions(node, getter, always, counts):
+    if isinstance(node, ast.AST):
+        if always and _is_cse_candidate(node, getter):
+            key = ast.dump(node)
+            counts[key] = counts.get(key, 0) + 1
+        is_always = _always_evaluated(node)
+        for field_name in node._fields:
+            field_value = getattr(node, field_name)
+            if isinstance(field_value, list):
+                for index, x in enumerate(field_value):
+                    _count_subexpressions(
+                        x, getter, always and is_always(field_name, index), counts
+                    )
+            else:
+                _count_subexpressions(
+                    field_value, getter, always and is_always(field_name, 0), counts
+                )
+
+
+def _eliminate_subexpressions(node, getter, always, counts, temporaries, assignments):
+    if isinstance(node, ast.AST):
+        key = None
+        if _is_cse_candidate(node, getter):
+            # all temporaries are computed before any expression, so they can
+            # be used even where the subexpression might be skipped
+            key = ast.dump(node)
+            if key in temporaries:
+                return ast.Name(temporaries[key], ast.Load())
+            elif not always or counts[key] < 2:
+                key = None
+
+        is_always = _always_evaluated(node)
+        args = []
+        for field_name in node._fields:
+            field_value = getattr(node, field_name)
+            if isinstance(field_value, list):
+                args.append(
+                    [
+                        _eliminate_subexpressions(
+                            x,
+                            getter,
+                            always and is_always(field_name, index),
+                            counts,
+                            temporaries,
+                            assignments,
+                        )
+                        for index, x in enumerate(field_value)
+                    ]
+                )
+            else:
+                args.append(
+                    _eliminate_subexpressions(
+                        field_value,
+                        getter,
+                        always and is_always(field_name, 0),
+                        counts,
+                        temporaries,
+                        assignments,
+                    )
+                )
+        new_node = type(node)(*args)
+        new_node.lineno = getattr(node, "lineno", 1)
+        new_node.col_offset = getattr(node, "col_offset", 0)
+
+        if key is not None:
+            temporaries[key] = "_cse{0}".format(len(assignments))
+            assignments.append(
+                ast.Assign([ast.Name(temporaries[key], ast.Store())], new_node)
+            )
+            return ast.Name(temporaries[key], ast.Load())
+        else:
+            return new_node
+
+    else:
+        return node
+
+
+def _expressions_to_plan(
+    expressions, keys, aliases, functions, getter, branch_names, file_path, object_path
+):
+    """
+    Compiles all of the ``expressions`` into a single function that returns a
+    tuple of their values, with aliases inlined and each subexpression that
+    appears more than once computed only once.
+    """
+    nodes = [
+        _expression_to_inlined(
+            expression,
+            keys,
+            aliases,
+            functions,
+            getter,
+            branch_names,
+            file_path,
+            object_path,
+        )
+        for expression in expressions
+    ]
+
+    counts = {}
+    for node in nodes:
+        _count_subexpressions(node, getter, True, counts)
+
+    temporaries = {}
+    assignments = []
+    nodes = [
+        _eliminate_subexpressions(node, getter, True, counts, temporaries, assignments)
+        for node in nodes
+    ]
+
+    module = ast.parse("def _plan():\n    return ()")
+    module.body[0].body = assignments + [ast.Return(ast.Tuple(nodes, ast.Load()))]
+    ast.fix_missing_locations(module)
+    return compile(module, "<dynamic>", "exec")
+
+
 def _vectorized_erf(complement):
     a1 = 0.254829592
     a2 = -0.284496736
@@ -242,6 +534,10 @@ class PythonLanguage(uproot4.language.Language):
         getter (str): Name of the function that extracts branches by name;
             needed for branches whose names are not valid Python symbols.
             Default is "get".
+        plan_cache (None or int): Number of compiled sets of expressions to
+            keep, so that repeated calls (such as each step of
+            :py:meth:`~uproot4.behavior.TBranch.HasBranches.iterate`) do not
+            parse and compile them again. If None, there is no limit.
 
     PythonLanguage is the default :py:class:`~uproot4.language.Language` for
     interpreting expressions passed to
@@ -252,6 +548,10 @@ class PythonLanguage(uproot4.language.Language):
     Unlike standard Python, an expression with attributes, such as
     ``some.thing``, can be a single identifier, so that a ``TBranch`` whose
     name contains dots does not need to be loaded with ``get("some.thing")``.
+
+    All of the expressions and the cut are compiled together, with aliases
+    substituted into them, and a subexpression that appears more than once
+    (such as a shared alias) is computed only once.
     """
 
     default_functions = {
@@ -317,12 +617,13 @@ class PythonLanguage(uproot4.language.Language):
         "where": numpy.where,
     }
 
-    def __init__(self, functions=None, getter="get"):
+    def __init__(self, functions=None, getter="get", plan_cache=100):
         if functions is None:
             self._functions = self.default_functions
         else:
             self._functions = dict(functions)
         self._getter = getter
+        self._plan_cache = uproot4.cache.LRUCache(plan_cache)
 
     @property
     def functions(self):
@@ -339,6 +640,14 @@ class PythonLanguage(uproot4.language.Language):
         """
         return self._getter
 
+    @property
+    def plan_cache(self):
+        """
+        Cache of compiled sets of expressions, keyed by the expressions, the
+        names of ``TBranches``, and the aliases.
+        """
+        return self._plan_cache
+
     def free_symbols(self, expression, keys, aliases, file_path, object_path):
         """
         Args:
@@ -398,43 +707,48 @@ class PythonLanguage(uproot4.language.Language):
                 )()
             return values[name]
 
-        scope = {self._getter: getter, "function": self._functions}
         for expression, context in expression_context:
             branch = context.get("branch")
             if branch is not None:
                 values[expression] = arrays[branch.cache_key]
 
-        output = {}
+        names = []
+        cut = None
         for expression, context in expression_context:
             if context["is_primary"] and not context["is_cut"]:
-                output[expression] = _expression_to_function(
-                    expression,
-                    keys,
-                    aliases,
-                    self._functions,
-                    self._getter,
-                    scope,
-                    file_path,
-                    object_path,
-                )()
+                names.append(expression)
+            elif context["is_primary"] and context["is_cut"] and cut is None:
+                cut = expression
+        expressions = tuple(names) if cut is None else tuple(names) + (cut,)
+
+        plan_key = (
+            expressions,
+            _keys_in_expressions(expressions, keys, aliases),
+            tuple(sorted(aliases.items())),
+            frozenset(values),
+        )
+        code = self._plan_cache.get(plan_key)
+        if code is None:
+            code = _expressions_to_plan(
+                expressions,
+                keys,
+                aliases,
+                self._functions,
+                self._getter,
+                values,
+                file_path,
+                object_path,
+            )
+            self._plan_cache[plan_key] = code
 
-        cut = None
-        for expression, context in expression_context:
-            if context["is_primary"] and context["is_cut"]:
-                cut = _expression_to_function(
-                    expression,
-                    keys,
-                    aliases,
-                    self._functions,
-                    self._getter,
-                    scope,
-                    file_path,
-                    object_path,
-                )()
-                break
+        scope = {self._getter: getter, "function": self._functions}
+        exec(code, scope)
+        results = scope["_plan"]()
+
+        output = dict(zip(names, results))
 
         if cut is not None:
-            cut = cut != 0
+            cut = results[-1] != 0
             for name in output:
                 output[name] = output[name][cut]
 
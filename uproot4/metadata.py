@@ -0,0 +1,210 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+"""
+A persistent index of deserialized ``TTree`` metadata, which lets a file that
+has been opened before skip reading, decompressing, and deserializing its
+``TTrees`` (with all of their ``TBranches``, ``TLeaves``, ``fBasketSeek``,
+``fBasketEntry``, etc.).
+
+If the ``metadata_dir`` option is not None,
+:py:meth:`~uproot4.reading.ReadOnlyKey.get` looks for each ``TTree`` in the
+:py:class:`~uproot4.metadata.MetadataIndex` in that directory before reading
+it from the file, and adds each ``TTree`` that it does read. Entries are keyed
+by the file's UUID and the ``TKey``'s seek position, so a rewritten file (which
+has a new UUID) never uses stale metadata.
+
+The ``TTree`` is stored as a pickle in which the references to the open file,
+its ``TKey``, and other objects that belong to one process are replaced by
+placeholders, which are filled in with the current file and ``TKey`` when the
+``TTree`` is loaded. ``TBranches`` that had not been deserialized when the
+``TTree`` was stored are stored as names and positions; the first time one of
+them is accessed, the ``TTree``'s data are read from the file again.
+
+Since the pickles contain the uproot version and are loaded with ``pickle``,
+the directory should only be shared with trusted users.
+"""
+
+from __future__ import absolute_import
+
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import weakref
+
+import uproot4.source.chunk
+import uproot4._util
+
+
+_lock_type = type(threading.Lock())
+_format_version = 3
+
+
+class _MetadataPickler(pickle.Pickler):
+    def __init__(self, file, key):
+        pickle.Pickler.__init__(self, file, pickle.HIGHEST_PROTOCOL)
+        self._file = key.file
+        self._key = key
+
+    def persistent_id(self, obj):
+        if obj is self._file:
+            return "file"
+        elif obj is self._key:
+            return "key"
+        elif isinstance(obj, _lock_type):
+            return "lock"
+        elif isinstance(obj, (uproot4.source.chunk.Chunk, weakref.ref)):
+            return "none"
+        elif isinstance(obj, uproot4.source.chunk.Source):
+            raise pickle.PicklingError("cannot store a Source in a MetadataIndex")
+        else:
+            return None
+
+
+class _MetadataUnpickler(pickle.Unpickler):
+    def __init__(self, file, key):
+        pickle.Unpickler.__init__(self, file)
+        self._file = key.file
+        self._key = key
+
+    def persistent_load(self, pid):
+        if pid == "file":
+            return self._file
+        elif pid == "key":
+            return self._key
+        elif pid == "lock":
+            return threading.Lock()
+        elif pid == "none":
+            return None
+        else:
+            raise pickle.UnpicklingError(
+                "unrecognized persistent id: {0}".format(repr(pid))
+            )
+
+
+def _read_embedded_baskets(hasbranches):
+    # TBaskets embedded in the metadata are read from the TTree's chunk, which
+    # is not stored; TBranches that have not been deserialized yet will read
+    # it again when they are
+    import uproot4.models.TObjArray
+
+    branches = hasbranches.member("fBranches")
+    if isinstance(branches, uproot4.models.TObjArray.Model_TObjArrayOfTBranches):
+        branches = branches.materialized
+    for branch in branches:
+        branch.embedded_baskets
+        _read_embedded_baskets(branch)
+
+
+class MetadataIndex(object):
+    """
+    Args:
+        directory (str): Path of the index directory, which is created if it
+            does not exist.
+
+    A directory of deserialized ``TTrees``, one file for each ``TKey``, in a
+    subdirectory named by the file's UUID.
+
+    Each entry records the version of uproot, the version of Python, and the
+    ``minimal_ttree_metadata`` option with which it was made, and it is
+    ignored if any of these differ. There is no size limit: entries are small
+    compared to the data they describe, and the directory can be deleted at any
+    time.
+    """
+
+    def __init__(self, directory):
+        self._directory = directory
+
+    def __repr__(self):
+        return "<MetadataIndex {0} at 0x{1:012x}>".format(
+            repr(self._directory), id(self)
+        )
+
+    @property
+    def directory(self):
+        """
+        Path of the index directory.
+        """
+        return self._directory
+
+    def path(self, key):
+        """
+        Path of the file for a :py:class:`~uproot4.reading.ReadOnlyKey`.
+        """
+        return os.path.join(
+            self._directory, key.file.hex_uuid, "{0}.pkl".format(key.fSeekKey)
+        )
+
+    def _header(self, key):
+        import uproot4.version
+
+        return {
+            "format": _format_version,
+            "uproot": uproot4.version.__version__,
+            "python": tuple(sys.version_info[:2]),
+            "minimal_ttree_metadata": key.file.options["minimal_ttree_metadata"],
+            "classname": key.fClassName,
+        }
+
+    def load(self, key):
+        """
+        Returns the object for a :py:class:`~uproot4.reading.ReadOnlyKey`,
+        attached to the key's file, or None if it is not in the index (or the
+        entry can't be used).
+        """
+        try:
+            with open(self.path(key), "rb") as file:
+                if pickle.load(file) != self._header(key):
+                    return None
+                return _MetadataUnpickler(file, key).load()
+        except (IOError, OSError):
+            return None
+        except Exception:
+            # an entry that can't be loaded (truncated, or from classes that
+            # have changed) is treated as missing and will be replaced
+            return None
+
+    def save(self, key, obj):
+        """
+        Adds ``obj``, which was read from a
+        :py:class:`~uproot4.reading.ReadOnlyKey`, to the index. Only objects
+        with ``TBranches`` are stored; if the object can't be pickled, it is
+        not stored.
+
+        The entry is written to a temporary name and renamed into place, so
+        that other processes never see a partial file.
+        """
+        import uproot4.behaviors.TBranch
+
+        if not isinstance(obj, uproot4.behaviors.TBranch.HasBranches):
+            return
+
+        _read_embedded_baskets(obj)
+
+        directory = os.path.dirname(self.path(key))
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                if not os.path.isdir(directory):
+                    raise
+
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump(self._header(key), file, pickle.HIGHEST_PROTOCOL)
+                _MetadataPickler(file, key).dump(obj)
+            if uproot4._util.py2:
+                if os.name == "nt" and os.path.exists(self.path(key)):
+                    os.remove(self.path(key))
+                os.rename(tmp, self.path(key))
+            else:
+                os.replace(tmp, self.path(key))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        except (OSError, IOError):
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
@@ -348,7 +348,7 @@ class Model(object):
 
     def __exit__(self, exception_type, exception_value, traceback):
         if isinstance(self._file, uproot4.reading.ReadOnlyFile):
-            self._file.source.__exit__(exception_type, exception_value, traceback)
+            self._file.__exit__(exception_type, exception_value, traceback)
 
     @property
     def classname(self):
@@ -75,6 +75,21 @@ class Model_TBasket(uproot4.model.Model):
         """
         return self._byte_offsets
 
+    @property
+    def nbytes(self):
+        """
+        The number of bytes of uncompressed data and entry offsets held by
+        this ``TBasket`` (used to limit the size of a ``basket_cache``).
+        """
+        out = 0
+        if self._raw_data is not None:
+            out += self._raw_data.nbytes
+        elif self._data is not None:
+            out += self._data.nbytes
+        if self._byte_offsets is not None:
+            out += self._byte_offsets.nbytes
+        return out
+
     def array(self, interpretation=None, library="ak"):
         """
         The ``TBasket`` data and entry offsets as an array, given an
@@ -255,7 +270,12 @@ class Model_TBasket(uproot4.model.Model):
         else:
             if self.compressed_bytes != self.uncompressed_bytes:
                 uncompressed = uproot4.compression.decompress(
-                    chunk, cursor, {}, self.compressed_bytes, self.uncompressed_bytes,
+                    chunk,
+                    cursor,
+                    {},
+                    self.compressed_bytes,
+                    self.uncompressed_bytes,
+                    executor=context.get("decompression_executor"),
                 )
                 self._raw_data = uncompressed.get(
                     0,
@@ -6,20 +6,27 @@ Defines a versionless model for ``TObjArray``.
 
 from __future__ import absolute_import
 
+import bisect
 import struct
+import threading
 
 try:
     from collections.abc import Sequence
 except ImportError:
     from collections import Sequence
 
+import numpy
+
+import uproot4.const
 import uproot4.model
 import uproot4.deserialization
 import uproot4.models.TObject
+import uproot4.models.TNamed
 import uproot4.models.TBasket
 
 
 _tobjarray_format1 = struct.Struct(">ii")
+_tobjarray_format2 = struct.Struct(">I")
 
 
 class Model_TObjArray(uproot4.model.Model, Sequence):
@@ -128,3 +135,410 @@ in file {1}""".format(
                 as_class=uproot4.models.TBasket.Model_TBasket,
             )
             self._data.append(item)
+
+
+# number of class headers (the class itself and its bases) before the TNamed
+_tbranch_depth = {
+    "TBranch": 1,
+    "TBranchElement": 2,
+    "TBranchObject": 2,
+    "TBranchRef": 2,
+    "TBranchSTL": 2,
+    "TBranchClones": 2,
+}
+
+_unread = object()
+_reading = object()
+
+
+class Model_TObjArrayOfTBranches(Model_TObjArray):
+    """
+    A specialized :py:class:`~uproot4.model.Model` for a ``TTree``'s
+    ``TObjArray`` of ``TBranches``, which deserializes each ``TBranch`` on
+    demand.
+
+    While the ``TTree`` is being read, only the name and byte range of each
+    ``TBranch`` are recorded; the ``TBranch`` (with its subbranches and
+    ``TLeaves``) is deserialized the first time it is accessed by index or
+    iteration. A reference from one ``TBranch`` to an object in another, such
+    as a ``TLeaf``'s ``fLeafCount``, deserializes the other one when it is
+    encountered.
+
+    The ``TTree``'s uncompressed data are held until all of the ``TBranches``
+    have been deserialized. If the file is closed before then, its streamers
+    are read first, so that the remaining ``TBranches`` can still be
+    deserialized.
+    """
+
+    def read_members(self, chunk, cursor, context, file):
+        if self.is_memberwise:
+            raise NotImplementedError(
+                """memberwise serialization of {0}
+in file {1}""".format(
+                    type(self).__name__, self.file.file_path
+                )
+            )
+        self._bases.append(
+            uproot4.models.TObject.Model_TObject.read(
+                chunk,
+                cursor,
+                context,
+                file,
+                self._file,
+                self._parent,
+                concrete=self._concrete,
+            )
+        )
+
+        self._members["fName"] = cursor.string(chunk, context)
+        self._members["fSize"], self._members["fLowerBound"] = cursor.fields(
+            chunk, _tobjarray_format1, context
+        )
+
+        # make sure that the copies of the cursor share its refs
+        self._refs = cursor.refs
+
+        self._chunk = chunk
+        self._read_file = file
+        self._lock = threading.RLock()
+        self._next_resolver = context.get("resolve_reference")
+        context["resolve_reference"] = self._resolve_reference
+        self._context = dict(context)
+
+        self._data = []
+        self._names = []
+        self._classnames = []
+        self._cursors = []
+        self._starts = []
+        self._stops = []
+        self._num_unread = 0
+        for i in uproot4._util.range(self._members["fSize"]):
+            start = cursor.displacement()
+            scanned = self._scan(chunk, cursor.copy(), context, file)
+            if scanned is None:
+                item = uproot4.deserialization.read_object_any(
+                    chunk, cursor, context, file, self._file, self._parent
+                )
+                self._data.append(item)
+                self._names.append(None if item is None else item.member("fName"))
+                self._classnames.append(None if item is None else item.classname)
+                self._cursors.append(None)
+                self._stops.append(cursor.displacement())
+            else:
+                name, classname, stop = scanned
+                self._data.append(_unread)
+                self._names.append(name)
+                self._classnames.append(classname)
+                self._cursors.append(cursor.copy())
+                self._stops.append(stop)
+                self._num_unread += 1
+                cursor.move_to(cursor.origin + stop)
+            self._starts.append(start)
+
+        if self._num_unread == 0:
+            self._release()
+        elif isinstance(file, uproot4.reading.ReadOnlyFile):
+            file._lazy_branches.add(self)
+
+    def _scan(self, chunk, cursor, context, file):
+        # the same steps as read_object_any, but only the name is read
+        beg = cursor.displacement()
+        bcnt = numpy.int64(cursor.field(chunk, _tobjarray_format2, context))
+        if (bcnt & uproot4.const.kByteCountMask) == 0 or (
+            bcnt == uproot4.const.kNewClassTag
+        ):
+            return None
+
+        start = cursor.displacement()
+        tag = numpy.int64(cursor.field(chunk, _tobjarray_format2, context))
+        if tag & uproot4.const.kClassMask == 0:
+            return None
+
+        elif tag == uproot4.const.kNewClassTag:
+            classname = cursor.classname(chunk, context)
+            cls = file.class_named(classname)
+            cursor.refs[start + uproot4.const.kMapOffset] = cls
+
+        else:
+            ref = int(tag & ~uproot4.const.kClassMask)
+            if ref not in cursor.refs and not self._resolve_reference(ref):
+                return None
+            cls = cursor.refs[ref]
+            try:
+                classname = uproot4.model.classname_decode(cls.__name__)[0]
+            except ValueError:
+                return None
+
+        depth = _tbranch_depth.get(classname)
+        if depth is None:
+            return None
+        for i in uproot4._util.range(depth):
+            uproot4.deserialization.numbytes_version(chunk, cursor, context)
+        named = uproot4.models.TNamed.Model_TNamed.read(
+            chunk, cursor, context, file, self._file, self._parent
+        )
+
+        stop = beg + int(bcnt & ~uproot4.const.kByteCountMask) + 4
+        return named.member("fName"), classname, stop
+
+    def _materialize(self, index):
+        with self._lock:
+            if self._data[index] is _unread:
+                self._data[index] = _reading
+                try:
+                    if self._chunk is None:
+                        # the TTree's data are not pickled, so read them again
+                        self._chunk = self._context[
+                            "TKey"
+                        ].get_uncompressed_chunk_cursor()[0]
+                    item = self._read(index)
+                except Exception:
+                    self._data[index] = _unread
+                    raise
+                self._data[index] = item
+                self._cursors[index] = None
+                self._num_unread -= 1
+                if self._num_unread == 0:
+                    self._release()
+            return self._data[index]
+
+    def _read(self, index):
+        cursor = self._cursors[index].copy()
+        context = dict(self._context)
+        try:
+            return uproot4.deserialization.read_object_any(
+                self._chunk, cursor, context, self._read_file, self._file, self._parent
+            )
+
+        except uproot4.deserialization.DeserializationError:
+            # as in ReadOnlyKey.get, try again with classes from the streamers
+            if not uproot4.deserialization._remove_general_classes(
+                self._read_file, context.get("breadcrumbs")
+            ):
+                raise
+
+            # classes that were referenced while scanning are replaced, too
+            for ref, obj in list(cursor.refs.items()):
+                if isinstance(obj, type) and hasattr(obj, "read"):
+                    try:
+                        classname = uproot4.model.classname_decode(obj.__name__)[0]
+                    except ValueError:
+                        continue
+                    cursor.refs[ref] = self._read_file.class_named(classname)
+
+            return uproot4.deserialization.read_object_any(
+                self._chunk,
+                self._cursors[index].copy(),
+                dict(self._context),
+                self._read_file,
+                self._file,
+                self._parent,
+            )
+
+    def _release(self):
+        self._chunk = None
+        self._context = None
+        self._cursors = None
+
+    def _resolve_reference(self, ref):
+        position = ref - uproot4.const.kMapOffset
+        index = bisect.bisect_right(self._starts, position) - 1
+        if (
+            index >= 0
+            and position < self._stops[index]
+            and (self._data[index] is _unread or self._data[index] is _reading)
+        ):
+            self._materialize(index)
+            return ref in self._refs
+        elif self._next_resolver is not None:
+            return self._next_resolver(ref)
+        else:
+            return False
+
+    @property
+    def names(self):
+        """
+        The names of the ``TBranches``, which are available without
+        deserializing them.
+        """
+        return self._names
+
+    @property
+    def classnames(self):
+        """
+        The C++ class names of the ``TBranches``, which are available without
+        deserializing them.
+        """
+        return self._classnames
+
+    @property
+    def num_unread(self):
+        """
+        The number of ``TBranches`` that have not been deserialized yet.
+        """
+        return self._num_unread
+
+    def __getitem__(self, where):
+        if isinstance(where, slice):
+            return [self[i] for i in uproot4._util.range(len(self))[where]]
+        item = self._data[where]
+        if item is _unread or item is _reading:
+            # another thread may be reading it; wait for the lock
+            if where < 0:
+                where += len(self)
+            item = self._materialize(where)
+        return item
+
+    def __iter__(self):
+        for i in uproot4._util.range(len(self)):
+            yield self[i]
+
+    def index(self, value):
+        for i, item in enumerate(self._data):
+            if item is value:
+                return i
+        else:
+            raise ValueError("{0} is not in {1}".format(repr(value), repr(self)))
+
+    def tojson(self):
+        return {
+            "_typename": "TObjArray",
+            "name": "TObjArray",
+            "arr": [x.tojson() for x in self],
+        }
+
+    @property
+    def materialized(self):
+        """
+        The ``TBranches`` that have already been deserialized (without
+        deserializing any others).
+        """
+        with self._lock:
+            return [x for x in self._data if x is not _unread and x is not _reading]
+
+    def __getstate__(self):
+        # unread TBranches stay unread: only their names and positions (and
+        # the refs they may need) are pickled, not the TTree's data
+        with self._lock:
+            state = dict(self.__dict__)
+            state["_data"] = [None if x is _unread else x for x in self._data]
+            state["_unread"] = [x is _unread for x in self._data]
+        for name in ("_lock", "_next_resolver", "_read_file", "_chunk"):
+            state.pop(name, None)
+        if state["_context"] is not None:
+            state["_context"] = dict(state["_context"])
+            state["_context"].pop("resolve_reference", None)
+        return state
+
+    def __setstate__(self, state):
+        unread = state.pop("_unread")
+        self.__dict__.update(state)
+        self._data = [_unread if u else x for x, u in zip(self._data, unread)]
+        self._lock = threading.RLock()
+        self._next_resolver = None
+        self._read_file = self._file
+        self._chunk = None
+        if self._context is not None:
+            self._context["resolve_reference"] = self._resolve_reference
+        if self._num_unread != 0 and isinstance(
+            self._file, uproot4.reading.ReadOnlyFile
+        ):
+            self._file._lazy_branches.add(self)
+
+
+class Model_TObjArrayOfTLeaves(Model_TObjArray):
+    """
+    A specialized :py:class:`~uproot4.model.Model` for a ``TTree``'s
+    ``TObjArray`` of ``TLeaves``, which are references to ``TLeaves`` in the
+    ``TBranches`` of a :py:class:`~uproot4.models.TObjArray.Model_TObjArrayOfTBranches`.
+
+    The references are resolved (deserializing the ``TBranch`` that contains
+    each ``TLeaf``) the first time they are accessed.
+    """
+
+    def read_members(self, chunk, cursor, context, file):
+        if self.is_memberwise:
+            raise NotImplementedError(
+                """memberwise serialization of {0}
+in file {1}""".format(
+                    type(self).__name__, self.file.file_path
+                )
+            )
+        self._bases.append(
+            uproot4.models.TObject.Model_TObject.read(
+                chunk,
+                cursor,
+                context,
+                file,
+                self._file,
+                self._parent,
+                concrete=self._concrete,
+            )
+        )
+
+        self._members["fName"] = cursor.string(chunk, context)
+        self._members["fSize"], self._members["fLowerBound"] = cursor.fields(
+            chunk, _tobjarray_format1, context
+        )
+
+        self._refs = cursor.refs
+        self._resolver = context.get("resolve_reference")
+        self._data = []
+        self._tags = []
+        for i in uproot4._util.range(self._members["fSize"]):
+            start = cursor.index
+            tag = numpy.int64(cursor.field(chunk, _tobjarray_format2, context))
+            if (
+                tag > 1
+                and (tag & uproot4.const.kByteCountMask) == 0
+                and (tag & uproot4.const.kClassMask) == 0
+            ):
+                # reference to an object that has already been (or will be) read
+                self._data.append(self._refs.get(int(tag), _unread))
+                self._tags.append(int(tag))
+            else:
+                cursor.move_to(start)
+                item = uproot4.deserialization.read_object_any(
+                    chunk, cursor, context, file, self._file, self._parent
+                )
+                self._data.append(item)
+                self._tags.append(None)
+
+    def __getitem__(self, where):
+        if isinstance(where, slice):
+            return [self[i] for i in uproot4._util.range(len(self))[where]]
+        item = self._data[where]
+        if item is _unread:
+            tag = self._tags[where]
+            if tag not in self._refs and self._resolver is not None:
+                self._resolver(tag)
+            item = self._refs.get(tag)
+            self._data[where] = item
+        return item
+
+    def __iter__(self):
+        for i in uproot4._util.range(len(self)):
+            yield self[i]
+
+    def tojson(self):
+        return {
+            "_typename": "TObjArray",
+            "name": "TObjArray",
+            "arr": [x.tojson() for x in self],
+        }
+
+    def __getstate__(self):
+        # unresolved references stay unresolved; the resolver is a method of
+        # the Model_TObjArrayOfTBranches, which is pickled with it
+        state = dict(self.__dict__)
+        state["_data"] = [None if x is _unread else x for x in self._data]
+        state["_unread"] = [x is _unread for x in self._data]
+        state["_resolver"] = getattr(self._resolver, "__self__", None)
+        return state
+
+    def __setstate__(self, state):
+        unread = state.pop("_unread")
+        resolver = state.pop("_resolver")
+        self.__dict__.update(state)
+        self._data = [_unread if u else x for x, u in zip(self._data, unread)]
+        self._resolver = None if resolver is None else resolver._resolve_reference
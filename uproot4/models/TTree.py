@@ -15,6 +15,7 @@ import numpy
 
 import uproot4.model
 import uproot4.deserialization
+import uproot4.models.TObjArray
 import uproot4.behaviors.TTree
 
 
@@ -93,10 +94,14 @@ in file {1}""".format(
             self._members["fAutoSave"],
             self._members["fEstimate"],
         ) = cursor.fields(chunk, _ttree16_format1, context)
-        self._members["fBranches"] = file.class_named("TObjArray").read(
+        self._members[
+            "fBranches"
+        ] = uproot4.models.TObjArray.Model_TObjArrayOfTBranches.read(
             chunk, cursor, context, file, self._file, self._concrete
         )
-        self._members["fLeaves"] = file.class_named("TObjArray").read(
+        self._members[
+            "fLeaves"
+        ] = uproot4.models.TObjArray.Model_TObjArrayOfTLeaves.read(
             chunk, cursor, context, file, self._file, self._concrete
         )
         self._members["fAliases"] = uproot4.deserialization.read_object_any(
@@ -244,10 +249,14 @@ in file {1}""".format(
             self._members["fAutoSave"],
             self._members["fEstimate"],
         ) = cursor.fields(chunk, _ttree17_format1, context)
-        self._members["fBranches"] = file.class_named("TObjArray").read(
+        self._members[
+            "fBranches"
+        ] = uproot4.models.TObjArray.Model_TObjArrayOfTBranches.read(
             chunk, cursor, context, file, self._file, self._concrete
         )
-        self._members["fLeaves"] = file.class_named("TObjArray").read(
+        self._members[
+            "fLeaves"
+        ] = uproot4.models.TObjArray.Model_TObjArrayOfTLeaves.read(
             chunk, cursor, context, file, self._file, self._concrete
         )
         self._members["fAliases"] = uproot4.deserialization.read_object_any(
@@ -397,10 +406,14 @@ in file {1}""".format(
             self._members["fAutoFlush"],
             self._members["fEstimate"],
         ) = cursor.fields(chunk, _ttree18_format1, context)
-        self._members["fBranches"] = file.class_named("TObjArray").read(
+        self._members[
+            "fBranches"
+        ] = uproot4.models.TObjArray.Model_TObjArrayOfTBranches.read(
             chunk, cursor, context, file, self._file, self._concrete
         )
-        self._members["fLeaves"] = file.class_named("TObjArray").read(
+        self._members[
+            "fLeaves"
+        ] = uproot4.models.TObjArray.Model_TObjArrayOfTLeaves.read(
             chunk, cursor, context, file, self._file, self._concrete
         )
         self._members["fAliases"] = uproot4.deserialization.read_object_any(
@@ -567,10 +580,14 @@ in file {1}""".format(
         self._members["fClusterSize"] = cursor.array(
             chunk, self.member("fNClusterRange"), tmp, context
         )
-        self._members["fBranches"] = file.class_named("TObjArray").read(
+        self._members[
+            "fBranches"
+        ] = uproot4.models.TObjArray.Model_TObjArrayOfTBranches.read(
             chunk, cursor, context, file, self._file, self._concrete
         )
-        self._members["fLeaves"] = file.class_named("TObjArray").read(
+        self._members[
+            "fLeaves"
+        ] = uproot4.models.TObjArray.Model_TObjArrayOfTLeaves.read(
             chunk, cursor, context, file, self._file, self._concrete
         )
         self._members["fAliases"] = uproot4.deserialization.read_object_any(
@@ -743,10 +760,14 @@ in file {1}""".format(
         self._members["fIOFeatures"] = file.class_named("ROOT::TIOFeatures").read(
             chunk, cursor, context, file, self._file, self._concrete
         )
-        self._members["fBranches"] = file.class_named("TObjArray").read(
+        self._members[
+            "fBranches"
+        ] = uproot4.models.TObjArray.Model_TObjArrayOfTBranches.read(
             chunk, cursor, context, file, self._file, self._concrete
         )
-        self._members["fLeaves"] = file.class_named("TObjArray").read(
+        self._members[
+            "fLeaves"
+        ] = uproot4.models.TObjArray.Model_TObjArrayOfTLeaves.read(
             chunk, cursor, context, file, self._file, self._concrete
         )
         self._members["fAliases"] = uproot4.deserialization.read_object_any(
@@ -13,6 +13,7 @@ from __future__ import absolute_import
 import sys
 import struct
 import uuid
+import weakref
 
 try:
     from collections.abc import Mapping
@@ -25,6 +26,10 @@ import uproot4.compression
 import uproot4.cache
 import uproot4.source.cursor
 import uproot4.source.chunk
+import uproot4.source.caching
+import uproot4.metadata
+import uproot4.class_cache
+import uproot4.source.file
 import uproot4.source.http
 import uproot4.source.xrootd
 import uproot4.streamers
@@ -39,6 +44,7 @@ def open(
     object_cache=100,
     array_cache="100 MB",
     custom_classes=None,
+    basket_cache=None,
     **options  # NOTE: a comma after **options breaks Python 2
 ):
     """
@@ -61,6 +67,10 @@ def open(
         custom_classes (None or MutableMapping): If None, classes come from
             uproot4.classes; otherwise, a container of class definitions that
             is both used to fill with new classes and search for dependencies.
+        basket_cache (None, MutableMapping, or memory size): Cache of
+            uncompressed ``TBaskets``, shared by all interpretations and entry
+            ranges of a ``TBranch``; if None, do not use a cache; if a memory
+            size, create a new cache of this size.
         options: See below.
 
     Opens a ROOT file, possibly through a remote protocol.
@@ -87,6 +97,16 @@ def open(
     * num_fallback_workers (int; 10)
     * begin_chunk_size (memory_size; 512)
     * minimal_ttree_metadata (bool; True)
+    * zero_copy (bool; False)
+    * coalesce_gap (None or memory_size; None)
+    * http_pool_size (int; 10)
+    * http_idle_timeout (None or float; 30)
+    * max_num_connections (int; 64)
+    * block_cache_dir (None or str; None)
+    * block_cache_size (memory_size; "1 GB")
+    * statistics_dir (None or str; None)
+    * metadata_dir (None or str; None)
+    * class_cache_dir (None or str; None)
 
     Any object derived from a ROOT file is a context manager (works in Python's
     ``with`` statement) that closes the file when exiting the ``with`` block.
@@ -139,6 +159,7 @@ def open(
         object_cache=object_cache,
         array_cache=array_cache,
         custom_classes=custom_classes,
+        basket_cache=basket_cache,
         **options  # NOTE: a comma after **options breaks Python 2
     )
 
@@ -159,6 +180,16 @@ open.defaults = {
     "num_fallback_workers": 10,
     "begin_chunk_size": 512,
     "minimal_ttree_metadata": True,
+    "zero_copy": False,
+    "coalesce_gap": None,
+    "http_pool_size": 10,
+    "http_idle_timeout": 30,
+    "max_num_connections": 64,
+    "block_cache_dir": None,
+    "block_cache_size": "1 GB",
+    "statistics_dir": None,
+    "metadata_dir": None,
+    "class_cache_dir": None,
 }
 
 
@@ -471,6 +502,10 @@ class ReadOnlyFile(CommonFileMethods):
         custom_classes (None or MutableMapping): If None, classes come from
             uproot4.classes; otherwise, a container of class definitions that
             is both used to fill with new classes and search for dependencies.
+        basket_cache (None, MutableMapping, or memory size): Cache of
+            uncompressed ``TBaskets``, shared by all interpretations and entry
+            ranges of a ``TBranch``; if None, do not use a cache; if a memory
+            size, create a new cache of this size.
         options: See below.
 
     Handle to an open ROOT file, the way to access data in ``TDirectories``
@@ -502,6 +537,16 @@ class ReadOnlyFile(CommonFileMethods):
     * num_fallback_workers (int; 10)
     * begin_chunk_size (memory_size; 512)
     * minimal_ttree_metadata (bool; True)
+    * zero_copy (bool; False)
+    * coalesce_gap (None or memory_size; None)
+    * http_pool_size (int; 10)
+    * http_idle_timeout (None or float; 30)
+    * max_num_connections (int; 64)
+    * block_cache_dir (None or str; None)
+    * block_cache_size (memory_size; "1 GB")
+    * statistics_dir (None or str; None)
+    * metadata_dir (None or str; None)
+    * class_cache_dir (None or str; None)
 
     See the `ROOT TFile documentation <https://root.cern.ch/doc/master/classTFile.html>`__
     for a specification of ``TFile`` header fields.
@@ -513,20 +558,28 @@ class ReadOnlyFile(CommonFileMethods):
         object_cache=100,
         array_cache="100 MB",
         custom_classes=None,
+        basket_cache=None,
         **options  # NOTE: a comma after **options breaks Python 2
     ):
         self._file_path = file_path
         self.object_cache = object_cache
         self.array_cache = array_cache
         self.custom_classes = custom_classes
+        self.basket_cache = basket_cache
 
         self._options = dict(open.defaults)
         self._options.update(options)
-        for option in ["begin_chunk_size"]:
+        for option in ["begin_chunk_size", "block_cache_size"]:
             self._options[option] = uproot4._util.memory_size(self._options[option])
+        if self._options["coalesce_gap"] is not None:
+            self._options["coalesce_gap"] = uproot4._util.memory_size(
+                self._options["coalesce_gap"]
+            )
 
         self._streamers = None
         self._streamer_rules = None
+        self._class_cache = None
+        self._lazy_branches = weakref.WeakSet()
 
         self.hook_before_create_source()
 
@@ -599,6 +652,21 @@ in file {1}""".format(
                 )
             )
 
+        # the header is always read from the file itself: it contains the UUID
+        if self._options["block_cache_dir"] is not None and not isinstance(
+            self._source,
+            (
+                uproot4.source.file.MemmapSource,
+                uproot4.source.file.MultithreadedFileSource,
+            ),
+        ):
+            cache = uproot4.source.caching.BlockCache(
+                self._options["block_cache_dir"], self._options["block_cache_size"]
+            )
+            self._source = uproot4.source.caching.CachingSource(
+                self._source, self.hex_uuid, cache
+            )
+
     def __repr__(self):
         return "<ReadOnlyFile {0} at 0x{1:012x}>".format(
             repr(self._file_path), id(self)
@@ -624,6 +692,7 @@ in file {1}""".format(
         :py:attr:`~uproot4.reading.ReadOnlyFile.object_cache` would still be
         accessible.
         """
+        self._detach_lazy_branches()
         self._source.close()
 
     @property
@@ -648,8 +717,17 @@ in file {1}""".format(
         return self
 
     def __exit__(self, exception_type, exception_value, traceback):
+        self._detach_lazy_branches()
         self._source.__exit__(exception_type, exception_value, traceback)
 
+    def _detach_lazy_branches(self):
+        # TBranches that haven't been deserialized yet may need the streamers,
+        # which can't be read after the file is closed
+        if not self.closed and any(
+            x.num_unread != 0 for x in list(self._lazy_branches)
+        ):
+            self.streamers
+
     @property
     def source(self):
         """
@@ -722,6 +800,41 @@ in file {1}""".format(
                 "array_cache must be None, a MutableMapping, or a memory size"
             )
 
+    @property
+    def basket_cache(self):
+        """
+        A cache used to hold previously decompressed ``TBaskets``, so that code
+        like
+
+        .. code-block:: python
+
+            a = my_tree["branch"].array(entry_stop=1000)
+            a = my_tree["branch"].array(entry_stop=2000)
+            a = my_tree["branch"].array(library="np")
+
+        reads and decompresses each ``TBasket`` once, even though the arrays
+        (with different entry ranges and libraries) are all different.
+
+        Keys are formed from the ``TBranch``'s
+        :py:attr:`~uproot4.behaviors.TBranch.TBranch.cache_key` (which includes
+        the file's UUID) and the basket number; values are
+        :py:class:`~uproot4.models.TBasket.Model_TBasket` objects, whose size is
+        their ``nbytes``. Since the :py:class:`~uproot4.cache.LRUArrayCache` uses
+        ``nbytes``, it is a good choice; it is also thread-safe.
+        """
+        return self._basket_cache
+
+    @basket_cache.setter
+    def basket_cache(self, value):
+        if value is None or isinstance(value, MutableMapping):
+            self._basket_cache = value
+        elif uproot4._util.isint(value) or uproot4._util.isstr(value):
+            self._basket_cache = uproot4.cache.LRUArrayCache(value)
+        else:
+            raise TypeError(
+                "basket_cache must be None, a MutableMapping, or a memory size"
+            )
+
     @property
     def root_directory(self):
         """
@@ -945,6 +1058,20 @@ in file {1}""".format(
         streamer._dependencies(self.streamers, out)
         return out[::-1]
 
+    @property
+    def class_cache(self):
+        """
+        The :py:class:`~uproot4.class_cache.ClassCodeCache` in the
+        ``class_cache_dir`` option, which holds the code of classes generated
+        from :py:attr:`~uproot4.reading.ReadOnlyFile.streamers`, or None if the
+        option is None.
+        """
+        if self._class_cache is None and self._options["class_cache_dir"] is not None:
+            self._class_cache = uproot4.class_cache.ClassCodeCache(
+                self._options["class_cache_dir"]
+            )
+        return self._class_cache
+
     @property
     def custom_classes(self):
         """
@@ -1388,7 +1515,7 @@ class ReadOnlyDirectory(Mapping):
         return self
 
     def __exit__(self, exception_type, exception_value, traceback):
-        self._file.source.__exit__(exception_type, exception_value, traceback)
+        self._file.__exit__(exception_type, exception_value, traceback)
 
     @property
     def cursor(self):
@@ -2244,6 +2371,10 @@ class ReadOnlyKey(object):
         (Some ROOT files do have classes that don't match the standard
         ``TStreamerInfo``; they may have been produced from private builds of
         ROOT between official releases.)
+
+        If the file was opened with a ``metadata_dir``, ``TTrees`` are taken
+        from the :py:class:`~uproot4.metadata.MetadataIndex` in that directory
+        if possible, and added to it if not.
         """
         if self._file.object_cache is not None:
             out = self._file.object_cache.get(self.cache_key)
@@ -2273,6 +2404,21 @@ class ReadOnlyKey(object):
             )
 
         else:
+            index = None
+            if (
+                self._fClassName in must_be_attached
+                and self._file.options["metadata_dir"] is not None
+                and self._file.custom_classes is None
+            ):
+                index = uproot4.metadata.MetadataIndex(
+                    self._file.options["metadata_dir"]
+                )
+                out = index.load(self)
+                if out is not None:
+                    if self._file.object_cache is not None:
+                        self._file.object_cache[self.cache_key] = out
+                    return out
+
             chunk, cursor = self.get_uncompressed_chunk_cursor()
             start_cursor = cursor.copy()
             cls = self._file.class_named(self._fClassName)
@@ -2282,31 +2428,21 @@ class ReadOnlyKey(object):
                 out = cls.read(chunk, cursor, context, self._file, selffile, parent)
 
             except uproot4.deserialization.DeserializationError:
-                breadcrumbs = context.get("breadcrumbs")
-
-                if breadcrumbs is None or all(
-                    breadcrumb_cls.classname in uproot4.model.bootstrap_classnames
-                    or isinstance(breadcrumb_cls, uproot4.containers.AsContainer)
-                    or getattr(breadcrumb_cls.class_streamer, "file_uuid", None)
-                    == self._file.uuid
-                    for breadcrumb_cls in breadcrumbs
+                if not uproot4.deserialization._remove_general_classes(
+                    self._file, context.get("breadcrumbs")
                 ):
                     # we're already using the most specialized versions of each class
                     raise
 
-                for breadcrumb_cls in breadcrumbs:
-                    if (
-                        breadcrumb_cls.classname
-                        not in uproot4.model.bootstrap_classnames
-                    ):
-                        self._file.remove_class_definition(breadcrumb_cls.classname)
-
                 cursor = start_cursor
                 cls = self._file.class_named(self._fClassName)
                 context = {"breadcrumbs": (), "TKey": self}
 
                 out = cls.read(chunk, cursor, context, self._file, selffile, parent)
 
+            if index is not None:
+                index.save(self, out)
+
         if self._fClassName not in must_be_attached:
             out._file = self._file.detached
             out._parent = None
@@ -2334,6 +2470,7 @@ class ReadOnlyKey(object):
                 {},
                 self.data_compressed_bytes,
                 self.data_uncompressed_bytes,
+                executor=uproot4.decompression_executor,
             )
         else:
             uncompressed_chunk = uproot4.source.chunk.Chunk.wrap(
@@ -0,0 +1,490 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+"""
+Physical layer for remote files, accessed via HTTP(S) from an ``asyncio`` event
+loop.
+
+Defines an :py:class:`~uproot4.source.asynchttp.AsyncHTTPSource`, which makes
+HTTP/1.1 byte range requests on non-blocking ``asyncio`` streams, so that many
+requests can be in flight at once without a thread per connection. Its
+coroutines, :py:meth:`~uproot4.source.asynchttp.AsyncHTTPSource.achunk` and
+:py:meth:`~uproot4.source.asynchttp.AsyncHTTPSource.achunks`, run on the
+caller's event loop; its synchronous
+:py:meth:`~uproot4.source.asynchttp.AsyncHTTPSource.chunk` and
+:py:meth:`~uproot4.source.asynchttp.AsyncHTTPSource.chunks` (the
+:py:class:`~uproot4.source.chunk.Source` interface) run the same coroutines on an
+event loop in a single background thread.
+
+This module requires Python 3.5 or later and is not imported in Python 2.
+"""
+
+from __future__ import absolute_import
+
+import asyncio
+import ssl
+import threading
+import time
+import weakref
+
+try:
+    from urllib.parse import urlparse
+except ImportError:
+    from urlparse import urlparse
+
+import uproot4.source.chunk
+import uproot4.source.futures
+import uproot4.source.http
+import uproot4._util
+
+
+class AsyncConnectionPool(object):
+    """
+    Args:
+        parsed_url (``urllib.parse.ParseResult``): The URL of any file on the
+            host; only its scheme, host, and port are used.
+        max_num_connections (int): The maximum number of simultaneous
+            connections (and hence, requests in flight).
+        idle_timeout (None or float): The number of seconds that an idle
+            connection may be kept before it is closed, or None for no limit.
+
+    A pool of keep-alive ``asyncio`` stream connections to a single host, bound
+    to the event loop on which it was created.
+
+    Like :py:class:`~uproot4.source.http.ConnectionPool`, but connections are
+    ``(reader, writer)`` pairs and the number of connections in use is limited
+    by an ``asyncio.Semaphore``.
+    """
+
+    def __init__(self, parsed_url, max_num_connections, idle_timeout):
+        self._parsed_url = parsed_url
+        self._idle_timeout = idle_timeout
+        self._semaphore = asyncio.Semaphore(max_num_connections)
+        self._idle = []
+        self._num_connections = 0
+        self._num_reused = 0
+
+    @property
+    def semaphore(self):
+        """
+        The ``asyncio.Semaphore`` that limits the number of connections in use.
+        """
+        return self._semaphore
+
+    @property
+    def num_idle(self):
+        """
+        The number of idle connections in the pool.
+        """
+        return len(self._idle)
+
+    @property
+    def num_connections(self):
+        """
+        The number of connections that have been made (performance counter).
+        """
+        return self._num_connections
+
+    @property
+    def num_reused(self):
+        """
+        The number of times that an idle connection has been reused
+        (performance counter).
+        """
+        return self._num_reused
+
+    async def acquire(self):
+        """
+        Returns a ``(reader, writer, reused)`` triple, reusing the most
+        recently released healthy connection if there is one.
+
+        Only call this while holding the
+        :py:attr:`~uproot4.source.asynchttp.AsyncConnectionPool.semaphore`.
+        """
+        while len(self._idle) != 0:
+            reader, writer, released = self._idle.pop()
+            if reader.at_eof() or (
+                self._idle_timeout is not None
+                and time.time() - released > self._idle_timeout
+            ):
+                writer.close()
+            else:
+                self._num_reused += 1
+                return reader, writer, True
+
+        if self._parsed_url.scheme == "https":
+            context = ssl.create_default_context()
+            port = 443 if self._parsed_url.port is None else self._parsed_url.port
+        elif self._parsed_url.scheme == "http":
+            context = None
+            port = 80 if self._parsed_url.port is None else self._parsed_url.port
+        else:
+            raise ValueError(
+                "unrecognized URL scheme for HTTP AsyncHTTPSource: {0}".format(
+                    self._parsed_url.scheme
+                )
+            )
+
+        reader, writer = await asyncio.open_connection(
+            self._parsed_url.hostname, port, ssl=context
+        )
+        self._num_connections += 1
+        return reader, writer, False
+
+    def release(self, reader, writer):
+        """
+        Returns a connection to the pool after its response has been
+        completely read.
+        """
+        self._idle.append((reader, writer, time.time()))
+
+    def close(self):
+        """
+        Closes all idle connections.
+        """
+        idle, self._idle = self._idle, []
+        for reader, writer, released in idle:
+            writer.close()
+
+
+async def _read_response(reader, method, file_path):
+    line = await reader.readline()
+    if len(line) == 0:
+        raise ConnectionResetError(
+            "connection closed before HTTP response\nfor URL {0}".format(file_path)
+        )
+    version, status = line.split(None, 2)[:2]
+    status = int(status)
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if len(line.strip()) == 0:
+            break
+        k, v = line.decode("latin-1").split(":", 1)
+        headers[k.strip().lower()] = v.strip()
+
+    if method == "HEAD":
+        body = b""
+    elif headers.get("transfer-encoding", "").lower() == "chunked":
+        parts = []
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                await reader.readline()
+                break
+            parts.append(await reader.readexactly(size))
+            await reader.readline()
+        body = b"".join(parts)
+    elif "content-length" in headers:
+        body = await reader.readexactly(int(headers["content-length"]))
+    else:
+        body = await reader.read()
+        headers["connection"] = "close"
+
+    keep_alive = version == b"HTTP/1.1" or (
+        headers.get("connection", "").lower() == "keep-alive"
+    )
+    if headers.get("connection", "").lower() == "close":
+        keep_alive = False
+
+    return status, headers, body, keep_alive
+
+
+class AsyncHTTPSource(uproot4.source.chunk.Source):
+    """
+    Args:
+        file_path (str): A URL of the file to open.
+        options: Must include ``"timeout"``; may include
+            ``"max_num_connections"`` and ``"http_idle_timeout"``.
+
+    A :py:class:`~uproot4.source.chunk.Source` that makes concurrent HTTP(S)
+    byte range requests on ``asyncio`` streams, with at most
+    ``max_num_connections`` keep-alive connections to the server.
+
+    The coroutines :py:meth:`~uproot4.source.asynchttp.AsyncHTTPSource.achunk`
+    and :py:meth:`~uproot4.source.asynchttp.AsyncHTTPSource.achunks` return
+    filled :py:class:`~uproot4.source.chunk.Chunk` objects; they use a pool of
+    connections that belongs to the running event loop. The synchronous
+    :py:meth:`~uproot4.source.asynchttp.AsyncHTTPSource.chunk` and
+    :py:meth:`~uproot4.source.asynchttp.AsyncHTTPSource.chunks` return unfilled
+    chunks that are filled by an event loop in one background thread, so
+    this source can also be used as an ``http_handler`` for
+    :py:func:`~uproot4.reading.open`.
+
+    The server only needs to support (single) byte range requests.
+    """
+
+    def __init__(self, file_path, **options):
+        self._timeout = options["timeout"]
+        self._max_num_connections = options.get("max_num_connections", 64)
+        self._idle_timeout = options.get("http_idle_timeout", 30)
+        self._num_requests = 0
+        self._num_requested_chunks = 0
+        self._num_requested_bytes = 0
+        self._num_overread_bytes = 0
+        self._coalesce_gap = options.get("coalesce_gap")
+
+        self._file_path = file_path
+        self._parsed_url = urlparse(file_path)
+        self._num_bytes = None
+
+        self._pools = weakref.WeakKeyDictionary()
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __repr__(self):
+        path = repr(self._file_path)
+        if len(self._file_path) > 10:
+            path = repr("..." + self._file_path[-10:])
+        return "<{0} {1} ({2} connections) at 0x{3:012x}>".format(
+            type(self).__name__, path, self._max_num_connections, id(self)
+        )
+
+    @property
+    def timeout(self):
+        """
+        The timeout in seconds or None.
+        """
+        return self._timeout
+
+    @property
+    def parsed_url(self):
+        """
+        A ``urllib.parse.ParseResult`` version of the ``file_path``.
+        """
+        return self._parsed_url
+
+    @property
+    def max_num_connections(self):
+        """
+        The maximum number of simultaneous connections per event loop.
+        """
+        return self._max_num_connections
+
+    @property
+    def num_bytes(self):
+        if self._num_bytes is None:
+            self._num_bytes = uproot4.source.http.get_num_bytes(
+                self._file_path, self._parsed_url, self._timeout
+            )
+        return self._num_bytes
+
+    def connection_pool(self, loop=None):
+        """
+        Args:
+            loop (None or ``asyncio.AbstractEventLoop``): The event loop; if
+                None, the current one.
+
+        Returns the :py:class:`~uproot4.source.asynchttp.AsyncConnectionPool`
+        for this event loop, creating it if necessary.
+        """
+        if loop is None:
+            loop = asyncio.get_event_loop()
+        pool = self._pools.get(loop)
+        if pool is None:
+            pool = self._pools[loop] = AsyncConnectionPool(
+                self._parsed_url, self._max_num_connections, self._idle_timeout
+            )
+        return pool
+
+    async def _request(self, method, start=None, stop=None):
+        lines = [
+            "{0} {1} HTTP/1.1".format(method, self._parsed_url.path),
+            "Host: {0}".format(self._parsed_url.netloc),
+            "Connection: keep-alive",
+        ]
+        if start is not None:
+            lines.append("Range: bytes={0}-{1}".format(start, stop - 1))
+        request = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+        pool = self.connection_pool()
+        async with pool.semaphore:
+            while True:
+                reader, writer, reused = await pool.acquire()
+                try:
+                    writer.write(request)
+                    await writer.drain()
+                    status, headers, body, keep_alive = await _read_response(
+                        reader, method, self._file_path
+                    )
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    writer.close()
+                    if reused:
+                        # the server closed an idle connection; try a new one
+                        continue
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+
+                if keep_alive:
+                    pool.release(reader, writer)
+                else:
+                    writer.close()
+                return status, headers, body
+
+    async def _get(self, start, stop):
+        status, headers, body = await asyncio.wait_for(
+            self._request("GET", start, stop), self._timeout
+        )
+
+        if status == 404:
+            raise uproot4._util._file_not_found(self._file_path, "HTTP(S) returned 404")
+
+        if status != 206:
+            raise OSError(
+                """remote server does not support HTTP range requests
+for URL {0}""".format(
+                    self._file_path
+                )
+            )
+
+        if len(body) != stop - start:
+            raise OSError(
+                """wrong chunk length {0} (expected {1}) for byte range {2}
+for URL {3}""".format(
+                    len(body), stop - start, repr((start, stop)), self._file_path
+                )
+            )
+
+        return body
+
+    async def achunk(self, start, stop):
+        """
+        Args:
+            start (int): Seek position of the first byte to include.
+            stop (int): Seek position of the first byte to exclude
+                (one greater than the last byte to include).
+
+        Coroutine that requests a byte range of data on the running event loop
+        and returns it as a filled :py:class:`~uproot4.source.chunk.Chunk`.
+        """
+        self._num_requests += 1
+        self._num_requested_chunks += 1
+        self._num_requested_bytes += stop - start
+
+        data = await self._get(start, stop)
+        future = uproot4.source.futures.NoFuture(data)
+        return uproot4.source.chunk.Chunk(self, start, stop, future)
+
+    async def achunks(self, ranges, notifications=None):
+        """
+        Args:
+            ranges (list of (int, int) 2-tuples): Intervals to fetch
+                as (start, stop) pairs.
+            notifications (None or ``queue.Queue``): If not None, each chunk is
+                ``put`` on this queue as soon as it is filled.
+
+        Coroutine that requests a set of byte ranges concurrently on the running
+        event loop (with at most
+        :py:attr:`~uproot4.source.asynchttp.AsyncHTTPSource.max_num_connections`
+        in flight) and returns them as filled
+        :py:class:`~uproot4.source.chunk.Chunk` objects, in the order of
+        ``ranges``.
+        """
+        ranges, notifications, coalesced = self._coalesce(ranges, notifications)
+
+        self._num_requests += 1
+        self._num_requested_chunks += len(ranges)
+        self._num_requested_bytes += sum(stop - start for start, stop in ranges)
+
+        async def fill(start, stop):
+            data = await self._get(start, stop)
+            future = uproot4.source.futures.NoFuture(data)
+            chunk = uproot4.source.chunk.Chunk(self, start, stop, future)
+            if notifications is not None:
+                notifications.put(chunk)
+            return chunk
+
+        chunks = await asyncio.gather(
+            *[fill(start, stop) for start, stop in ranges]
+        )
+
+        if coalesced is None:
+            return list(chunks)
+        else:
+            return coalesced.split(chunks)
+
+    def _background_loop(self):
+        with self._lock:
+            if self._closed:
+                raise OSError("source is closed for URL {0}".format(self._file_path))
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever)
+                self._thread.daemon = True
+                self._thread.start()
+            return self._loop
+
+    def _submit(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._background_loop())
+
+    def chunk(self, start, stop):
+        self._num_requests += 1
+        self._num_requested_chunks += 1
+        self._num_requested_bytes += stop - start
+
+        future = self._submit(self._get(start, stop))
+        return uproot4.source.chunk.Chunk(self, start, stop, future)
+
+    def chunks(self, ranges, notifications):
+        ranges, notifications, coalesced = self._coalesce(ranges, notifications)
+
+        self._num_requests += 1
+        self._num_requested_chunks += len(ranges)
+        self._num_requested_bytes += sum(stop - start for start, stop in ranges)
+
+        chunks = []
+        for start, stop in ranges:
+            future = self._submit(self._get(start, stop))
+            chunk = uproot4.source.chunk.Chunk(self, start, stop, future)
+            future.add_done_callback(
+                lambda future, chunk=chunk: notifications.put(chunk)
+            )
+            chunks.append(chunk)
+
+        if coalesced is None:
+            return chunks
+        else:
+            return coalesced.split(chunks)
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        with self._lock:
+            self._closed = True
+            loop, self._loop = self._loop, None
+            thread, self._thread = self._thread, None
+
+        for pool_loop, pool in list(self._pools.items()):
+            if not pool_loop.is_closed():
+                pool_loop.call_soon_threadsafe(pool.close)
+
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exception_type, exception_value, traceback):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Coroutine that closes the idle connections of the running event loop's
+        pool, then closes the source as
+        :py:meth:`~uproot4.source.chunk.Source.close` does.
+        """
+        pool = self._pools.get(asyncio.get_event_loop())
+        if pool is not None:
+            pool.close()
+        self.close()
@@ -0,0 +1,428 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+"""
+Local on-disk cache of byte ranges from (usually remote) files.
+
+Defines a :py:class:`~uproot4.source.caching.BlockCache`, a directory of byte
+ranges keyed by file UUID and seek position, and a
+:py:class:`~uproot4.source.caching.CachingSource`, which wraps any other
+:py:class:`~uproot4.source.chunk.Source` and serves requests that are fully
+covered by the cache without passing them to the wrapped source.
+
+:py:class:`~uproot4.reading.ReadOnlyFile` wraps its source in a
+:py:class:`~uproot4.source.caching.CachingSource` if the ``block_cache_dir``
+option is not None, after it has read the file header (which contains the UUID).
+
+Multiple processes may share a cache directory: blocks are written to temporary
+files and atomically renamed into place, so a block is either complete or
+absent, and a block that is evicted by another process while it is being looked
+up is simply a cache miss.
+"""
+
+from __future__ import absolute_import
+
+import bisect
+import os
+import tempfile
+import threading
+
+import numpy
+
+import uproot4.source.chunk
+import uproot4.source.futures
+import uproot4._util
+
+
+class BlockCache(object):
+    """
+    Args:
+        directory (str): Path of the cache directory, which is created if it
+            does not exist.
+        max_bytes (int): Approximate maximum total size of the cached blocks.
+
+    A directory of cached byte ranges with least-recently used eviction.
+
+    Each block is a file named ``"{start}-{stop}"`` in a subdirectory named by
+    the file's UUID. Reading a block updates its modification time, and when
+    the total size exceeds ``max_bytes``, the blocks with the oldest
+    modification times (in all subdirectories) are deleted.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._num_bytes = None
+        self._lock = threading.Lock()
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                if not os.path.isdir(directory):
+                    raise
+
+    def __repr__(self):
+        return "<{0} {1} at 0x{2:012x}>".format(
+            type(self).__name__, repr(self._directory), id(self)
+        )
+
+    @property
+    def directory(self):
+        """
+        Path of the cache directory.
+        """
+        return self._directory
+
+    @property
+    def max_bytes(self):
+        """
+        Approximate maximum total size of the cached blocks.
+        """
+        return self._max_bytes
+
+    def _path(self, uuid, start=None, stop=None):
+        if start is None:
+            return os.path.join(self._directory, str(uuid))
+        else:
+            return os.path.join(
+                self._directory, str(uuid), "{0}-{1}".format(start, stop)
+            )
+
+    def blocks(self, uuid):
+        """
+        Returns a sorted list of the (start, stop) pairs that are currently
+        cached for the file with this ``uuid``.
+        """
+        try:
+            names = os.listdir(self._path(uuid))
+        except OSError:
+            return []
+        out = []
+        for name in names:
+            try:
+                start, stop = name.split("-")
+                out.append((int(start), int(stop)))
+            except ValueError:
+                pass
+        out.sort()
+        return out
+
+    def get(self, uuid, start, stop):
+        """
+        Returns the block for exactly (``start``, ``stop``) as bytes, or None
+        if it is not in the cache.
+        """
+        path = self._path(uuid, start, stop)
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+            os.utime(path, None)
+        except (OSError, IOError):
+            return None
+        if len(data) != stop - start:
+            return None
+        return data
+
+    def put(self, uuid, start, stop, data):
+        """
+        Stores ``data`` as the block (``start``, ``stop``), then evicts old
+        blocks if the cache is too large.
+        """
+        directory = self._path(uuid)
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                if not os.path.isdir(directory):
+                    raise
+
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            if uproot4._util.py2 and os.name == "nt":
+                if os.path.exists(self._path(uuid, start, stop)):
+                    os.remove(tmp)
+                    return
+                os.rename(tmp, self._path(uuid, start, stop))
+            elif uproot4._util.py2:
+                os.rename(tmp, self._path(uuid, start, stop))
+            else:
+                os.replace(tmp, self._path(uuid, start, stop))
+        except (OSError, IOError):
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+        with self._lock:
+            if self._num_bytes is None:
+                self._num_bytes = self._total()
+            else:
+                self._num_bytes += stop - start
+            if self._num_bytes > self._max_bytes:
+                self._evict()
+
+    def _files(self):
+        out = []
+        for uuid in os.listdir(self._directory):
+            directory = os.path.join(self._directory, uuid)
+            if os.path.isdir(directory):
+                for name in os.listdir(directory):
+                    if not name.startswith(".tmp"):
+                        out.append(os.path.join(directory, name))
+        return out
+
+    def _total(self):
+        total = 0
+        for path in self._files():
+            try:
+                total += os.path.getsize(path)
+            except OSError:
+                pass
+        return total
+
+    def _evict(self):
+        # other processes may be writing to and evicting from the same
+        # directory, so the total is recomputed from the files themselves
+        stats = []
+        for path in self._files():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                pass
+            else:
+                stats.append((stat.st_mtime, stat.st_size, path))
+        stats.sort()
+
+        total = sum(size for mtime, size, path in stats)
+        for mtime, size, path in stats:
+            if total <= self._max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+        self._num_bytes = total
+
+    def clear(self):
+        """
+        Deletes all blocks in the cache (for all files).
+        """
+        with self._lock:
+            for path in self._files():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._num_bytes = 0
+
+
+class CachingSource(uproot4.source.chunk.Source):
+    """
+    Args:
+        source (:py:class:`~uproot4.source.chunk.Source`): The source to wrap.
+        uuid (``uuid.UUID`` or str): The UUID of the file, which identifies it
+            in the cache.
+        cache (:py:class:`~uproot4.source.caching.BlockCache`): The block cache.
+
+    A :py:class:`~uproot4.source.chunk.Source` that first looks for each
+    requested byte range in a :py:class:`~uproot4.source.caching.BlockCache`
+    and passes only the ranges that are not covered by a cached block to the
+    wrapped ``source``. Ranges read from the wrapped source are added to the
+    cache as they arrive.
+
+    A range is covered if there is a cached block with exactly the same
+    (start, stop) or a cached block that contains it.
+    """
+
+    def __init__(self, source, uuid, cache):
+        self._source = source
+        self._uuid = uuid
+        self._cache = cache
+        self._num_requests = 0
+        self._num_requested_chunks = 0
+        self._num_requested_bytes = 0
+        self._num_overread_bytes = 0
+        self._coalesce_gap = None
+        self._num_hits = 0
+        self._num_misses = 0
+        self._blocks = None
+
+    def __repr__(self):
+        return "<{0} of {1} in {2} at 0x{3:012x}>".format(
+            type(self).__name__,
+            repr(self._source),
+            repr(self._cache.directory),
+            id(self),
+        )
+
+    @property
+    def source(self):
+        """
+        The wrapped :py:class:`~uproot4.source.chunk.Source`.
+        """
+        return self._source
+
+    @property
+    def uuid(self):
+        """
+        The UUID that identifies the file in the cache.
+        """
+        return self._uuid
+
+    @property
+    def cache(self):
+        """
+        The :py:class:`~uproot4.source.caching.BlockCache`.
+        """
+        return self._cache
+
+    @property
+    def file_path(self):
+        return self._source.file_path
+
+    @property
+    def num_bytes(self):
+        return self._source.num_bytes
+
+    @property
+    def num_hits(self):
+        """
+        The number of requested chunks that were served from the cache
+        (performance counter).
+        """
+        return self._num_hits
+
+    @property
+    def num_misses(self):
+        """
+        The number of requested chunks that were passed to the wrapped source
+        (performance counter).
+        """
+        return self._num_misses
+
+    def _lookup(self, start, stop):
+        data = self._cache.get(self._uuid, start, stop)
+        if data is not None:
+            return numpy.frombuffer(data, dtype=uproot4.source.chunk.Chunk._dtype)
+
+        if self._blocks is None:
+            self._blocks = self._cache.blocks(self._uuid)
+        index = bisect.bisect_right(self._blocks, (start, float("inf"))) - 1
+        if index >= 0:
+            block_start, block_stop = self._blocks[index]
+            if block_start <= start and stop <= block_stop:
+                data = self._cache.get(self._uuid, block_start, block_stop)
+                if data is not None:
+                    array = numpy.frombuffer(
+                        data, dtype=uproot4.source.chunk.Chunk._dtype
+                    )
+                    return array[start - block_start : stop - block_start]
+
+        return None
+
+    def _store(self, start, stop, data):
+        try:
+            self._cache.put(self._uuid, start, stop, data)
+        except (OSError, IOError):
+            # the cache is only an optimization: a full or read-only cache
+            # directory must not prevent the data from being read
+            return
+        self._blocks = None
+
+    def _store_chunk(self, chunk):
+        try:
+            data = chunk.raw_data
+        except Exception:
+            # the error is raised where the chunk's data are used
+            return
+        self._store(chunk.start, chunk.stop, data.tobytes())
+
+    def chunk(self, start, stop):
+        self._num_requests += 1
+        self._num_requested_chunks += 1
+        self._num_requested_bytes += stop - start
+
+        data = self._lookup(start, stop)
+        if data is not None:
+            self._num_hits += 1
+            future = uproot4.source.futures.NoFuture(data)
+            return uproot4.source.chunk.Chunk(self, start, stop, future)
+
+        self._num_misses += 1
+        future = _StoringFuture(self, start, stop, self._source.chunk(start, stop))
+        return uproot4.source.chunk.Chunk(self, start, stop, future)
+
+    def chunks(self, ranges, notifications):
+        self._num_requests += 1
+        self._num_requested_chunks += len(ranges)
+        self._num_requested_bytes += sum(stop - start for start, stop in ranges)
+
+        self._blocks = None
+        out = [None] * len(ranges)
+        missing = []
+        missing_index = []
+        for i, (start, stop) in enumerate(ranges):
+            data = self._lookup(start, stop)
+            if data is None:
+                missing.append((start, stop))
+                missing_index.append(i)
+            else:
+                self._num_hits += 1
+                future = uproot4.source.futures.NoFuture(data)
+                out[i] = uproot4.source.chunk.Chunk(self, start, stop, future)
+                notifications.put(out[i])
+
+        if len(missing) != 0:
+            self._num_misses += len(missing)
+            filled = _StoreNotifications(self, notifications)
+            for i, chunk in zip(missing_index, self._source.chunks(missing, filled)):
+                out[i] = chunk
+
+        return out
+
+    @property
+    def closed(self):
+        return self._source.closed
+
+    def __enter__(self):
+        self._source.__enter__()
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self._source.__exit__(exception_type, exception_value, traceback)
+
+
+class _StoreNotifications(object):
+    def __init__(self, source, notifications):
+        self._source = source
+        self._notifications = notifications
+
+    def put(self, chunk):
+        try:
+            self._source._store_chunk(chunk)
+        finally:
+            self._notifications.put(chunk)
+
+
+class _StoringFuture(object):
+    """
+    The future of a chunk from the wrapped source, which stores the data in
+    the cache when they are first waited for, rather than when the chunk is
+    requested.
+    """
+
+    def __init__(self, source, start, stop, chunk):
+        self._source = source
+        self._start = start
+        self._stop = stop
+        self._chunk = chunk
+        self._stored = False
+
+    def result(self, timeout=None):
+        data = self._chunk.raw_data
+        if not self._stored:
+            self._stored = True
+            self._source._store(self._start, self._stop, data.tobytes())
+        return data
@@ -17,6 +17,7 @@ import numpy
 import uproot4.deserialization
 import uproot4.source.futures
 import uproot4.source.cursor
+import uproot4.source.coalesce
 
 
 class Resource(object):
@@ -47,6 +48,10 @@ class Source(object):
     the file.
     """
 
+    # defaults for subclasses that don't set them (no coalescing)
+    _coalesce_gap = None
+    _num_overread_bytes = 0
+
     def chunk(self, start, stop):
         """
         Args:
@@ -125,6 +130,41 @@ class Source(object):
         """
         return self._num_requested_bytes
 
+    @property
+    def num_overread_bytes(self):
+        """
+        The number of bytes that have been read only to fill the gaps between
+        coalesced byte ranges (performance counter); see
+        :py:attr:`~uproot4.source.chunk.Source.coalesce_gap`.
+        """
+        return self._num_overread_bytes
+
+    @property
+    def coalesce_gap(self):
+        """
+        If not None, :py:meth:`~uproot4.source.chunk.Source.chunks` merges
+        byte ranges that are separated by at most this many bytes into a single
+        range before requesting them, and slices the result back into one
+        :py:class:`~uproot4.source.chunk.Chunk` per requested range.
+        """
+        return self._coalesce_gap
+
+    def _coalesce(self, ranges, notifications, max_size=None):
+        """
+        Returns the ``ranges`` and ``notifications`` to request in
+        :py:meth:`~uproot4.source.chunk.Source.chunks` and the
+        :py:class:`~uproot4.source.coalesce.CoalescedRequest` (or None, if
+        :py:attr:`~uproot4.source.chunk.Source.coalesce_gap` is None) that
+        splits the filled chunks.
+        """
+        if self._coalesce_gap is None:
+            return ranges, notifications, None
+        request = uproot4.source.coalesce.CoalescedRequest(
+            self, ranges, notifications, self._coalesce_gap, max_size
+        )
+        self._num_overread_bytes += request.num_overread_bytes
+        return request.ranges, request, request
+
     def close(self):
         """
         Manually closes the file(s) and stops any running threads.
@@ -165,6 +205,8 @@ class MultithreadedSource(Source):
         return chunk
 
     def chunks(self, ranges, notifications):
+        ranges, notifications, coalesced = self._coalesce(ranges, notifications)
+
         self._num_requests += 1
         self._num_requested_chunks += len(ranges)
         self._num_requested_bytes += sum(stop - start for start, stop in ranges)
@@ -176,7 +218,11 @@ class MultithreadedSource(Source):
             future._set_notify(notifier(chunk, notifications))
             self._executor.submit(future)
             chunks.append(chunk)
-        return chunks
+
+        if coalesced is None:
+            return chunks
+        else:
+            return coalesced.split(chunks)
 
     @property
     def executor(self):
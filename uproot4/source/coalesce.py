@@ -0,0 +1,191 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+"""
+Merges nearby byte ranges into fewer, larger requests.
+
+A :py:class:`~uproot4.source.chunk.Source` that is configured with a
+``coalesce_gap`` sends each group of sorted ranges that are separated by at most
+that many bytes as a single request, then slices the filled request back into
+one :py:class:`~uproot4.source.chunk.Chunk` per original range. For high-latency
+links, a few large requests are faster than many small ones, even though the
+bytes in the gaps are read and thrown away (counted by
+:py:attr:`~uproot4.source.chunk.Source.num_overread_bytes`).
+
+The :py:class:`~uproot4.source.coalesce.CoalescedRequest` is the glue: it stands
+in for the ``notifications`` queue of the merged request and forwards each
+original range's :py:class:`~uproot4.source.chunk.Chunk` to the real queue as soon
+as the merged :py:class:`~uproot4.source.chunk.Chunk` that contains it is filled.
+"""
+
+from __future__ import absolute_import
+
+import threading
+
+import uproot4._util
+import uproot4.source.chunk
+
+
+def coalesce_ranges(ranges, gap, max_size=None):
+    """
+    Args:
+        ranges (list of (int, int) 2-tuples): Intervals to fetch as
+            (start, stop) pairs, in any order.
+        gap (int): Maximum number of unrequested bytes between two ranges
+            that may be read and discarded to merge them.
+        max_size (None or int): If not None, the maximum size of a merged
+            range. (Ranges that are already larger than this are not split, and
+            ranges that are inside a merged range are always added to it.)
+
+    Returns a list of ``(start, stop, members)`` triples, sorted by ``start``,
+    in which ``members`` is a list of ``(index, start, stop)`` for each of the
+    original ``ranges`` (with its position in the original list) that the
+    merged range covers. No two merged ranges have the same ``(start, stop)``.
+    """
+    order = sorted(
+        uproot4._util.range(len(ranges)), key=lambda i: (ranges[i][0], ranges[i][1])
+    )
+
+    out = []
+    for index in order:
+        start, stop = ranges[index]
+        if len(out) != 0:
+            merged_start, merged_stop, members = out[-1]
+            new_stop = max(merged_stop, stop)
+            if stop <= merged_stop or (
+                start - merged_stop <= gap
+                and (max_size is None or new_stop - merged_start <= max_size)
+            ):
+                members.append((index, start, stop))
+                out[-1] = (merged_start, new_stop, members)
+                continue
+        out.append((start, stop, [(index, start, stop)]))
+
+    return out
+
+
+class SliceFuture(object):
+    """
+    Args:
+        chunk (:py:class:`~uproot4.source.chunk.Chunk`): The (merged) chunk
+            that contains the data.
+        start (int): Seek position of the first byte to include.
+        stop (int): Seek position of the first byte to exclude
+            (one greater than the last byte to include).
+
+    A future whose result is a subinterval of another
+    :py:class:`~uproot4.source.chunk.Chunk`, available when that chunk is filled.
+    The subinterval is a view, not a copy.
+    """
+
+    def __init__(self, chunk, start, stop):
+        self._chunk = chunk
+        self._start = start
+        self._stop = stop
+
+    def result(self, timeout=None):
+        """
+        Waits for the merged chunk to be filled and returns the subinterval.
+
+        If filling the merged chunk raised an exception, this raises the same
+        exception.
+        """
+        offset = self._chunk.start
+        return self._chunk.raw_data[self._start - offset : self._stop - offset]
+
+
+class CoalescedRequest(object):
+    """
+    Args:
+        source (:py:class:`~uproot4.source.chunk.Source`): The source that
+            makes the merged request.
+        ranges (list of (int, int) 2-tuples): The original intervals.
+        notifications (``queue.Queue``): The original queue on which to put
+            each original interval's :py:class:`~uproot4.source.chunk.Chunk` when
+            it is filled.
+        gap (int): See :py:func:`~uproot4.source.coalesce.coalesce_ranges`.
+        max_size (None or int): See
+            :py:func:`~uproot4.source.coalesce.coalesce_ranges`.
+
+    Plans and finishes one coalesced call to
+    :py:meth:`~uproot4.source.chunk.Source.chunks`.
+
+    The source requests :py:attr:`~uproot4.source.coalesce.CoalescedRequest.ranges`
+    with this object as its ``notifications`` (it has a ``put`` method), then
+    passes the merged chunks to
+    :py:meth:`~uproot4.source.coalesce.CoalescedRequest.split` to get the chunks
+    to return, in the order of the original ``ranges``.
+    """
+
+    def __init__(self, source, ranges, notifications, gap, max_size=None):
+        self._source = source
+        self._num_ranges = len(ranges)
+        self._notifications = notifications
+        self._merged = coalesce_ranges(ranges, gap, max_size)
+        self._positions = dict(
+            ((start, stop), i) for i, (start, stop, members) in enumerate(self._merged)
+        )
+        self._split = {}
+        self._lock = threading.Lock()
+
+    @property
+    def ranges(self):
+        """
+        The merged (start, stop) intervals to request, sorted by ``start``.
+        """
+        return [(start, stop) for start, stop, members in self._merged]
+
+    @property
+    def num_overread_bytes(self):
+        """
+        The number of bytes in the merged intervals that are not in any of the
+        original intervals.
+        """
+        out = 0
+        for start, stop, members in self._merged:
+            covered = 0
+            position = start
+            for index, member_start, member_stop in members:
+                if member_stop > position:
+                    covered += member_stop - max(member_start, position)
+                    position = member_stop
+            out += (stop - start) - covered
+        return out
+
+    def _split_chunk(self, position, chunk):
+        with self._lock:
+            out = self._split.get(position)
+            if out is None:
+                out = []
+                for index, start, stop in self._merged[position][2]:
+                    future = SliceFuture(chunk, start, stop)
+                    out.append(
+                        (
+                            index,
+                            uproot4.source.chunk.Chunk(
+                                self._source, start, stop, future
+                            ),
+                        )
+                    )
+                self._split[position] = out
+            return out
+
+    def put(self, chunk):
+        """
+        Called by the source when a merged ``chunk`` is filled; puts the
+        chunks of all original intervals it contains on the original
+        ``notifications`` queue.
+        """
+        position = self._positions[chunk.start, chunk.stop]
+        for index, subchunk in self._split_chunk(position, chunk):
+            self._notifications.put(subchunk)
+
+    def split(self, chunks):
+        """
+        Returns the chunks of the original intervals, in their original order,
+        given the merged ``chunks`` returned by the source.
+        """
+        out = [None] * self._num_ranges
+        for position, chunk in enumerate(chunks):
+            for index, subchunk in self._split_chunk(position, chunk):
+                out[index] = subchunk
+        return out
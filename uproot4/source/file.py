@@ -10,6 +10,9 @@ file readers using many file handles or a memory-mapped file, respectively.
 
 If the filesystem or operating system does not support memory-mapped files, the
 :py:class:`~uproot4.source.file.MultithreadedFileSource` is an automatic fallback.
+
+With the ``zero_copy`` option, :py:class:`~uproot4.source.file.MemmapSource` fills
+its chunks with read-only views of the memory-mapped file, rather than copies.
 """
 
 from __future__ import absolute_import
@@ -91,18 +94,32 @@ class MemmapSource(uproot4.source.chunk.Source):
     """
     Args:
         file_path (str): The filesystem path of the file to open.
-        options: Must include ``"num_fallback_workers"``.
+        options: Must include ``"num_fallback_workers"``; may include
+            ``"zero_copy"``.
 
     A :py:class:`~uproot4.source.chunk.Source` that manages one memory-mapped file.
+
+    If ``zero_copy`` is False (default), each
+    :py:class:`~uproot4.source.chunk.Chunk` is filled with a copy of its byte
+    range. If True, each :py:class:`~uproot4.source.chunk.Chunk` is filled with
+    a read-only view of the memory-mapped file, so that uncompressed data go
+    directly from the operating system's page cache into array interpretations.
+
+    In zero-copy mode, closing this source does not unmap the file while any
+    chunk (or array derived from one) still refers to it; the mapping is
+    released when the last of them is garbage-collected.
     """
 
     _dtype = uproot4.source.chunk.Chunk._dtype
 
     def __init__(self, file_path, **options):
         num_fallback_workers = options["num_fallback_workers"]
+        self._zero_copy = options.get("zero_copy", False)
         self._num_requests = 0
         self._num_requested_chunks = 0
         self._num_requested_bytes = 0
+        self._num_overread_bytes = 0
+        self._coalesce_gap = options.get("coalesce_gap")
 
         self._file_path = file_path
 
@@ -137,7 +154,7 @@ class MemmapSource(uproot4.source.chunk.Source):
             self._num_requested_chunks += 1
             self._num_requested_bytes += stop - start
 
-            data = numpy.array(self._file[start:stop], copy=True)
+            data = self._get(start, stop)
             future = uproot4.source.futures.NoFuture(data)
             return uproot4.source.chunk.Chunk(self, start, stop, future)
 
@@ -149,22 +166,42 @@ class MemmapSource(uproot4.source.chunk.Source):
             if self.closed:
                 raise OSError("memmap is closed for file {0}".format(self._file_path))
 
+            ranges, notifications, coalesced = self._coalesce(ranges, notifications)
+
             self._num_requests += 1
             self._num_requested_chunks += len(ranges)
             self._num_requested_bytes += sum(stop - start for start, stop in ranges)
 
             chunks = []
             for start, stop in ranges:
-                data = numpy.array(self._file[start:stop], copy=True)
+                data = self._get(start, stop)
                 future = uproot4.source.futures.NoFuture(data)
                 chunk = uproot4.source.chunk.Chunk(self, start, stop, future)
                 notifications.put(chunk)
                 chunks.append(chunk)
-            return chunks
+
+            if coalesced is None:
+                return chunks
+            else:
+                return coalesced.split(chunks)
 
         else:
             return self._fallback.chunks(ranges, notifications)
 
+    def _get(self, start, stop):
+        if self._zero_copy:
+            return self._file[start:stop]
+        else:
+            return numpy.array(self._file[start:stop], copy=True)
+
+    @property
+    def zero_copy(self):
+        """
+        If True, chunks are filled with read-only views of the memory-mapped
+        file; if False, they are filled with copies.
+        """
+        return self._zero_copy
+
     @property
     def file(self):
         """
@@ -186,7 +223,9 @@ class MemmapSource(uproot4.source.chunk.Source):
     @property
     def closed(self):
         if self._fallback is None:
-            if uproot4._util.py2:
+            if self._file is None:
+                return True
+            elif uproot4._util.py2:
                 try:
                     self._file._mmap.tell()
                 except ValueError:
@@ -208,7 +247,12 @@ class MemmapSource(uproot4.source.chunk.Source):
 
     def __exit__(self, exception_type, exception_value, traceback):
         if self._fallback is None:
-            if hasattr(self._file._mmap, "__exit__"):
+            if self._zero_copy:
+                # chunks may still be viewing the map: let the last one unmap it
+                if self._file is not None:
+                    self._num_bytes = self._file._mmap.size()
+                self._file = None
+            elif hasattr(self._file._mmap, "__exit__"):
                 self._file._mmap.__exit__(exception_type, exception_value, traceback)
             else:
                 self._file._mmap.close()
@@ -218,6 +262,8 @@ class MemmapSource(uproot4.source.chunk.Source):
     @property
     def num_bytes(self):
         if self._fallback is None:
+            if self._file is None:
+                return self._num_bytes
             return self._file._mmap.size()
         else:
             return self._fallback.num_bytes
@@ -240,6 +286,8 @@ class MultithreadedFileSource(uproot4.source.chunk.MultithreadedSource):
         self._num_requests = 0
         self._num_requested_chunks = 0
         self._num_requested_bytes = 0
+        self._num_overread_bytes = 0
+        self._coalesce_gap = options.get("coalesce_gap")
 
         self._file_path = file_path
         self._executor = uproot4.source.futures.ResourceThreadPoolExecutor(
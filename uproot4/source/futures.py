@@ -17,6 +17,8 @@ Defines a Python-like Future and Executor for Uproot in three levels:
    except that a :py:class:`~uproot4.source.chunk.Resource` is associated with every
    worker. When the threads are shut down, the resources (i.e. file handles)
    are released.
+4. :py:class:`~uproot4.source.futures.ProcessPoolExecutor`: runs tasks in
+   worker processes, passing their arguments and results by pickling.
 
 These classes implement a *subset* of Python's Future and Executor interfaces.
 """
@@ -402,3 +404,76 @@ class ResourceThreadPoolExecutor(ThreadPoolExecutor):
         for worker in self._workers:
             worker.resource.__exit__(exception_type, exception_value, traceback)
         self._closed = True
+
+
+##################### use-case 4: worker processes for compute
+
+
+class ProcessPoolExecutor(object):
+    """
+    Args:
+        num_workers (None or int): The number of worker processes to start. If
+            None, use ``os.cpu_count()``.
+        mp_context (None or ``multiprocessing`` context): The context used to
+            start the worker processes; if None, use the default.
+
+    Wraps Python 3's ``concurrent.futures.ProcessPoolExecutor`` with the subset
+    of the interface Uproot needs. Tasks and their arguments must be pickleable.
+
+    If used as a ``decompression_executor`` for reading ``TBranches``, each
+    ``TBasket`` is decompressed *and* interpreted in a worker process (the
+    ``interpretation_executor`` is not used). Each worker opens the file by its
+    path to get ``TBranch`` metadata; if the file was opened as a file-like
+    object, the ``TBaskets`` are decompressed and interpreted in the calling
+    thread instead. The compressed ``TBasket`` and the interpreted arrays are
+    pickled.
+
+    Requires Python 3.7 or later.
+    """
+
+    def __init__(self, num_workers=None, mp_context=None):
+        if sys.version_info < (3, 7):
+            raise NotImplementedError(
+                "ProcessPoolExecutor requires concurrent.futures with mp_context "
+                "(Python 3.7 or later)"
+            )
+        import concurrent.futures
+
+        if num_workers is None:
+            num_workers = os.cpu_count()
+
+        self._num_workers = num_workers
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            num_workers, mp_context=mp_context
+        )
+
+    def __repr__(self):
+        return "<ProcessPoolExecutor ({0} workers) at 0x{1:012x}>".format(
+            self._num_workers, id(self)
+        )
+
+    @property
+    def num_workers(self):
+        """
+        The number of worker processes.
+        """
+        return self._num_workers
+
+    def submit(self, task, *args):
+        """
+        Runs ``task(*args)`` in a worker process and returns a
+        ``concurrent.futures.Future``.
+        """
+        return self._executor.submit(task, *args)
+
+    def shutdown(self, wait=True):
+        """
+        Stops the worker processes.
+        """
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.shutdown()
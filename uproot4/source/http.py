@@ -12,18 +12,30 @@ does not support multi-part GET, :py:class:`~uproot4.source.http.HTTPSource`
 automatically falls back to :py:class:`~uproot4.source.http.MultithreadedHTTPSource`.
 
 Despite the name, both sources support secure HTTPS (selected by URL scheme).
+
+Both sources borrow keep-alive connections from a
+:py:class:`~uproot4.source.http.ConnectionPool` that is shared by all sources
+reading from the same host, so that a sequence of requests (e.g. the steps of
+an iteration) pays for only one TCP connection and TLS handshake.
 """
 
 from __future__ import absolute_import
 
+import atexit
 import sys
 import re
+import select
+import socket
+import threading
+import time
 
 try:
+    from http.client import BadStatusLine
     from http.client import HTTPConnection
     from http.client import HTTPSConnection
     from urllib.parse import urlparse
 except ImportError:
+    from httplib import BadStatusLine
     from httplib import HTTPConnection
     from httplib import HTTPSConnection
     from urlparse import urlparse
@@ -37,6 +49,14 @@ import uproot4.source.chunk
 import uproot4._util
 
 
+# raised when the server has closed a keep-alive connection (including
+# http.client.RemoteDisconnected, which is both)
+try:
+    _closed_connection_errors = (BadStatusLine, ConnectionError)
+except NameError:
+    _closed_connection_errors = (BadStatusLine, socket.error)
+
+
 def make_connection(parsed_url, timeout):
     """
     Args:
@@ -71,18 +91,301 @@ def make_connection(parsed_url, timeout):
         )
 
 
-def get_num_bytes(file_path, parsed_url, timeout):
+class ConnectionPool(object):
+    """
+    Args:
+        parsed_url (``urllib.parse.ParseResult``): The URL of any file on the
+            host; only its scheme, host, and port are used.
+        timeout (None or float): An optional timeout in seconds.
+        max_size (int): The maximum number of idle connections to keep.
+        idle_timeout (None or float): The number of seconds that an idle
+            connection may be kept before it is closed, or None for no limit.
+
+    A thread-safe pool of keep-alive ``http.client.HTTPConnection`` or
+    ``http.client.HTTPSConnection`` objects to a single host, so that
+    successive requests (from any source or worker thread) do not each pay
+    for a new TCP connection and TLS handshake.
+
+    Connections are taken from the pool with
+    :py:meth:`~uproot4.source.http.ConnectionPool.acquire` (which makes a new
+    one if none are idle) and returned with
+    :py:meth:`~uproot4.source.http.ConnectionPool.release` (which closes it if
+    it can't be reused or the pool is full). Idle connections that have
+    exceeded the ``idle_timeout`` or that the server has closed are discarded
+    when they would be acquired.
+
+    Use :py:func:`~uproot4.source.http.connection_pool` to get the pool shared
+    by all sources that read from the same host.
+    """
+
+    def __init__(self, parsed_url, timeout, max_size, idle_timeout):
+        self._parsed_url = parsed_url
+        self._timeout = timeout
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._idle = []
+        self._lock = threading.Lock()
+        self._num_connections = 0
+        self._num_reused = 0
+
+    def __repr__(self):
+        return "<{0} {1} ({2} idle) at 0x{3:012x}>".format(
+            type(self).__name__,
+            repr(self._parsed_url.scheme + "://" + self._parsed_url.netloc),
+            len(self._idle),
+            id(self),
+        )
+
+    @property
+    def timeout(self):
+        """
+        The timeout in seconds or None.
+        """
+        return self._timeout
+
+    @property
+    def max_size(self):
+        """
+        The maximum number of idle connections to keep.
+        """
+        return self._max_size
+
+    @property
+    def idle_timeout(self):
+        """
+        The number of seconds that an idle connection may be kept, or None.
+        """
+        return self._idle_timeout
+
+    @property
+    def num_idle(self):
+        """
+        The number of idle connections in the pool.
+        """
+        return len(self._idle)
+
+    @property
+    def num_connections(self):
+        """
+        The number of connections that have been made (performance counter).
+        """
+        return self._num_connections
+
+    @property
+    def num_reused(self):
+        """
+        The number of times that an idle connection has been reused
+        (performance counter).
+        """
+        return self._num_reused
+
+    def acquire(self):
+        """
+        Returns a connection that is not in use by any other thread, reusing
+        the most recently released healthy connection if there is one.
+        """
+        return self._acquire(True)[0]
+
+    def _acquire(self, reuse):
+        while reuse:
+            with self._lock:
+                if len(self._idle) == 0:
+                    break
+                connection, released = self._idle.pop()
+
+            if self._is_healthy(connection, released):
+                with self._lock:
+                    self._num_reused += 1
+                return connection, True
+            else:
+                connection.close()
+
+        with self._lock:
+            self._num_connections += 1
+        return make_connection(self._parsed_url, self._timeout), False
+
+    def request(self, method, path, headers=None):
+        """
+        Args:
+            method (str): The HTTP method, such as ``"GET"``.
+            path (str): The path part of the URL.
+            headers (None or dict): Additional headers.
+
+        Sends a request on a connection from this pool and returns a
+        :py:class:`~uproot4.source.http.PooledRequest` to get its response.
+        """
+        return PooledRequest(self, method, path, headers)
+
+    def release(self, connection, response=None):
+        """
+        Args:
+            connection (``http.client.HTTPConnection`` or ``http.client.HTTPSConnection``): The
+                connection to return to the pool.
+            response (None or ``http.client.HTTPResponse``): The last response
+                on this connection, which must have been completely read.
+
+        Returns a connection to the pool, or closes it if the server does not
+        keep it alive or the pool already has ``max_size`` idle connections.
+        """
+        if response is not None and (response.will_close or not response.isclosed()):
+            connection.close()
+            return
+
+        with self._lock:
+            if len(self._idle) < self._max_size:
+                self._idle.append((connection, time.time()))
+                return
+
+        connection.close()
+
+    def _is_healthy(self, connection, released):
+        if (
+            self._idle_timeout is not None
+            and time.time() - released > self._idle_timeout
+        ):
+            return False
+        if connection.sock is None:
+            return True
+        try:
+            readable, _, _ = select.select([connection.sock], [], [], 0)
+        except (OSError, IOError, ValueError, select.error):
+            return False
+        # an idle socket becomes readable only if the server closed it
+        return len(readable) == 0
+
+    def close(self):
+        """
+        Closes all idle connections.
+        """
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection, released in idle:
+            connection.close()
+
+
+class PooledRequest(object):
+    """
+    Args:
+        pool (:py:class:`~uproot4.source.http.ConnectionPool`): The pool from
+            which to take a connection.
+        method (str): The HTTP method, such as ``"GET"``.
+        path (str): The path part of the URL.
+        headers (None or dict): Additional headers.
+
+    A request that has been sent on a connection from a
+    :py:class:`~uproot4.source.http.ConnectionPool`, whose response is read
+    later (possibly in another thread) by
+    :py:meth:`~uproot4.source.http.PooledRequest.getresponse`.
+
+    The server may close an idle keep-alive connection after the pool has
+    checked it, so if sending the request or reading the response on a reused
+    connection fails because it was closed, the request is sent again, once,
+    on a new connection.
+    """
+
+    def __init__(self, pool, method, path, headers=None):
+        self._pool = pool
+        self._method = method
+        self._path = path
+        self._headers = {} if headers is None else headers
+        self._send(*pool._acquire(True))
+
+    def _send(self, connection, reused):
+        self._connection = connection
+        self._reused = reused
+        try:
+            connection.request(self._method, self._path, headers=self._headers)
+        except _closed_connection_errors:
+            connection.close()
+            if not reused:
+                raise
+            self._send(*self._pool._acquire(False))
+
+    @property
+    def pool(self):
+        """
+        The :py:class:`~uproot4.source.http.ConnectionPool` of the connection.
+        """
+        return self._pool
+
+    @property
+    def connection(self):
+        """
+        The connection on which the request was sent (which may be replaced by
+        :py:meth:`~uproot4.source.http.PooledRequest.getresponse`).
+        """
+        return self._connection
+
+    def getresponse(self):
+        """
+        Returns the ``http.client.HTTPResponse``, retrying once on a new
+        connection if the reused connection was closed by the server.
+        """
+        try:
+            return self._connection.getresponse()
+        except _closed_connection_errors:
+            self._connection.close()
+            if not self._reused:
+                raise
+        self._send(*self._pool._acquire(False))
+        return self._connection.getresponse()
+
+
+_connection_pools = {}
+_connection_pools_lock = threading.Lock()
+
+
+@atexit.register
+def _close_connection_pools():
+    with _connection_pools_lock:
+        pools = list(_connection_pools.values())
+        _connection_pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+def connection_pool(parsed_url, timeout, max_size=10, idle_timeout=30):
+    """
+    Args:
+        parsed_url (``urllib.parse.ParseResult``): The URL to connect to, which
+            may be HTTP or HTTPS.
+        timeout (None or float): An optional timeout in seconds.
+        max_size (int): The maximum number of idle connections to keep.
+        idle_timeout (None or float): The number of seconds that an idle
+            connection may be kept, or None for no limit.
+
+    Returns the :py:class:`~uproot4.source.http.ConnectionPool` for this URL's
+    scheme, host, and port (and pool parameters), creating it if necessary.
+    """
+    key = (parsed_url.scheme, parsed_url.netloc, timeout, max_size, idle_timeout)
+    with _connection_pools_lock:
+        pool = _connection_pools.get(key)
+        if pool is None:
+            pool = _connection_pools[key] = ConnectionPool(
+                parsed_url, timeout, max_size, idle_timeout
+            )
+        return pool
+
+
+def get_num_bytes(file_path, parsed_url, timeout, pool=None):
     """
     Args:
         file_path (str): The URL to access as a raw string.
         parsed_url (``urllib.parse.ParseResult``): The URL to access.
         timeout (None or float): An optional timeout in seconds.
+        pool (None or :py:class:`~uproot4.source.http.ConnectionPool`): If not
+            None, the pool from which to take a connection.
 
     Returns the number of bytes in the file by making a HEAD request.
     """
-    connection = make_connection(parsed_url, timeout)
-    connection.request("HEAD", parsed_url.path)
-    response = connection.getresponse()
+    if pool is None:
+        connection = make_connection(parsed_url, timeout)
+        connection.request("HEAD", parsed_url.path)
+        response = connection.getresponse()
+    else:
+        request = pool.request("HEAD", parsed_url.path)
+        response = request.getresponse()
+        connection = request.connection
 
     if response.status == 404:
         connection.close()
@@ -99,7 +402,11 @@ in file {1}""".format(
 
     for k, x in response.getheaders():
         if k.lower() == "content-length" and x.strip() != "0":
-            connection.close()
+            response.read()
+            if pool is None:
+                connection.close()
+            else:
+                pool.release(connection, response)
             return int(x)
     else:
         connection.close()
@@ -119,9 +426,9 @@ class HTTPResource(uproot4.source.chunk.Resource):
 
     A :py:class:`~uproot4.source.chunk.Resource` for HTTP(S) connections.
 
-    For simplicity, this resource does not manage a live
-    ``http.client.HTTPConnection`` or ``http.client.HTTPSConnection``, though
-    in principle, it could.
+    This resource does not manage a live ``http.client.HTTPConnection`` or
+    ``http.client.HTTPSConnection``; connections are borrowed from the
+    source's :py:class:`~uproot4.source.http.ConnectionPool` for each request.
     """
 
     def __init__(self, file_path, timeout):
@@ -149,16 +456,20 @@ class HTTPResource(uproot4.source.chunk.Resource):
     def __exit__(self, exception_type, exception_value, traceback):
         pass
 
-    def get(self, connection, start, stop):
+    def get(self, request, start, stop):
         """
         Args:
+            request (:py:class:`~uproot4.source.http.PooledRequest`): The
+                request that has been sent; its connection is returned to the
+                pool after the response has been read.
             start (int): Seek position of the first byte to include.
             stop (int): Seek position of the first byte to exclude
                 (one greater than the last byte to include).
 
         Returns a Python buffer of data between ``start`` and ``stop``.
         """
-        response = connection.getresponse()
+        response = request.getresponse()
+        connection = request.connection
 
         if response.status == 404:
             connection.close()
@@ -173,9 +484,12 @@ for URL {0}""".format(
                 )
             )
         try:
-            return response.read()
-        finally:
+            out = response.read()
+        except Exception:
             connection.close()
+            raise
+        request.pool.release(connection, response)
+        return out
 
     @staticmethod
     def future(source, start, stop):
@@ -190,15 +504,14 @@ for URL {0}""".format(
         Returns a :py:class:`~uproot4.source.futures.ResourceFuture` that calls
         :py:meth:`~uproot4.source.file.HTTPResource.get` with ``start`` and ``stop``.
         """
-        connection = make_connection(source.parsed_url, source.timeout)
-        connection.request(
+        request = source.connection_pool.request(
             "GET",
             source.parsed_url.path,
             headers={"Range": "bytes={0}-{1}".format(start, stop - 1)},
         )
 
         def task(resource):
-            return resource.get(connection, start, stop)
+            return resource.get(request, start, stop)
 
         return uproot4.source.futures.ResourceFuture(task)
 
@@ -226,27 +539,29 @@ for URL {0}""".format(
         ``results`` and ``futures``. Subsequent attempts would immediately
         use the :py:attr:`~uproot4.source.chunk.HTTPSource.fallback`.
         """
-        connection = make_connection(source.parsed_url, source.timeout)
-
         range_strings = []
         for start, stop in ranges:
             range_strings.append("{0}-{1}".format(start, stop - 1))
 
-        connection.request(
+        request = source.connection_pool.request(
             "GET",
             source.parsed_url.path,
             headers={"Range": "bytes=" + ", ".join(range_strings)},
         )
 
         def task(resource):
+            reusable = False
             try:
-                response = connection.getresponse()
+                response = request.getresponse()
                 multipart_supported = resource.is_multipart_supported(ranges, response)
 
                 if not multipart_supported:
                     resource.handle_no_multipart(source, ranges, futures, results)
                 else:
                     resource.handle_multipart(source, futures, results, response)
+                    # the closing boundary is all that remains of the response
+                    response.read()
+                    reusable = True
 
             except Exception:
                 excinfo = sys.exc_info()
@@ -254,7 +569,10 @@ for URL {0}""".format(
                     future._set_excinfo(excinfo)
 
             finally:
-                connection.close()
+                if reusable:
+                    request.pool.release(request.connection, response)
+                else:
+                    request.connection.close()
 
         return uproot4.source.futures.ResourceFuture(task)
 
@@ -382,7 +700,8 @@ class HTTPSource(uproot4.source.chunk.Source):
     """
     Args:
         file_path (str): A URL of the file to open.
-        options: Must include ``"num_fallback_workers"`` and ``"timeout"``.
+        options: Must include ``"num_fallback_workers"`` and ``"timeout"``;
+            may include ``"http_pool_size"`` and ``"http_idle_timeout"``.
 
     A :py:class:`~uproot4.source.chunk.Source` that first attempts an HTTP(S)
     multipart GET, but if the server doesn't support it, it falls back to many
@@ -403,6 +722,8 @@ class HTTPSource(uproot4.source.chunk.Source):
         self._num_requests = 0
         self._num_requested_chunks = 0
         self._num_requested_bytes = 0
+        self._num_overread_bytes = 0
+        self._coalesce_gap = options.get("coalesce_gap")
 
         self._file_path = file_path
         self._timeout = timeout
@@ -411,6 +732,12 @@ class HTTPSource(uproot4.source.chunk.Source):
         self._executor = uproot4.source.futures.ResourceThreadPoolExecutor(
             [HTTPResource(file_path, timeout)]
         )
+        self._connection_pool = connection_pool(
+            self.parsed_url,
+            timeout,
+            options.get("http_pool_size", 10),
+            options.get("http_idle_timeout", 30),
+        )
         self._fallback = None
         self._fallback_options = dict(options)
         self._fallback_options["num_workers"] = num_fallback_workers
@@ -438,6 +765,8 @@ class HTTPSource(uproot4.source.chunk.Source):
 
     def chunks(self, ranges, notifications):
         if self._fallback is None:
+            ranges, notifications, coalesced = self._coalesce(ranges, notifications)
+
             self._num_requests += 1
             self._num_requested_chunks += len(ranges)
             self._num_requested_bytes += sum(stop - start for start, stop in ranges)
@@ -458,7 +787,11 @@ class HTTPSource(uproot4.source.chunk.Source):
             self._executor.submit(
                 self.ResourceClass.multifuture(self, ranges, futures, results)
             )
-            return chunks
+
+            if coalesced is None:
+                return chunks
+            else:
+                return coalesced.split(chunks)
 
         else:
             return self._fallback.chunks(ranges, notifications)
@@ -492,7 +825,7 @@ class HTTPSource(uproot4.source.chunk.Source):
     def num_bytes(self):
         if self._num_bytes is None:
             self._num_bytes = get_num_bytes(
-                self._file_path, self.parsed_url, self._timeout
+                self._file_path, self.parsed_url, self._timeout, self._connection_pool
             )
         return self._num_bytes
 
@@ -503,6 +836,17 @@ class HTTPSource(uproot4.source.chunk.Source):
         """
         return self._executor.workers[0].resource.parsed_url
 
+    @property
+    def connection_pool(self):
+        """
+        The :py:class:`~uproot4.source.http.ConnectionPool` of keep-alive
+        connections to this source's host, which is shared with all other
+        sources with the same host and pool parameters.
+
+        Closing the source does not close the pool.
+        """
+        return self._connection_pool
+
     @property
     def fallback(self):
         """
@@ -525,7 +869,8 @@ class MultithreadedHTTPSource(uproot4.source.chunk.MultithreadedSource):
     """
     Args:
         file_path (str): A URL of the file to open.
-        options: Must include ``"num_workers"`` and ``"timeout"``.
+        options: Must include ``"num_workers"`` and ``"timeout"``; may include
+            ``"http_pool_size"`` and ``"http_idle_timeout"``.
 
     A :py:class:`~uproot4.source.chunk.MultithreadedSource` that manages many
     :py:class:`~uproot4.source.http.HTTPResource` objects.
@@ -539,6 +884,8 @@ class MultithreadedHTTPSource(uproot4.source.chunk.MultithreadedSource):
         self._num_requests = 0
         self._num_requested_chunks = 0
         self._num_requested_bytes = 0
+        self._num_overread_bytes = 0
+        self._coalesce_gap = options.get("coalesce_gap")
 
         self._file_path = file_path
         self._num_bytes = None
@@ -547,6 +894,12 @@ class MultithreadedHTTPSource(uproot4.source.chunk.MultithreadedSource):
         self._executor = uproot4.source.futures.ResourceThreadPoolExecutor(
             [HTTPResource(file_path, timeout) for x in uproot4._util.range(num_workers)]
         )
+        self._connection_pool = connection_pool(
+            self.parsed_url,
+            timeout,
+            options.get("http_pool_size", 10),
+            options.get("http_idle_timeout", 30),
+        )
 
     @property
     def timeout(self):
@@ -559,7 +912,7 @@ class MultithreadedHTTPSource(uproot4.source.chunk.MultithreadedSource):
     def num_bytes(self):
         if self._num_bytes is None:
             self._num_bytes = get_num_bytes(
-                self._file_path, self.parsed_url, self._timeout
+                self._file_path, self.parsed_url, self._timeout, self._connection_pool
             )
         return self._num_bytes
 
@@ -569,3 +922,14 @@ class MultithreadedHTTPSource(uproot4.source.chunk.MultithreadedSource):
         A ``urllib.parse.ParseResult`` version of the ``file_path``.
         """
         return self._executor.workers[0].resource.parsed_url
+
+    @property
+    def connection_pool(self):
+        """
+        The :py:class:`~uproot4.source.http.ConnectionPool` of keep-alive
+        connections to this source's host, which is shared with all other
+        sources with the same host and pool parameters.
+
+        Closing the source does not close the pool.
+        """
+        return self._connection_pool
@@ -111,6 +111,8 @@ class ObjectSource(uproot4.source.chunk.MultithreadedSource):
         self._num_requests = 0
         self._num_requested_chunks = 0
         self._num_requested_bytes = 0
+        self._num_overread_bytes = 0
+        self._coalesce_gap = options.get("coalesce_gap")
 
         self._file_path = repr(obj)
         self._executor = uproot4.source.futures.ResourceThreadPoolExecutor(
@@ -224,6 +224,8 @@ class XRootDSource(uproot4.source.chunk.Source):
         self._num_requests = 0
         self._num_requested_chunks = 0
         self._num_requested_bytes = 0
+        self._num_overread_bytes = 0
+        self._coalesce_gap = options.get("coalesce_gap")
 
         self._file_path = file_path
         self._timeout = timeout
@@ -253,6 +255,10 @@ class XRootDSource(uproot4.source.chunk.Source):
         return uproot4.source.chunk.Chunk(self, start, stop, future)
 
     def chunks(self, ranges, notifications):
+        ranges, notifications, coalesced = self._coalesce(
+            ranges, notifications, self._max_element_size
+        )
+
         self._num_requests += 1
         self._num_requested_chunks += len(ranges)
         self._num_requested_bytes += sum(stop - start for start, stop in ranges)
@@ -289,7 +295,10 @@ class XRootDSource(uproot4.source.chunk.Source):
             if status.error:
                 self._resource._xrd_error(status)
 
-        return chunks
+        if coalesced is None:
+            return chunks
+        else:
+            return coalesced.split(chunks)
 
     @property
     def resource(self):
@@ -347,6 +356,8 @@ class MultithreadedXRootDSource(uproot4.source.chunk.MultithreadedSource):
         self._num_requests = 0
         self._num_requested_chunks = 0
         self._num_requested_bytes = 0
+        self._num_overread_bytes = 0
+        self._coalesce_gap = options.get("coalesce_gap")
 
         self._file_path = file_path
         self._num_bytes = None
@@ -0,0 +1,442 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot4/blob/master/LICENSE
+
+"""
+Per-``TBasket`` statistics (minimum, maximum, and number of entries) of
+numerical ``TBranches``, which let
+:py:meth:`~uproot4.behaviors.TBranch.HasBranches.arrays` and
+:py:meth:`~uproot4.behaviors.TBranch.HasBranches.iterate` skip ranges of
+entries in which a simple ``cut`` cannot pass, before reading any ``TBaskets``.
+(Columnar databases call this a "zone map.")
+
+The statistics are computed by
+:py:meth:`~uproot4.behaviors.TBranch.HasBranches.compute_statistics` and stored
+in the ``statistics_dir`` option's directory as a JSON file named by the file's
+UUID, with an entry for each ``TBranch``
+:py:attr:`~uproot4.behaviors.TBranch.TBranch.cache_key`. If ``statistics_dir``
+is None (the default), no statistics are used.
+
+Only comparisons of ``TBranches`` (or aliases of them) with constants, combined
+with ``&``, ``|``, ``and``, and ``or``, are used to skip entries; any other part
+of a ``cut`` is assumed to pass everywhere. Only ``TBranches`` with one number
+per entry can be summarized.
+"""
+
+from __future__ import absolute_import
+
+import ast
+import json
+import os
+import tempfile
+
+import numpy
+
+import uproot4.interpretation.numerical
+import uproot4.interpretation.objects
+import uproot4.language.python
+import uproot4._util
+
+
+def can_summarize(interpretation):
+    """
+    Returns True if ``interpretation`` produces one number per entry, so that
+    statistics of its ``TBaskets`` can be used to skip entries.
+    """
+    return (
+        isinstance(interpretation, uproot4.interpretation.numerical.AsDtype)
+        and not isinstance(
+            interpretation, uproot4.interpretation.objects.AsStridedObjects
+        )
+        and interpretation.to_dtype.names is None
+        and interpretation.to_dtype.shape == ()
+        and interpretation.to_dtype.kind in "biuf"
+    )
+
+
+class BasketStatistics(object):
+    """
+    Args:
+        hex_uuid (str): UUID of the file, as a hexadecimal string.
+        branches (None or dict): Mapping from ``TBranch``
+            :py:attr:`~uproot4.behaviors.TBranch.TBranch.cache_key` to a dict
+            of ``"entry_offsets"``, ``"min"``, ``"max"``, and ``"count"``,
+            each a list with one item per ``TBasket`` (``"entry_offsets"`` has
+            one more). ``"min"`` and ``"max"`` are None for ``TBaskets`` with
+            no entries or only NaN.
+
+    Minimum, maximum, and number of entries in each ``TBasket`` of some
+    ``TBranches`` in one file.
+    """
+
+    def __init__(self, hex_uuid, branches=None):
+        self._hex_uuid = hex_uuid
+        if branches is None:
+            branches = {}
+        self._branches = branches
+
+    def __repr__(self):
+        return "<BasketStatistics {0} for {1} TBranches at 0x{2:012x}>".format(
+            self._hex_uuid, len(self._branches), id(self)
+        )
+
+    @property
+    def hex_uuid(self):
+        """
+        UUID of the file, as a hexadecimal string.
+        """
+        return self._hex_uuid
+
+    @property
+    def branches(self):
+        """
+        Mapping from ``TBranch``
+        :py:attr:`~uproot4.behaviors.TBranch.TBranch.cache_key` to its
+        statistics.
+        """
+        return self._branches
+
+    @staticmethod
+    def path(directory, hex_uuid):
+        """
+        Path of the JSON file for a given file UUID in ``directory``.
+        """
+        return os.path.join(directory, hex_uuid + ".json")
+
+    @classmethod
+    def load(cls, directory, hex_uuid):
+        """
+        Reads the statistics for a given file UUID from ``directory``, or
+        returns None if there are none.
+        """
+        try:
+            with open(cls.path(directory, hex_uuid)) as file:
+                branches = json.load(file)
+        except (IOError, OSError):
+            return None
+        return cls(hex_uuid, branches)
+
+    def save(self, directory):
+        """
+        Writes the statistics into ``directory``, which is created if it does
+        not exist. The file is written to a temporary name and renamed into
+        place, so that other processes never see a partial file.
+        """
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                if not os.path.isdir(directory):
+                    raise
+
+        path = self.path(directory, self._hex_uuid)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as file:
+                json.dump(self._branches, file)
+            if uproot4._util.py2:
+                if os.name == "nt" and os.path.exists(path):
+                    os.remove(path)
+                os.rename(tmp, path)
+            else:
+                os.replace(tmp, path)
+        except (OSError, IOError):
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def update(self, branch):
+        """
+        Reads every ``TBasket`` of ``branch`` and replaces its statistics.
+        """
+        if not can_summarize(branch.interpretation):
+            raise TypeError(
+                """statistics can only be computed for numerical TBranches with one """
+                """number per entry, not {0} with interpretation {1}
+in file {2}""".format(
+                    repr(branch.object_path),
+                    repr(branch.interpretation),
+                    branch.file.file_path,
+                )
+            )
+
+        mins, maxes, counts = [], [], []
+        for basket_num in uproot4._util.range(branch.num_baskets):
+            array = branch.basket(basket_num).array(library="np")
+            if array.dtype.kind == "f":
+                array = array[~numpy.isnan(array)]
+            counts.append(len(array))
+            if len(array) == 0:
+                mins.append(None)
+                maxes.append(None)
+            else:
+                mins.append(array.min().item())
+                maxes.append(array.max().item())
+
+        self._branches[branch.cache_key] = {
+            "entry_offsets": [int(x) for x in branch.entry_offsets],
+            "min": mins,
+            "max": maxes,
+            "count": counts,
+        }
+
+    def entry_ranges(self, hasbranches, cut, aliases, entry_start, entry_stop):
+        """
+        Args:
+            hasbranches (:py:class:`~uproot4.behaviors.TBranch.HasBranches`): The
+                ``TTree`` or ``TBranch`` in which to find names in the ``cut``.
+            cut (str): The cut expression.
+            aliases (dict of str → str): Aliases that may be used in the
+                ``cut``.
+            entry_start (int): First entry to consider.
+            entry_stop (int): First entry to not consider.
+
+        Returns a list of (start, stop) ranges of entries that may pass the
+        ``cut``, or None if the statistics can't rule out any entries.
+        """
+        node = uproot4.language.python._expression_to_node(
+            cut, hasbranches.file.file_path, hasbranches.object_path
+        ).body[0].value
+
+        branches = {}
+        _collect_branches(node, hasbranches, aliases, self._branches, branches, ())
+        if len(branches) == 0:
+            return None
+
+        boundaries = set([entry_start, entry_stop])
+        for branch in branches.values():
+            for x in self._branches[branch.cache_key]["entry_offsets"]:
+                if entry_start < x < entry_stop:
+                    boundaries.add(x)
+        boundaries = numpy.array(sorted(boundaries), numpy.int64)
+
+        may_pass = _may_pass(
+            node, hasbranches, aliases, self._branches, branches, boundaries[:-1], ()
+        )
+        if may_pass is None or numpy.all(may_pass):
+            return None
+
+        out = []
+        for index in numpy.nonzero(may_pass)[0]:
+            start, stop = int(boundaries[index]), int(boundaries[index + 1])
+            if len(out) != 0 and out[-1][1] == start:
+                out[-1] = (out[-1][0], stop)
+            else:
+                out.append((start, stop))
+        return out
+
+
+def _name(node):
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id == "get"
+        and len(node.args) == 1
+        and isinstance(node.args[0], ast.Str)
+    ):
+        return node.args[0].s
+    return uproot4.language.python._attribute_to_dotted_name(node)
+
+
+def _constant(node):
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        value = _constant(node.operand)
+        if value is None or isinstance(node.op, ast.UAdd):
+            return value
+        return -value
+    if isinstance(node, ast.Num):
+        value = node.n
+    elif isinstance(node, getattr(ast, "Constant", ())):
+        value = node.value
+    else:
+        return None
+    if isinstance(value, (bool, numpy.bool_)):
+        return int(value)
+    if uproot4._util.isint(value) or isinstance(value, float):
+        return value
+    return None
+
+
+def _alias_node(name, aliases, symbol_path):
+    if name in aliases and name not in symbol_path:
+        return ast.parse(aliases[name]).body[0].value
+    return None
+
+
+def _statistics_branch(name, hasbranches, statistics):
+    branch = hasbranches.get(name)
+    if branch is None or not can_summarize(branch.interpretation):
+        return None
+    stats = statistics.get(branch.cache_key)
+    if stats is None or stats["entry_offsets"] != [
+        int(x) for x in branch.entry_offsets
+    ]:
+        return None
+    return branch
+
+
+def _comparisons(node):
+    if isinstance(node, ast.Compare):
+        left = node.left
+        for op, right in zip(node.ops, node.comparators):
+            yield left, op, right
+            left = right
+
+
+def _collect_branches(node, hasbranches, aliases, statistics, branches, symbol_path):
+    if isinstance(node, (ast.BoolOp, ast.BinOp)):
+        if isinstance(node, ast.BoolOp):
+            children = node.values
+        else:
+            children = [node.left, node.right]
+        for child in children:
+            _collect_branches(
+                child, hasbranches, aliases, statistics, branches, symbol_path
+            )
+
+    for left, op, right in _comparisons(node):
+        for side in (left, right):
+            name = _name(side)
+            if name is None:
+                continue
+            alias = _alias_node(name, aliases, symbol_path)
+            if alias is not None:
+                _collect_branches(
+                    ast.Compare(left=alias, ops=[op], comparators=[right])
+                    if side is left
+                    else ast.Compare(left=left, ops=[op], comparators=[alias]),
+                    hasbranches,
+                    aliases,
+                    statistics,
+                    branches,
+                    symbol_path + (name,),
+                )
+            else:
+                branch = _statistics_branch(name, hasbranches, statistics)
+                if branch is not None:
+                    branches[name] = branch
+
+    name = _name(node)
+    if name is not None:
+        alias = _alias_node(name, aliases, symbol_path)
+        if alias is not None:
+            _collect_branches(
+                alias, hasbranches, aliases, statistics, branches, symbol_path + (name,)
+            )
+
+
+_flipped = {
+    ast.Lt: ast.Gt,
+    ast.LtE: ast.GtE,
+    ast.Gt: ast.Lt,
+    ast.GtE: ast.LtE,
+    ast.Eq: ast.Eq,
+}
+
+
+def _compare(branch, op, value, statistics, zone_starts):
+    stats = statistics[branch.cache_key]
+    basket_nums = (
+        numpy.searchsorted(stats["entry_offsets"], zone_starts, side="right") - 1
+    )
+    out = numpy.zeros(len(zone_starts), numpy.bool_)
+    for i, basket_num in enumerate(basket_nums.tolist()):
+        low, high = stats["min"][basket_num], stats["max"][basket_num]
+        if low is None:
+            continue
+        if isinstance(op, ast.Lt):
+            out[i] = low < value
+        elif isinstance(op, ast.LtE):
+            out[i] = low <= value
+        elif isinstance(op, ast.Gt):
+            out[i] = high > value
+        elif isinstance(op, ast.GtE):
+            out[i] = high >= value
+        else:
+            out[i] = low <= value <= high
+    return out
+
+
+def _may_pass(
+    node, hasbranches, aliases, statistics, branches, zone_starts, symbol_path
+):
+    """
+    Returns an array of booleans, one per zone, which is False where the
+    expression can't be nonzero, or None if it can be nonzero everywhere.
+    """
+    if isinstance(node, ast.BoolOp) or (
+        isinstance(node, ast.BinOp) and isinstance(node.op, (ast.BitAnd, ast.BitOr))
+    ):
+        if isinstance(node, ast.BoolOp):
+            children = node.values
+            is_and = isinstance(node.op, ast.And)
+        else:
+            children = [node.left, node.right]
+            is_and = isinstance(node.op, ast.BitAnd)
+
+        out = None
+        for child in children:
+            result = _may_pass(
+                child,
+                hasbranches,
+                aliases,
+                statistics,
+                branches,
+                zone_starts,
+                symbol_path,
+            )
+            if is_and:
+                if result is not None:
+                    out = result if out is None else out & result
+            else:
+                if result is None:
+                    return None
+                out = result if out is None else out | result
+        return out
+
+    if isinstance(node, ast.Compare):
+        out = None
+        for left, op, right in _comparisons(node):
+            result = None
+            for side, other, this_op in (
+                (left, right, op),
+                (right, left, _flipped.get(type(op), type(None))()),
+            ):
+                name, value = _name(side), _constant(other)
+                if name is None or value is None or type(this_op) not in _flipped:
+                    continue
+                alias = _alias_node(name, aliases, symbol_path)
+                if alias is not None:
+                    result = _may_pass(
+                        ast.Compare(
+                            left=alias, ops=[this_op], comparators=[other]
+                        ),
+                        hasbranches,
+                        aliases,
+                        statistics,
+                        branches,
+                        zone_starts,
+                        symbol_path + (name,),
+                    )
+                elif name in branches:
+                    result = _compare(
+                        branches[name], this_op, value, statistics, zone_starts
+                    )
+                break
+            if result is not None:
+                out = result if out is None else out & result
+        return out
+
+    name = _name(node)
+    if name is not None:
+        alias = _alias_node(name, aliases, symbol_path)
+        if alias is not None:
+            return _may_pass(
+                alias,
+                hasbranches,
+                aliases,
+                statistics,
+                branches,
+                zone_starts,
+                symbol_path + (name,),
+            )
+
+    return None
@@ -337,12 +337,25 @@ class Model_TStreamerInfo(uproot4.model.Model):
 
         Returns a new subclass of :py:class:`~uproot4.model.VersionedModel` for this
         class and version.
+
+        If the ``file`` has a
+        :py:attr:`~uproot4.reading.ReadOnlyFile.class_cache`, the code and
+        bytecode are taken from it (or added to it).
         """
-        class_code = self.class_code()
+        class_cache = file.class_cache
+        entry = None if class_cache is None else class_cache.load(self)
+        if entry is None:
+            class_code = self.class_code()
+            code = uproot4.deserialization.compile_code(class_code)
+            if class_cache is not None:
+                class_cache.save(self, class_code, code)
+        else:
+            class_code, code = entry
+
         class_name = uproot4.model.classname_encode(self.name, self.class_version)
         classes = uproot4.model.maybe_custom_classes(file.custom_classes)
         return uproot4.deserialization.compile_class(
-            file, classes, class_code, class_name
+            file, classes, class_code, class_name, code
         )
 
     @property